@@ -12,6 +12,7 @@ from .config import get_config
 from .config.database import close_db
 from .routes import api_bp, jobs_bp, pages_bp, sessions_bp
 from .security.csrf import get_csrf_token_from_session, get_or_create_csrf_token
+from .services.executor_adapter import shutdown_executors
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +106,7 @@ def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
     logger.info("Received signal %d, initiating shutdown...", signum)
     _shutdown_event.set()
+    shutdown_executors()
     logger.info(
         "Waiting for running jobs to complete (timeout: %ds)...",
         30,
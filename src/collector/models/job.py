@@ -32,6 +32,11 @@ class Job(BaseModel):
             "unique": False,
             "name": "idx_jobs_status_created",
         },
+        {
+            "columns": ["platform", "status", ("created_at", "DESC")],
+            "unique": False,
+            "name": "idx_jobs_platform_status_created",
+        },
     ]
 
     def __init__(self, **kwargs: Any) -> None:
@@ -85,7 +90,7 @@ class Job(BaseModel):
         Returns:
             Tuple of (SQL statement, parameters).
         """
-        data = self.to_dict(exclude=["id"])
+        data = self.to_dict()
         columns = ", ".join(data.keys())
         placeholders = ", ".join(["?" for _ in data])
         values = tuple(data.values())
@@ -25,8 +25,15 @@ class Settings(BaseModel):
     # Primary key field name (different from base model)
     primary_key = "key"
 
-    # No indexes needed for settings table (primary key is sufficient)
-    indexes: ClassVar[list[dict[str, Any]]] = []
+    # The primary key covers exact and case-sensitive prefix lookups; the NOCASE
+    # index lets case-insensitive prefix lookups seek instead of scanning
+    indexes: ClassVar[list[dict[str, Any]]] = [
+        {
+            "columns": [("key", "COLLATE NOCASE")],
+            "unique": False,
+            "name": "idx_settings_key_nocase",
+        },
+    ]
 
     def __init__(self, **kwargs: Any) -> None:
         """Initialize the Settings model with provided attributes.
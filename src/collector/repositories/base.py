@@ -7,12 +7,23 @@ and database connection handling.
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Generic, TypeVar
 
 from ..config.database import DatabaseConfig, get_db_config
 from ..models.base import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# Worker threads shared by BaseRepository.parallel(). SQLite allows concurrent
+# readers, so independent SELECTs on separate connections can overlap their I/O.
+PARALLEL_QUERY_WORKERS = 4
+
+_query_executor = ThreadPoolExecutor(
+    max_workers=PARALLEL_QUERY_WORKERS, thread_name_prefix="collector-query"
+)
 
 
 class BaseRepository(Generic[T]):
@@ -248,3 +259,23 @@ class BaseRepository(Generic[T]):
         """
         db_config = self._get_db_config()
         return db_config.execute_update(query, params)
+
+    def parallel(self, queries: Sequence[Callable[[DatabaseConfig], R]]) -> list[R]:
+        """Run independent read queries concurrently.
+
+        Each callable receives the resolved database configuration and runs on a
+        worker thread with its own connection, so it must not touch Flask globals.
+
+        Args:
+            queries: Callables that each run one query and return its result.
+
+        Returns:
+            Query results in the same order as ``queries``.
+        """
+        db_config = self._get_db_config()
+
+        if len(queries) < 2:
+            return [query(db_config) for query in queries]
+
+        futures = [_query_executor.submit(query, db_config) for query in queries]
+        return [future.result() for future in futures]
@@ -6,6 +6,7 @@ This module provides the FileRepository class for all file-related database oper
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from ..models.file import File
@@ -117,6 +118,32 @@ class FileRepository(BaseRepository[File]):
         results = self.execute_custom_query(sql, (job_id,))
         return [File.from_dict(result) for result in results]
 
+    def get_files_for_jobs(self, job_ids: list[str]) -> dict[str, list[File]]:
+        """Get files for several jobs with a single query.
+
+        Args:
+            job_ids: The IDs of the jobs.
+
+        Returns:
+            Dictionary mapping each job ID to its files, oldest first.
+        """
+        files_by_job: dict[str, list[File]] = defaultdict(list)
+        if not job_ids:
+            return files_by_job
+
+        placeholders = ", ".join(["?"] * len(job_ids))
+        sql = f"""
+        SELECT * FROM files
+        WHERE job_id IN ({placeholders})
+        ORDER BY created_at ASC
+        """
+
+        for result in self.execute_custom_query(sql, tuple(job_ids)):
+            file = File.from_dict(result)
+            files_by_job[file.job_id].append(file)
+
+        return files_by_job
+
     def get_files_by_type(self, file_type: str) -> list[File]:
         """Get files by their type.
 
@@ -270,7 +297,24 @@ class FileRepository(BaseRepository[File]):
         GROUP BY file_type
         """
 
-        type_results = self.execute_custom_query(type_sql)
+        count_sql = "SELECT COUNT(*) as count FROM files"
+
+        # Files with metadata
+        metadata_sql = """
+        SELECT COUNT(*) as count
+        FROM files
+        WHERE metadata_json IS NOT NULL AND metadata_json != ''
+        """
+
+        # The three aggregates are independent, so run them concurrently
+        type_results, count_result, metadata_result = self.parallel(
+            [
+                lambda db: db.execute_query(type_sql),
+                lambda db: db.execute_query(count_sql),
+                lambda db: db.execute_query(metadata_sql),
+            ]
+        )
+
         stats["by_type"] = {}
         total_size = 0
 
@@ -283,17 +327,9 @@ class FileRepository(BaseRepository[File]):
             total_size += result["total_size"] or 0
 
         # Total files and size
-        stats["total_files"] = self.count()
+        stats["total_files"] = count_result[0]["count"] if count_result else 0
         stats["total_size"] = total_size
 
-        # Files with metadata
-        metadata_sql = """
-        SELECT COUNT(*) as count
-        FROM files
-        WHERE metadata_json IS NOT NULL AND metadata_json != ''
-        """
-
-        metadata_result = self.execute_custom_query(metadata_sql)
         stats["files_with_metadata"] = metadata_result[0]["count"] if metadata_result else 0
 
         return stats
@@ -6,11 +6,29 @@ This module provides the JobRepository class for all job-related database operat
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Any
 
 from ..models.job import Job
 from .base import BaseRepository
 
+# Statuses of jobs that have not reached a terminal state
+ACTIVE_JOB_STATUSES = ("pending", "running", "cancelling")
+
+# Columns that may be changed through update_job and update_fields
+UPDATABLE_JOB_FIELDS = frozenset(
+    {
+        "status",
+        "title",
+        "progress",
+        "current_operation",
+        "error_message",
+        "retry_count",
+        "bytes_downloaded",
+        "completed_at",
+    }
+)
+
 
 class JobRepository(BaseRepository[Job]):
     """Repository for job-related database operations.
@@ -47,37 +65,42 @@ class JobRepository(BaseRepository[Job]):
         Returns:
             True if updated successfully, False if job not found or no valid fields
         """
-        # Define allowed fields for updates (prevents accidental updates of sensitive fields)
-        allowed_fields = {
-            "status",
-            "title",
-            "progress",
-            "current_operation",
-            "error_message",
-            "retry_count",
-            "bytes_downloaded",
-            "completed_at",
-        }
-
-        # Filter to only allowed fields
-        safe_fields = {k: v for k, v in fields.items() if k in allowed_fields}
+        # Filter to only allowed fields (prevents accidental updates of sensitive fields)
+        safe_fields = {k: v for k, v in fields.items() if k in UPDATABLE_JOB_FIELDS}
         if not safe_fields:
             return False
 
-        job = self.get_by_id(job_id)
-        if not job:
-            return False
+        return self.update_fields(job_id, safe_fields)
 
-        # Update job fields
-        for field, value in safe_fields.items():
-            setattr(job, field, value)
+    def update_fields(self, job_id: str, fields: dict[str, Any]) -> bool:
+        """Update job columns in place with a single UPDATE statement.
 
-        # Update timestamp
-        job.update_timestamp()
+        The job is not loaded first; whether it exists is taken from the
+        number of rows changed. ``updated_at`` is always refreshed.
 
-        # Save to repository
-        self.update(job)
-        return True
+        Args:
+            job_id: Job ID to update
+            fields: Column values to set, keyed by column name
+
+        Returns:
+            True if the job was updated, False if it does not exist
+
+        Raises:
+            ValueError: If a field is not an updatable job column
+        """
+        unknown = fields.keys() - UPDATABLE_JOB_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update job fields: {sorted(unknown)}")
+
+        values = [v.isoformat() if isinstance(v, datetime) else v for v in fields.values()]
+        set_clause = ", ".join(f"{key} = ?" for key in fields)
+        sql = f"""
+        UPDATE jobs
+        SET {set_clause}, updated_at = ?
+        WHERE id = ?
+        """
+        params = (*values, datetime.now(timezone.utc).isoformat(), job_id)
+        return self.execute_custom_update(sql, params) > 0
 
     def get_active_jobs(self) -> list[Job]:
         """Get all active jobs (pending, running, or cancelling).
@@ -85,7 +108,76 @@ class JobRepository(BaseRepository[Job]):
         Returns:
             List of active job instances.
         """
-        return self.find_by(status__in=["pending", "running", "cancelling"])
+        return self.find_by(status__in=list(ACTIVE_JOB_STATUSES))
+
+    def mark_stale_as_failed(
+        self,
+        cutoff: datetime,
+        error_message: str,
+        pending_cutoff: datetime | None = None,
+    ) -> int:
+        """Fail every active job that has not been updated since ``cutoff``.
+
+        All stale jobs are updated with one statement. Timestamps are compared
+        through ``datetime()`` so ISO values with offsets and SQLite's default
+        format compare correctly.
+
+        Pending jobs are not touched while they wait in the executor queue, so
+        they can additionally be limited to those updated before
+        ``pending_cutoff``.
+
+        Args:
+            cutoff: Jobs last updated before this time are considered stale.
+            error_message: Error message recorded on each failed job.
+            pending_cutoff: Optional earlier bound for pending jobs.
+
+        Returns:
+            Number of jobs marked as failed.
+        """
+        if pending_cutoff is None or pending_cutoff > cutoff:
+            pending_cutoff = cutoff
+
+        now = datetime.now(timezone.utc).isoformat()
+        started = [s for s in ACTIVE_JOB_STATUSES if s != "pending"]
+        placeholders = ", ".join("?" * len(started))
+        sql = f"""
+        UPDATE jobs
+        SET status = 'failed', error_message = ?, completed_at = ?, updated_at = ?
+        WHERE datetime(updated_at) < datetime(?)
+        AND (
+            status IN ({placeholders})
+            OR (status = 'pending' AND datetime(updated_at) < datetime(?))
+        )
+        """
+        params = (
+            error_message,
+            now,
+            now,
+            cutoff.isoformat(),
+            *started,
+            pending_cutoff.isoformat(),
+        )
+        return self.execute_custom_update(sql, params)
+
+    def start_job(self, job_id: str) -> bool:
+        """Move a pending job to running.
+
+        The status is checked in the same statement, so a job that was
+        cancelled or failed while queued is not started.
+
+        Args:
+            job_id: The ID of the job to start.
+
+        Returns:
+            True if the job was pending and is now running, False otherwise.
+        """
+        sql = """
+        UPDATE jobs
+        SET status = 'running', updated_at = ?
+        WHERE id = ? AND status = 'pending'
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        return self.execute_custom_update(sql, (now, job_id)) > 0
 
     def get_jobs_by_status(self, status: str) -> list[Job]:
         """Get jobs by their status.
@@ -127,32 +219,100 @@ class JobRepository(BaseRepository[Job]):
         results = self.execute_custom_query(sql, (limit,))
         return [Job.from_dict(result) for result in results]
 
+    def list_jobs(
+        self,
+        platform: str | None = None,
+        status: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Job]:
+        """Get one page of jobs, newest first, with optional filters.
+
+        Filtering, ordering and pagination all happen in SQL, so only the
+        requested page is loaded.
+
+        Args:
+            platform: Optional platform to filter by.
+            status: Optional status to filter by.
+            limit: Maximum number of jobs to return.
+            offset: Number of jobs to skip.
+
+        Returns:
+            List of job instances ordered by creation date, newest first.
+        """
+        where_clauses = []
+        params: list[Any] = []
+        if platform:
+            where_clauses.append("platform = ?")
+            params.append(platform)
+        if status:
+            where_clauses.append("status = ?")
+            params.append(status)
+
+        where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+        sql = f"""
+        SELECT * FROM jobs
+        {where_sql}
+        ORDER BY created_at DESC
+        LIMIT ? OFFSET ?
+        """
+        params.extend((limit, offset))
+
+        results = self.execute_custom_query(sql, tuple(params))
+        return [Job.from_dict(result) for result in results]
+
     def get_job_with_files(self, job_id: str) -> dict[str, Any] | None:
         """Get a job along with its associated files.
 
+        The job and its files are loaded with a single LEFT JOIN.
+
         Args:
             job_id: The ID of the job to retrieve.
 
         Returns:
             Dictionary containing job and files, or None if not found.
         """
-        job = self.get_by_id(job_id)
-        if not job:
-            return None
-
-        # Get associated files
         sql = """
-        SELECT * FROM files
-        WHERE job_id = ?
-        ORDER BY created_at ASC
+        SELECT jobs.*,
+               files.id AS file_id,
+               files.file_path AS file_path,
+               files.file_type AS file_type,
+               files.file_size AS file_size,
+               files.metadata_json AS file_metadata_json,
+               files.created_at AS file_created_at
+        FROM jobs
+        LEFT JOIN files ON files.job_id = jobs.id
+        WHERE jobs.id = ?
+        ORDER BY files.created_at ASC
         """
 
-        file_results = self.execute_custom_query(sql, (job_id,))
+        results = self.execute_custom_query(sql, (job_id,))
+        if not results:
+            return None
 
         # Import here to avoid circular imports
         from ..models.file import File
 
-        files = [File.from_dict(file_data) for file_data in file_results]
+        files = [
+            File.from_dict(
+                {
+                    "id": row["file_id"],
+                    "job_id": job_id,
+                    "file_path": row["file_path"],
+                    "file_type": row["file_type"],
+                    "file_size": row["file_size"],
+                    "metadata_json": row["file_metadata_json"],
+                    "created_at": row["file_created_at"],
+                }
+            )
+            for row in results
+            if row["file_id"] is not None
+        ]
+
+        job_columns = {
+            key: value for key, value in results[0].items() if not key.startswith("file_")
+        }
+        job = Job.from_dict(job_columns)
 
         return {"job": job, "files": files}
 
@@ -284,12 +444,7 @@ class JobRepository(BaseRepository[Job]):
         GROUP BY status
         """
 
-        status_results = self.execute_custom_query(status_sql)
-        for result in status_results:
-            stats[f"status_{result['status']}"] = result["count"]
-
-        # Total jobs
-        stats["total_jobs"] = self.count()
+        count_sql = "SELECT COUNT(*) as count FROM jobs"
 
         # Jobs with files
         files_sql = """
@@ -297,7 +452,21 @@ class JobRepository(BaseRepository[Job]):
         FROM files
         """
 
-        files_result = self.execute_custom_query(files_sql)
+        # The three aggregates are independent, so run them concurrently
+        status_results, count_result, files_result = self.parallel(
+            [
+                lambda db: db.execute_query(status_sql),
+                lambda db: db.execute_query(count_sql),
+                lambda db: db.execute_query(files_sql),
+            ]
+        )
+
+        for result in status_results:
+            stats[f"status_{result['status']}"] = result["count"]
+
+        # Total jobs
+        stats["total_jobs"] = count_result[0]["count"] if count_result else 0
+
         stats["jobs_with_files"] = files_result[0]["count"] if files_result else 0
 
         return stats
@@ -6,11 +6,81 @@ This module provides the SettingsRepository class for all settings-related datab
 
 from __future__ import annotations
 
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Any
 
 from ..models.settings import Settings
 from .base import BaseRepository
 
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999; each upserted row binds three
+# parameters, so cap multi-row upserts at 333 rows per statement.
+SQLITE_MAX_PARAMS = 999
+UPSERT_BATCH_SIZE = SQLITE_MAX_PARAMS // 3
+# Keys bound per IN (...) list when deleting or probing for existing settings
+IN_CLAUSE_BATCH_SIZE = 900
+
+# Constant SQL for single-key reads. It skips rebuilding the query through find_by()
+# on every call and selects only the columns the model needs.
+_SELECT_SETTING_SQL = "SELECT key, value, updated_at FROM settings WHERE key = ?"
+
+# Process-wide LRU of settings rows keyed by (database path, key). Missing keys are
+# cached as None. Any write through SettingsRepository clears it; the generation
+# counter stops a read that raced with a write from caching the stale row.
+SETTINGS_CACHE_SIZE = 256
+
+_settings_cache: OrderedDict[tuple[str, str], dict[str, Any] | None] = OrderedDict()
+_settings_cache_lock = threading.Lock()
+_settings_cache_generation = 0
+
+
+def _invalidate_settings_cache() -> None:
+    """Drop all cached settings rows."""
+    global _settings_cache_generation
+    with _settings_cache_lock:
+        _settings_cache.clear()
+        _settings_cache_generation += 1
+
+
+def settings_cache_generation() -> int:
+    """Get a counter that changes whenever settings are written.
+
+    Callers caching values derived from settings can compare it to detect changes.
+
+    Returns:
+        The current settings cache generation.
+    """
+    return _settings_cache_generation
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Get the smallest string greater than every string starting with ``prefix``.
+
+    Args:
+        prefix: Non-empty key prefix.
+
+    Returns:
+        The exclusive upper bound, or None if no such bound exists.
+    """
+    stripped = prefix.rstrip(chr(sys.maxunicode))
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so ``value`` matches literally with ``ESCAPE '\\'``.
+
+    Args:
+        value: The raw string to escape.
+
+    Returns:
+        The escaped string.
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class SettingsRepository(BaseRepository[Settings]):
     """Repository for settings-related database operations.
@@ -23,16 +93,109 @@ class SettingsRepository(BaseRepository[Settings]):
         """Initialize the settings repository."""
         super().__init__(Settings)
 
-    def get_setting(self, key: str) -> Settings | None:
+    def create(self, model_instance: Settings) -> Settings:
+        """Create a setting and invalidate the settings cache.
+
+        Args:
+            model_instance: The settings instance to create.
+
+        Returns:
+            The created settings instance.
+        """
+        try:
+            return super().create(model_instance)
+        finally:
+            _invalidate_settings_cache()
+
+    def update(self, model_instance: Settings) -> Settings:
+        """Update a setting and invalidate the settings cache.
+
+        Args:
+            model_instance: The settings instance to update.
+
+        Returns:
+            The updated settings instance.
+        """
+        try:
+            return super().update(model_instance)
+        finally:
+            _invalidate_settings_cache()
+
+    def delete_by_id(self, model_id: str) -> bool:
+        """Delete a setting by key and invalidate the settings cache.
+
+        Args:
+            model_id: The key of the setting to delete.
+
+        Returns:
+            True if the setting was deleted, False otherwise.
+        """
+        try:
+            return super().delete_by_id(model_id)
+        finally:
+            _invalidate_settings_cache()
+
+    def execute_custom_update(self, query: str, params: tuple = ()) -> int:
+        """Execute a custom write query and invalidate the settings cache.
+
+        Args:
+            query: The SQL query to execute.
+            params: Parameters for the query.
+
+        Returns:
+            Number of rows affected.
+        """
+        try:
+            return super().execute_custom_update(query, params)
+        finally:
+            _invalidate_settings_cache()
+
+    def _fetch_setting(self, key: str) -> Settings | None:
+        """Read a single setting from the database.
+
+        Args:
+            key: The key of the setting to read.
+
+        Returns:
+            The settings instance if found, None otherwise.
+        """
+        with self._get_db_config().get_connection() as conn:
+            row = conn.execute(_SELECT_SETTING_SQL, (key,)).fetchone()
+
+        return Settings.from_dict(dict(row)) if row is not None else None
+
+    def get_setting(self, key: str, cache: bool = True) -> Settings | None:
         """Get a setting by its key.
 
         Args:
             key: The key of the setting to retrieve.
+            cache: Whether to serve the read from the in-process settings cache.
 
         Returns:
             The settings instance if found, None otherwise.
         """
-        return self.find_one_by(key=key)
+        if not cache:
+            return self._fetch_setting(key)
+
+        cache_key = (str(self._get_db_config().db_path), key)
+
+        with _settings_cache_lock:
+            if cache_key in _settings_cache:
+                _settings_cache.move_to_end(cache_key)
+                row = _settings_cache[cache_key]
+                return Settings.from_dict(dict(row)) if row is not None else None
+            generation = _settings_cache_generation
+
+        setting = self._fetch_setting(key)
+        row = setting.to_dict() if setting else None
+
+        with _settings_cache_lock:
+            if generation == _settings_cache_generation:
+                _settings_cache[cache_key] = row
+                if len(_settings_cache) > SETTINGS_CACHE_SIZE:
+                    _settings_cache.popitem(last=False)
+
+        return setting
 
     def get_setting_value(self, key: str, default_value: str = "") -> str:
         """Get the value of a setting by its key.
@@ -103,17 +266,30 @@ class SettingsRepository(BaseRepository[Settings]):
             value: The value to set.
 
         Returns:
-            The created or updated settings instance.
+            The created or updated settings instance, or the stored instance
+            unchanged if it already holds ``value``.
         """
-        setting = self.get_setting(key)
-
-        if setting:
-            setting.value = value
-            setting.update_timestamp()
-            return self.update(setting)
-        else:
-            setting = Settings(key=key, value=value)
-            return self.create(setting)
+        now = datetime.now(timezone.utc)
+
+        # The database decides whether the value changed, so a stale cache
+        # entry can never cause a write to be dropped
+        changed = self.execute_custom_update(
+            """
+            INSERT INTO settings (key, value, updated_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                value = excluded.value,
+                updated_at = excluded.updated_at
+            WHERE settings.value <> excluded.value
+            """,
+            (key, value, now.isoformat()),
+        )
+        if not changed:
+            stored = self.get_setting(key, cache=False)
+            if stored:
+                return stored
+
+        return Settings(key=key, value=value, updated_at=now)
 
     def set_setting_bool(self, key: str, value: bool) -> Settings:
         """Set a setting value from a boolean.
@@ -125,15 +301,9 @@ class SettingsRepository(BaseRepository[Settings]):
         Returns:
             The created or updated settings instance.
         """
-        setting = self.get_setting(key)
-
-        if setting:
-            setting.set_bool_value(value)
-            return self.update(setting)
-        else:
-            setting = Settings(key=key)
-            setting.set_bool_value(value)
-            return self.create(setting)
+        setting = Settings(key=key)
+        setting.set_bool_value(value)
+        return self.set_setting(key, setting.value)
 
     def set_setting_int(self, key: str, value: int) -> Settings:
         """Set a setting value from an integer.
@@ -145,15 +315,9 @@ class SettingsRepository(BaseRepository[Settings]):
         Returns:
             The created or updated settings instance.
         """
-        setting = self.get_setting(key)
-
-        if setting:
-            setting.set_int_value(value)
-            return self.update(setting)
-        else:
-            setting = Settings(key=key)
-            setting.set_int_value(value)
-            return self.create(setting)
+        setting = Settings(key=key)
+        setting.set_int_value(value)
+        return self.set_setting(key, setting.value)
 
     def set_setting_float(self, key: str, value: float) -> Settings:
         """Set a setting value from a float.
@@ -165,15 +329,9 @@ class SettingsRepository(BaseRepository[Settings]):
         Returns:
             The created or updated settings instance.
         """
-        setting = self.get_setting(key)
-
-        if setting:
-            setting.set_float_value(value)
-            return self.update(setting)
-        else:
-            setting = Settings(key=key)
-            setting.set_float_value(value)
-            return self.create(setting)
+        setting = Settings(key=key)
+        setting.set_float_value(value)
+        return self.set_setting(key, setting.value)
 
     def delete_setting(self, key: str) -> bool:
         """Delete a setting by its key.
@@ -192,51 +350,111 @@ class SettingsRepository(BaseRepository[Settings]):
         Returns:
             Dictionary of all settings (key -> value).
         """
-        settings_list = self.get_all()
-        return {setting.key: setting.value for setting in settings_list}
+        results = self.execute_custom_query("SELECT key, value FROM settings")
+        return {result["key"]: result["value"] for result in results}
 
-    def get_settings_by_prefix(self, prefix: str) -> dict[str, str]:
+    def get_settings_by_prefix(self, prefix: str, case_sensitive: bool = True) -> dict[str, str]:
         """Get settings whose keys start with a prefix.
 
+        The prefix is matched literally. Case-insensitive matching folds ASCII
+        letters only and is served by the ``idx_settings_key_nocase`` index.
+
         Args:
             prefix: The prefix to match against setting keys.
+            case_sensitive: Whether letter case must match.
 
         Returns:
             Dictionary of matching settings (key -> value).
         """
-        sql = """
-        SELECT * FROM settings
-        WHERE key LIKE ?
-        ORDER BY key
-        """
-
-        results = self.execute_custom_query(sql, (f"{prefix}%",))
-        settings = [Settings.from_dict(result) for result in results]
-
-        return {setting.key: setting.value for setting in settings}
-
-    def batch_set_settings(self, settings_dict: dict[str, str]) -> list[Settings]:
+        if not prefix:
+            return self.get_all_settings()
+
+        upper = _prefix_upper_bound(prefix) if case_sensitive else None
+        if upper is not None:
+            # A half-open range lets SQLite seek the primary key index directly
+            sql = """
+            SELECT key, value FROM settings
+            WHERE key >= ? AND key < ?
+            ORDER BY key
+            """
+            params: tuple[str, ...] = (prefix, upper)
+        else:
+            # LIKE folds ASCII case and can seek the NOCASE index. Case-sensitive
+            # lookups only land here for prefixes with no upper bound, which
+            # contain no ASCII letters.
+            sql = """
+            SELECT key, value FROM settings
+            WHERE key LIKE ? ESCAPE '\\'
+            ORDER BY key
+            """
+            params = (_escape_like(prefix) + "%",)
+
+        results = self.execute_custom_query(sql, params)
+        return {result["key"]: result["value"] for result in results}
+
+    def batch_set_settings(
+        self, settings_dict: dict[str, str], chunk_size: int = UPSERT_BATCH_SIZE
+    ) -> list[Settings]:
         """Set multiple settings at once.
 
+        All rows are written with multi-row ``INSERT ... ON CONFLICT`` statements
+        inside a single transaction, chunked to stay under SQLite's parameter limit.
+        Rows whose stored value already matches are left untouched.
+
         Args:
             settings_dict: Dictionary of settings to set (key -> value).
+            chunk_size: Maximum number of rows per statement.
 
         Returns:
             List of created or updated settings instances.
         """
-        result = []
-
-        for key, value in settings_dict.items():
-            setting = self.set_setting(key, value)
-            result.append(setting)
-
-        return result
-
-    def batch_delete_settings(self, keys: list[str]) -> int:
+        if not settings_dict:
+            return []
+
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
+        items = list(settings_dict.items())
+
+        db_config = self._get_db_config()
+        with db_config.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for start in range(0, len(items), chunk_size):
+                    chunk = items[start : start + chunk_size]
+                    placeholders = ", ".join(["(?, ?, ?)"] * len(chunk))
+                    params: list[Any] = []
+                    for key, value in chunk:
+                        params.extend((key, value, timestamp))
+
+                    conn.execute(
+                        f"""
+                        INSERT INTO settings (key, value, updated_at)
+                        VALUES {placeholders}
+                        ON CONFLICT(key) DO UPDATE SET
+                            value = excluded.value,
+                            updated_at = excluded.updated_at
+                        WHERE settings.value <> excluded.value
+                        """,
+                        tuple(params),
+                    )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                _invalidate_settings_cache()
+
+        return [Settings(key=key, value=value, updated_at=now) for key, value in items]
+
+    def batch_delete_settings(self, keys: list[str], chunk_size: int = IN_CLAUSE_BATCH_SIZE) -> int:
         """Delete multiple settings at once.
 
+        Keys are deleted with one ``DELETE ... WHERE key IN (...)`` per chunk inside
+        a single transaction, keeping each statement under SQLite's parameter limit.
+
         Args:
             keys: List of setting keys to delete.
+            chunk_size: Maximum number of keys per statement.
 
         Returns:
             Number of settings deleted.
@@ -244,13 +462,27 @@ class SettingsRepository(BaseRepository[Settings]):
         if not keys:
             return 0
 
-        placeholders = ", ".join(["?" for _ in keys])
-        sql = f"""
-        DELETE FROM settings
-        WHERE key IN ({placeholders})
-        """
-
-        return self.execute_custom_update(sql, tuple(keys))
+        deleted = 0
+
+        db_config = self._get_db_config()
+        with db_config.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for start in range(0, len(keys), chunk_size):
+                    chunk = keys[start : start + chunk_size]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    cursor = conn.execute(
+                        f"DELETE FROM settings WHERE key IN ({placeholders})", tuple(chunk)
+                    )
+                    deleted += cursor.rowcount
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                _invalidate_settings_cache()
+
+        return deleted
 
     def export_settings(self, include_updated_at: bool = False) -> dict[str, Any]:
         """Export all settings as a dictionary.
@@ -261,18 +493,22 @@ class SettingsRepository(BaseRepository[Settings]):
         Returns:
             Dictionary containing all settings.
         """
-        settings_list = self.get_all()
-
         if include_updated_at:
+            # Timestamps are stored as ISO-8601 already; only SQLite's default
+            # 'YYYY-MM-DD HH:MM:SS' form needs the 'T' separator. Offsets and
+            # microseconds are kept, so exports round-trip exactly.
+            sql = """
+            SELECT key, value, replace(updated_at, ' ', 'T') AS updated_at
+            FROM settings
+            """
+            results = self.execute_custom_query(sql)
             return {
-                setting.key: {
-                    "value": setting.value,
-                    "updated_at": setting.updated_at.isoformat() if setting.updated_at else None,
-                }
-                for setting in settings_list
+                result["key"]: {"value": result["value"], "updated_at": result["updated_at"]}
+                for result in results
             }
-        else:
-            return {setting.key: setting.value for setting in settings_list}
+
+        results = self.execute_custom_query("SELECT key, value FROM settings")
+        return {result["key"]: result["value"] for result in results}
 
     def import_settings(
         self, settings_data: dict[str, Any], overwrite: bool = True
@@ -286,26 +522,47 @@ class SettingsRepository(BaseRepository[Settings]):
         Returns:
             List of created or updated settings instances.
         """
-        result = []
+        values: dict[str, str] = {}
 
         for key, value in settings_data.items():
             # Handle different data formats
             if isinstance(value, dict) and "value" in value:
                 # Format with value and metadata
-                setting_value = value["value"]
+                values[key] = value["value"]
             else:
                 # Simple key-value format
-                setting_value = str(value)
+                values[key] = str(value)
+
+        if not overwrite:
+            # Leave existing settings untouched
+            existing = self._get_existing_keys(list(values))
+            values = {key: value for key, value in values.items() if key not in existing}
 
-            # Check if setting exists and whether to overwrite
-            existing = self.get_setting(key)
-            if existing and not overwrite:
-                continue
+        return self.batch_set_settings(values)
+
+    def _get_existing_keys(
+        self, keys: list[str], chunk_size: int = IN_CLAUSE_BATCH_SIZE
+    ) -> set[str]:
+        """Find which of the given keys already exist.
+
+        Args:
+            keys: Setting keys to check.
+            chunk_size: Maximum number of keys per query.
+
+        Returns:
+            Set of keys that are present in the settings table.
+        """
+        existing: set[str] = set()
 
-            setting = self.set_setting(key, setting_value)
-            result.append(setting)
+        for start in range(0, len(keys), chunk_size):
+            chunk = keys[start : start + chunk_size]
+            placeholders = ", ".join(["?"] * len(chunk))
+            results = self.execute_custom_query(
+                f"SELECT key FROM settings WHERE key IN ({placeholders})", tuple(chunk)
+            )
+            existing.update(result["key"] for result in results)
 
-        return result
+        return existing
 
     def get_setting_keys(self) -> list[str]:
         """Get all setting keys.
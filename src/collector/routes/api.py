@@ -2,16 +2,67 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import threading
+import time
+from typing import Any
 
-from flask import Blueprint, current_app, jsonify
+from flask import Blueprint, current_app, jsonify, request
 
+from ..repositories.settings_repository import settings_cache_generation
 from ..services import SessionService
 
 logger = logging.getLogger(__name__)
 
 api_bp = Blueprint("api", __name__)
 
+# The config status payload only changes with app config or settings, so it is
+# cached per application and rebuilt after a settings write or once the TTL lapses.
+CONFIG_STATUS_CACHE_TTL = 30.0
+
+_config_status_lock = threading.Lock()
+
+
+def _load_config_status() -> tuple[dict[str, Any], bool]:
+    """Build the config status payload, falling back to app config on failure.
+
+    Returns:
+        Tuple of (payload with encryption_enabled and downloads_dir keys,
+        whether the payload came from the service rather than the fallback).
+    """
+    try:
+        session_service = SessionService()
+        result = session_service.get_config_status()
+
+        if result["success"]:
+            return {
+                "encryption_enabled": result["encryption_enabled"],
+                "downloads_dir": result["downloads_dir"],
+            }, True
+    except Exception as e:
+        logger.exception("Error getting config status: %s", e)
+
+    # Fallback to basic config if service fails
+    return {
+        "encryption_enabled": False,
+        "downloads_dir": str(current_app.config.get("SCRAPER_DOWNLOAD_DIR", "")),
+    }, False
+
+
+def _config_status_etag(payload: dict[str, Any]) -> str:
+    """Compute a short content hash for a config status payload.
+
+    Args:
+        payload: The config status payload.
+
+    Returns:
+        Hex digest used as the response ETag.
+    """
+    body = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha1(body, usedforsecurity=False).hexdigest()[:16]
+
 
 @api_bp.route("/api/config/status")
 def config_status():
@@ -32,35 +83,38 @@ def config_status():
             - encryption_enabled: false
             - downloads_dir: Value from app config or empty string
 
+    Caching:
+        A successful payload is cached for CONFIG_STATUS_CACHE_TTL seconds or
+        until settings change. Responses carry an ETag; a matching If-None-Match
+        header returns 304 Not Modified with no body.
+
     Note:
         This endpoint is called by the frontend to display configuration
         status in the UI. The fallback ensures graceful degradation.
     """
-    try:
-        session_service = SessionService()
-        result = session_service.get_config_status()
+    generation = settings_cache_generation()
+    now = time.monotonic()
 
-        if result["success"]:
-            return jsonify(
-                {
-                    "encryption_enabled": result["encryption_enabled"],
-                    "downloads_dir": result["downloads_dir"],
-                }
-            )
-        else:
-            # Fallback to basic config if service fails
-            return jsonify(
-                {
-                    "encryption_enabled": False,
-                    "downloads_dir": str(current_app.config.get("SCRAPER_DOWNLOAD_DIR", "")),
-                }
-            )
-    except Exception as e:
-        logger.exception("Error getting config status: %s", e)
-        # Fallback to basic config
-        return jsonify(
-            {
-                "encryption_enabled": False,
-                "downloads_dir": str(current_app.config.get("SCRAPER_DOWNLOAD_DIR", "")),
-            }
-        )
+    with _config_status_lock:
+        cached = current_app.extensions.get("config_status_cache")
+
+    if cached and cached[0] > now and cached[1] == generation:
+        _, _, payload, etag = cached
+    else:
+        payload, cacheable = _load_config_status()
+        etag = _config_status_etag(payload)
+        if cacheable:
+            with _config_status_lock:
+                current_app.extensions["config_status_cache"] = (
+                    now + CONFIG_STATUS_CACHE_TTL,
+                    generation,
+                    payload,
+                    etag,
+                )
+
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(payload)
+    response.set_etag(etag)
+    return response
@@ -3,16 +3,167 @@
 from __future__ import annotations
 
 import logging
-
-from flask import Blueprint, abort, flash, redirect, render_template, request, url_for
-
-from ..security.csrf import validate_csrf_request
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any, TypeVar
+
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    flash,
+    g,
+    make_response,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
+
+from ..security.csrf import csrf_token_fingerprint, validate_csrf_request
 from ..services import ExecutorAdapter, JobService, ScraperService
 
 logger = logging.getLogger(__name__)
 
 jobs_bp = Blueprint("jobs", __name__)
 
+T = TypeVar("T")
+
+# HTMX polls job cards every couple of seconds from every open tab. Results are
+# cached per application for a fraction of that interval so concurrent pollers
+# share one round of queries.
+JOB_POLL_CACHE_TTL = 0.5
+ACTIVE_JOBS_CACHE_TTL = 0.25
+JOB_POLL_CACHE_MAXSIZE = 1024
+JOB_STATUS_CACHE_CONTROL = "private, max-age=1"
+
+_ACTIVE_JOBS_CACHE_KEY = ("*", "active")
+
+_poll_cache_lock = threading.Lock()
+
+_CSRF_PROTECTED_METHODS = frozenset({"POST", "DELETE"})
+
+JOB_CARD_TEMPLATE = "partials/job_card.html"
+
+
+@jobs_bp.record_once
+def _preload_templates(state) -> None:
+    """Load the job card template once when the blueprint is registered.
+
+    Skipped when templates auto-reload so edits still show up in development.
+
+    Args:
+        state: Blueprint setup state for the registering application.
+    """
+    jinja_env = state.app.jinja_env
+    if not jinja_env.auto_reload:
+        state.app.extensions["job_card_template"] = jinja_env.get_template(JOB_CARD_TEMPLATE)
+
+
+def _get_executor() -> ExecutorAdapter:
+    """Get the application's shared executor adapter, creating it on first use.
+
+    The adapter runs at most SCRAPER_MAX_CONCURRENT jobs at a time.
+
+    Returns:
+        ExecutorAdapter instance shared by all jobs requests.
+    """
+    executor = current_app.extensions.get("executor_adapter")
+    if executor is None:
+        executor = current_app.extensions.setdefault(
+            "executor_adapter",
+            ExecutorAdapter(max_workers=current_app.config["SCRAPER_MAX_CONCURRENT"]),
+        )
+    return executor
+
+
+def _render_job_card(job: Any, files: list[Any]) -> str:
+    """Render the job card partial, using the preloaded template when available.
+
+    Args:
+        job: Job to render.
+        files: Files associated with the job.
+
+    Returns:
+        Rendered HTML fragment.
+    """
+    template = current_app.extensions.get("job_card_template", JOB_CARD_TEMPLATE)
+    return render_template(template, job=job, files=files)
+
+
+@jobs_bp.before_request
+def _prepare_jobs_request():
+    """Record whether the request came from HTMX and enforce CSRF on writes.
+
+    Returns:
+        An error response if CSRF validation fails, otherwise None.
+    """
+    g.is_htmx = "HX-Request" in request.headers
+
+    if request.method in _CSRF_PROTECTED_METHODS and not validate_csrf_request(request):
+        if g.is_htmx:
+            return '<div class="notification error">CSRF validation failed</div>', 403
+        abort(403, "CSRF token validation failed")
+
+    return None
+
+
+def _poll_cache() -> dict[tuple[str, str], tuple[float, Any]]:
+    """Get the polling cache for the current application.
+
+    Returns:
+        Mapping of cache key to (expiry, value).
+    """
+    return current_app.extensions.setdefault("job_poll_cache", {})
+
+
+def _cached(key: tuple[str, str], ttl: float, loader: Callable[[], T]) -> T:
+    """Return a cached value or load and cache it for ``ttl`` seconds.
+
+    Args:
+        key: Cache key.
+        ttl: Time to live in seconds.
+        loader: Callable producing the value on a miss.
+
+    Returns:
+        The cached or freshly loaded value.
+    """
+    cache = _poll_cache()
+    now = time.monotonic()
+
+    with _poll_cache_lock:
+        entry = cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    value = loader()
+
+    with _poll_cache_lock:
+        if len(cache) >= JOB_POLL_CACHE_MAXSIZE:
+            for stale_key in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                del cache[stale_key]
+            if len(cache) >= JOB_POLL_CACHE_MAXSIZE:
+                cache.clear()
+        cache[key] = (now + ttl, value)
+
+    return value
+
+
+def _invalidate_job_cache(*job_ids: str) -> None:
+    """Drop cached polling results for the given jobs and the active jobs list.
+
+    Args:
+        *job_ids: IDs of jobs whose cached state is no longer valid.
+    """
+    cache = _poll_cache()
+    with _poll_cache_lock:
+        for job_id in job_ids:
+            cache.pop((job_id, "job"), None)
+            cache.pop((job_id, "files"), None)
+        cache.pop(_ACTIVE_JOBS_CACHE_KEY, None)
+
 
 @jobs_bp.route("/job/<job_id>")
 def job_detail(job_id: str):
@@ -40,15 +191,13 @@ def job_detail(job_id: str):
         If no HX-Request header: Returns full page (job_detail.html)
     """
     job_service = JobService()
-    job = job_service.get_job(job_id)
-    if not job:
+    result = job_service.get_job_with_files(job_id)
+    if not result:
         abort(404)
 
-    files = job_service.get_job_files(job_id)
-    is_htmx = "HX-Request" in request.headers
-
-    if is_htmx:
-        return render_template("partials/job_card.html", job=job, files=files)
+    job, files = result
+    if g.is_htmx:
+        return _render_job_card(job, files)
 
     return render_template("job_detail.html", job=job, files=files)
 
@@ -75,18 +224,42 @@ def job_status(job_id: str):
         Returns minimal HTML fragment for efficient polling updates.
         Designed for use with hx-trigger="every 2s" or similar.
 
+    Caching:
+        Job and file lookups are cached for JOB_POLL_CACHE_TTL seconds.
+        Responses carry a weak ETag derived from the job's updated_at and the
+        session's CSRF token; a matching If-None-Match returns 304 without
+        loading files or rendering.
+
     Note:
         This route is optimized for frequent polling and returns
         only the job card fragment, not a full page.
     """
     job_service = JobService()
-    job = job_service.get_job(job_id)
+    job = _cached((job_id, "job"), JOB_POLL_CACHE_TTL, lambda: job_service.get_job(job_id))
     if not job:
         abort(404)
 
-    files = job_service.get_job_files(job_id)
+    # Every job write bumps updated_at, so it identifies the rendered card; the
+    # card's Cancel/Retry forms also carry the session's CSRF token
+    updated_at = getattr(job, "updated_at", None)
+    etag = (
+        f"{updated_at.isoformat()}-{csrf_token_fingerprint(request)}"
+        if isinstance(updated_at, datetime)
+        else None
+    )
+
+    if etag and request.if_none_match.contains_weak(etag):
+        response = make_response("", 304)
+    else:
+        files = _cached(
+            (job_id, "files"), JOB_POLL_CACHE_TTL, lambda: job_service.get_job_files(job_id)
+        )
+        response = make_response(_render_job_card(job, files))
 
-    return render_template("partials/job_card.html", job=job, files=files)
+    if etag:
+        response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = JOB_STATUS_CACHE_CONTROL
+    return response
 
 
 @jobs_bp.route("/jobs/active")
@@ -97,14 +270,17 @@ def active_jobs():
 
     Returns:
         HTML: Partial template (partials/active_jobs.html) with:
-            - jobs: List of active Job objects
+            - jobs: List of (Job, files) pairs for active jobs
 
     HTMX Behavior:
         Returns HTML fragment for updating the active jobs section.
-        Typically used for polling or conditional updates.
+        Typically used for polling or conditional updates. The job list
+        is cached for ACTIVE_JOBS_CACHE_TTL seconds.
     """
     job_service = JobService()
-    jobs = job_service.get_active_jobs()
+    jobs = _cached(
+        _ACTIVE_JOBS_CACHE_KEY, ACTIVE_JOBS_CACHE_TTL, job_service.get_active_jobs_with_files
+    )
 
     return render_template("partials/active_jobs.html", jobs=jobs)
 
@@ -118,6 +294,8 @@ def download():
 
     Form Parameters:
         url: Target URL to download (required)
+        since: Optional ``YYYY-MM-DD`` date; Instagram profile scrapes only
+            download posts published on or after midnight UTC that day
 
     Returns:
         HTML/Response:
@@ -129,7 +307,7 @@ def download():
         HTTPException: 403 if CSRF token validation fails
 
     CSRF:
-        Requires CSRF token validation via validate_csrf_request()
+        Requires CSRF token validation, enforced by the blueprint's before_request hook
 
     HTMX Behavior:
         If HX-Request header present:
@@ -144,37 +322,44 @@ def download():
         - Empty URL: Returns 400 with error message
         - Invalid URL format: Returns 400 with validation error
         - Unrecognized platform: Returns 400 with platform error
+        - Malformed since date: Returns 400 with date error
     """
-    if not validate_csrf_request(request):
-        if "HX-Request" in request.headers:
-            return '<div class="notification error">CSRF validation failed</div>', 403
-        abort(403, "CSRF token validation failed")
+    is_htmx = g.is_htmx
 
     url = request.form.get("url", "").strip()
 
     scraper_service = ScraperService()
     is_valid, error = scraper_service.validate_url(url)
 
+    since = None
+    since_value = request.form.get("since", "").strip()
+    if is_valid and since_value:
+        try:
+            since = datetime.strptime(since_value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            is_valid, error = False, "Since date must be formatted as YYYY-MM-DD"
+
     if not is_valid:
-        if "HX-Request" in request.headers:
+        if is_htmx:
             return f'<div class="notification error">{error}</div>', 400
         flash(error or "Unknown validation error", "error")
         return redirect(url_for("pages.index"))
 
     platform = scraper_service.detect_platform(url)
     if not platform:
-        if "HX-Request" in request.headers:
+        if is_htmx:
             return '<div class="notification error">Could not detect platform</div>', 400
         flash("Could not detect platform", "error")
         return redirect(url_for("pages.index"))
 
     job_service = JobService()
     job = job_service.create_job(url, platform)
+    _invalidate_job_cache(job.id)
 
-    ExecutorAdapter().submit_job(scraper_service.execute_download, job.id)
+    _get_executor().submit_job(scraper_service.execute_download, job.id, since)
 
-    if "HX-Request" in request.headers:
-        return render_template("partials/job_card.html", job=job, files=[])
+    if is_htmx:
+        return _render_job_card(job, [])
 
     flash(f"Download started for {url}", "success")
     return redirect(url_for("pages.index"))
@@ -202,22 +387,24 @@ def cancel_job(job_id: str):
         HTTPException: 404 if job not found
 
     CSRF:
-        Requires CSRF token validation via validate_csrf_request()
+        Requires CSRF token validation, enforced by the blueprint's before_request hook
 
     HTMX Behavior:
         If HX-Request header present and successful: Returns 204 No Content
         If no HX-Request header: Flash message and redirect to dashboard
     """
-    if not validate_csrf_request(request):
-        abort(403, "CSRF token validation failed")
+    is_htmx = g.is_htmx
 
     job_service = JobService()
     job = job_service.get_job(job_id)
     if not job:
         abort(404)
 
-    if job_service.cancel_job(job_id):
-        if "HX-Request" in request.headers:
+    cancelled = job_service.cancel_job(job_id)
+    _invalidate_job_cache(job_id)
+
+    if cancelled:
+        if is_htmx:
             return "", 204
         flash("Job cancelled", "success")
     else:
@@ -246,7 +433,7 @@ def retry_job(job_id: str):
         HTTPException: 403 if CSRF token validation fails
 
     CSRF:
-        Requires CSRF token validation via validate_csrf_request()
+        Requires CSRF token validation, enforced by the blueprint's before_request hook
 
     HTMX Behavior:
         If HX-Request header present and successful: Returns job_card.html partial
@@ -254,10 +441,10 @@ def retry_job(job_id: str):
 
     Note:
         Only jobs with status "failed" can be retried.
-        A new job is created with a new ID.
+        A new job is created with a new ID. Jobs do not store the ``since``
+        cutoff, so a retry downloads the full profile.
     """
-    if not validate_csrf_request(request):
-        abort(403, "CSRF token validation failed")
+    is_htmx = g.is_htmx
 
     job_service = JobService()
     new_job = job_service.prepare_retry_job(job_id)
@@ -266,11 +453,13 @@ def retry_job(job_id: str):
         flash("Only failed jobs can be retried", "error")
         return redirect(url_for("pages.index"))
 
+    _invalidate_job_cache(job_id, new_job.id)
+
     scraper_service = ScraperService()
-    ExecutorAdapter().submit_job(scraper_service.execute_download, new_job.id)
+    _get_executor().submit_job(scraper_service.execute_download, new_job.id)
 
-    if "HX-Request" in request.headers:
-        return render_template("partials/job_card.html", job=new_job, files=[])
+    if is_htmx:
+        return _render_job_card(new_job, [])
 
     flash("Job retry started", "success")
     return redirect(url_for("pages.index"))
@@ -297,7 +486,7 @@ def delete_job_route(job_id: str):
         HTTPException: 403 if CSRF token validation fails
 
     CSRF:
-        Requires CSRF token validation via validate_csrf_request()
+        Requires CSRF token validation, enforced by the blueprint's before_request hook
 
     HTMX Behavior:
         If HX-Request header present and successful: Returns 204 No Content
@@ -308,16 +497,18 @@ def delete_job_route(job_id: str):
         This operation is irreversible. All files associated with the job
         will be permanently deleted from disk.
     """
-    if not validate_csrf_request(request):
-        abort(403, "CSRF token validation failed")
+    is_htmx = g.is_htmx
 
     job_service = JobService()
-    if job_service.delete_job(job_id, delete_files=True):
-        if "HX-Request" in request.headers:
+    deleted = job_service.delete_job(job_id, delete_files=True)
+    _invalidate_job_cache(job_id)
+
+    if deleted:
+        if is_htmx:
             return "", 204
         flash("Job deleted", "success")
     else:
-        if "HX-Request" in request.headers:
+        if is_htmx:
             return "Job not found", 404
         flash("Job not found", "error")
 
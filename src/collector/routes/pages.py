@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+import stat
+import threading
+import time
+from collections.abc import Callable
 from pathlib import Path
 
-from flask import Blueprint, abort, flash, redirect, render_template, request, url_for
-
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    flash,
+    make_response,
+    redirect,
+    render_template,
+    request,
+    send_file,
+    session,
+    stream_template,
+    url_for,
+)
+
+from ..config import ALL_STATUSES
+from ..security.csrf import csrf_token_fingerprint
 from ..security.paths import PathSecurityError, resolve_user_path, safe_send_file
 from ..services import JobService
 
@@ -14,6 +35,162 @@ logger = logging.getLogger(__name__)
 
 pages_bp = Blueprint("pages", __name__)
 
+DASHBOARD_TEMPLATE = "dashboard.html"
+
+# Text previews request at most this many bytes of the file via a Range header.
+MAX_PREVIEW_BYTES = 1 << 20
+
+# Preview type by lowercase file extension; .txt is handled separately.
+_EXT_TYPE = {
+    ".jpg": "image",
+    ".jpeg": "image",
+    ".png": "image",
+    ".gif": "image",
+    ".webp": "image",
+    ".mp4": "video",
+    ".mov": "video",
+    ".webm": "video",
+    ".mkv": "video",
+    ".mp3": "audio",
+    ".m4a": "audio",
+    ".wav": "audio",
+    ".json": "metadata",
+}
+_TEXT_PREVIEW_TYPES = frozenset({"transcript", "text", "metadata"})
+
+# Browse and preview pages are revalidated on every request; an unchanged
+# ETag returns 304 without rendering the listing or reading the file.
+PAGES_CACHE_CONTROL = "private, no-cache"
+
+# History filter values map to their canonical strings; anything else is ignored.
+_HISTORY_PLATFORMS = {p: p for p in ("youtube", "instagram")}
+_HISTORY_STATUSES = {s: s for s in ALL_STATUSES}
+_BROWSE_ONLY_VALUES = frozenset({"dirs", "files"})
+
+# Resolved user paths are reused briefly across polls. The TTL is kept short
+# so a swapped symlink is re-resolved within seconds.
+RESOLVE_CACHE_TTL = 2.0
+RESOLVE_CACHE_MAXSIZE = 1024
+_resolve_cache_lock = threading.Lock()
+
+
+@pages_bp.record_once
+def _preload_templates(state) -> None:
+    """Load the dashboard template once when the blueprint is registered.
+
+    Skipped when templates auto-reload so edits still show up in development.
+
+    Args:
+        state: Blueprint setup state for the registering application.
+    """
+    jinja_env = state.app.jinja_env
+    if not jinja_env.auto_reload:
+        state.app.extensions["dashboard_template"] = jinja_env.get_template(DASHBOARD_TEMPLATE)
+
+
+def _get_download_dir() -> Path:
+    """Return the resolved download directory for the current app.
+
+    The resolved Path is memoized in app.extensions and rebuilt only when
+    the SCRAPER_DOWNLOAD_DIR config value changes.
+
+    Returns:
+        Absolute, resolved download directory.
+    """
+    raw = current_app.config["SCRAPER_DOWNLOAD_DIR"]
+    cached = current_app.extensions.get("download_dir")
+    if cached is None or cached[0] != raw:
+        cached = (raw, Path(raw).resolve())
+        current_app.extensions["download_dir"] = cached
+    return cached[1]
+
+
+def _resolve_cached(download_dir: Path, user_path: str) -> Path:
+    """Resolve a user path under the downloads root, reusing recent results.
+
+    Args:
+        download_dir: Resolved downloads root
+        user_path: User-provided relative path
+
+    Returns:
+        Resolved absolute path
+
+    Raises:
+        PathSecurityError: If the path resolves outside download_dir
+    """
+    cache = current_app.extensions.setdefault("resolved_path_cache", {})
+    key = (str(download_dir), user_path)
+    now = time.monotonic()
+
+    with _resolve_cache_lock:
+        entry = cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+    resolved = resolve_user_path(download_dir, user_path, base_resolved=True)
+
+    with _resolve_cache_lock:
+        if len(cache) >= RESOLVE_CACHE_MAXSIZE:
+            for stale_key in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                del cache[stale_key]
+            if len(cache) >= RESOLVE_CACHE_MAXSIZE:
+                cache.clear()
+        cache[key] = (now + RESOLVE_CACHE_TTL, resolved)
+    return resolved
+
+
+def _relative_path(download_dir: Path, path: Path) -> str:
+    """Return a resolved path relative to the resolved downloads root.
+
+    Both paths are already resolved and ``path`` lies under ``download_dir``,
+    so slicing the string avoids Path.relative_to's part-by-part comparison.
+
+    Args:
+        download_dir: Resolved downloads root
+        path: Resolved path at or below download_dir
+
+    Returns:
+        Relative path string, empty for the root itself
+    """
+    base = str(download_dir)
+    return str(path)[len(base) + (not base.endswith(os.sep)) :] if path != download_dir else ""
+
+
+def _conditional_page(etag: str, render: Callable[[], str]):
+    """Return 304 for a matching If-None-Match, otherwise render the page.
+
+    Pending flash messages always force a render so they are not lost
+    behind a 304. The session's CSRF token is rendered into every page, so
+    its fingerprint is folded into the ETag.
+
+    Args:
+        etag: Weak ETag identifying the page content
+        render: Callable producing the page body
+
+    Returns:
+        Response with the ETag and Cache-Control headers set
+    """
+    etag = f"{etag}-{csrf_token_fingerprint(request)}"
+    if "_flashes" not in session and request.if_none_match.contains_weak(etag):
+        response = make_response("", 304)
+    else:
+        response = make_response(render())
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = PAGES_CACHE_CONTROL
+    return response
+
+
+def _get_job_service() -> JobService:
+    """Get the application's shared job service, creating it on first use.
+
+    Returns:
+        JobService instance shared by all pages requests.
+    """
+    service = current_app.extensions.get("job_service")
+    if service is None:
+        service = current_app.extensions.setdefault("job_service", JobService())
+    return service
+
 
 @pages_bp.route("/")
 def index():
@@ -28,7 +205,8 @@ def index():
             - Active jobs list with HTMX polling
             - Configuration status display
     """
-    return render_template("dashboard.html")
+    template = current_app.extensions.get("dashboard_template", DASHBOARD_TEMPLATE)
+    return render_template(template)
 
 
 @pages_bp.route("/browse")
@@ -42,18 +220,27 @@ def browse(subpath: str = ""):
     Args:
         subpath: Relative path from downloads root (optional, defaults to root)
 
+    Query Parameters:
+        only: Optional "dirs" or "files" to list just folders or just files
+
     Returns:
         HTML: Rendered browse page (browse.html) with:
             - current_path: Current subpath string
             - current_path_parts: List of path components for breadcrumb navigation
             - is_root: Boolean indicating if at root directory
-            - items: List of directory contents with name, is_dir, size, relative_path
+            - names, is_dirs, sizes, rel_paths: Parallel lists describing the
+              directory contents (size is None for non-files)
         OR file download response if path points to a file
 
     Raises:
         HTTPException: 403 if path traversal detected (PathSecurityError)
         Redirects to self with flash error if path does not exist
 
+    Caching:
+        Directory listings carry a weak ETag hashed from the entries' names,
+        sizes and mtimes; a matching If-None-Match returns 304 without
+        rendering the template.
+
     Security:
         Uses resolve_user_path() to prevent directory traversal attacks.
         All paths are validated against the configured downloads directory.
@@ -63,40 +250,100 @@ def browse(subpath: str = ""):
         - File: Initiates file download via safe_send_file()
         - Invalid path: Returns to browse root with error message
     """
-    from flask import current_app
-
-    download_dir = Path(current_app.config["SCRAPER_DOWNLOAD_DIR"])
+    download_dir = _get_download_dir()
 
     try:
-        browse_path = resolve_user_path(download_dir, subpath) if subpath else download_dir
+        browse_path = _resolve_cached(download_dir, subpath) if subpath else download_dir
     except PathSecurityError:
         abort(403)
 
-    if not browse_path.exists():
+    try:
+        browse_stat = browse_path.stat()
+    except OSError:
         flash(f"Path not found: {subpath}", "error")
         return redirect(url_for("pages.browse"))
 
-    if not browse_path.is_dir():
+    if not stat.S_ISDIR(browse_stat.st_mode):
         return safe_send_file(download_dir, browse_path)
 
-    # List directory contents
-    items = []
-    for item in sorted(browse_path.iterdir(), key=lambda x: (not x.is_dir(), x.name.lower())):
-        items.append(
-            {
-                "name": item.name,
-                "is_dir": item.is_dir(),
-                "size": item.stat().st_size if item.is_file() else None,
-                "relative_path": str(item.relative_to(download_dir)) if item != browse_path else "",
-            }
+    only = request.args.get("only")
+    if only not in _BROWSE_ONLY_VALUES:
+        only = None
+
+    # The directory mtime misses files that grow in place (Instaloader writes
+    # straight to the final name), so the ETag hashes every file's size and mtime
+    rows = _list_browse_dir(browse_path, only)
+    digest = hashlib.blake2b(digest_size=8)
+    for name, is_dir, size, mtime_ns in rows:
+        digest.update(
+            f"{name}\0{is_dir:d}\0{size}\0{mtime_ns}\n".encode("utf-8", "surrogateescape")
         )
+    etag = digest.hexdigest()
+    return _conditional_page(
+        etag,
+        lambda: _render_browse(rows, subpath, _relative_path(download_dir, browse_path)),
+    )
+
+
+def _list_browse_dir(
+    browse_path: Path, only: str | None = None
+) -> list[tuple[str, bool, int | None, int | None]]:
+    """List a directory for the browse page, folders first.
+
+    Args:
+        browse_path: Resolved directory to list
+        only: "dirs" or "files" to keep a single kind of entry, None for both
+
+    Returns:
+        (name, is_dir, size, mtime_ns) tuples; size and mtime are None for
+        anything that is not a regular file
+    """
+    # DirEntry caches the type from the directory read, so only regular files
+    # cost a stat() call. Filtered-out entries are dropped before any stat().
+    with os.scandir(browse_path) as it:
+        if only == "dirs":
+            entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+        elif only == "files":
+            entries = [e for e in it if not e.is_dir(follow_symlinks=False)]
+        else:
+            entries = list(it)
+    entries.sort(key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower()))
+
+    rows: list[tuple[str, bool, int | None, int | None]] = []
+    for entry in entries:
+        if entry.is_file(follow_symlinks=False):
+            entry_stat = entry.stat(follow_symlinks=False)
+            rows.append((entry.name, False, entry_stat.st_size, entry_stat.st_mtime_ns))
+        else:
+            rows.append((entry.name, entry.is_dir(follow_symlinks=False), None, None))
+    return rows
+
+
+def _render_browse(
+    rows: list[tuple[str, bool, int | None, int | None]], subpath: str, relative_dir: str
+) -> str:
+    """Render the browse page for a directory listing.
+
+    Args:
+        rows: Directory listing from _list_browse_dir
+        subpath: Requested path relative to the downloads root
+        relative_dir: Canonical path of the directory relative to the downloads root
+
+    Returns:
+        Rendered browse.html
+    """
+    prefix = relative_dir + "/" if relative_dir else ""
+    names = [row[0] for row in rows]
 
     return render_template(
         "browse.html",
         current_path=subpath,
         current_path_parts=subpath.split("/") if subpath else [],
         is_root=not subpath,
-        items=items,
+        names=names,
+        is_dirs=[row[1] for row in rows],
+        sizes=[row[2] for row in rows],
+        rel_paths=[prefix + name for name in names],
     )
 
 
@@ -115,7 +362,9 @@ def preview_file(filepath: str):
             - file_path: Relative path to file
             - file_name: Base filename
             - file_type: Detected type (image, video, audio, transcript, text, metadata, unknown)
-            - content: File content for text-based types (None for binary)
+            - file_size: Size of the file in bytes
+            - content_url: URL of preview_file_content for text-based types
+            - preview_max_bytes: Bytes the page requests from content_url
         OR redirect to browse page if path is a directory
 
     Raises:
@@ -126,6 +375,11 @@ def preview_file(filepath: str):
         Uses resolve_user_path() to prevent directory traversal attacks.
         All paths are validated against the configured downloads directory.
 
+    Caching:
+        Responses carry a weak ETag from the file's mtime and size; a matching
+        If-None-Match returns 304. The page itself never reads the file; text
+        is fetched from preview_file_content after load.
+
     File Type Detection:
         - Image: .jpg, .jpeg, .png, .gif, .webp
         - Video: .mp4, .mov, .webm, .mkv
@@ -135,62 +389,105 @@ def preview_file(filepath: str):
         - Metadata: .json files
         - Unknown: All other file types
     """
-    from flask import current_app
-
-    download_dir = Path(current_app.config["SCRAPER_DOWNLOAD_DIR"])
+    download_dir = _get_download_dir()
 
     try:
-        file_path = resolve_user_path(download_dir, filepath)
+        file_path = _resolve_cached(download_dir, filepath)
     except PathSecurityError:
         abort(403)
 
-    if not file_path.exists():
+    # One stat() answers existence, directory and ETag questions
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
         abort(404)
 
-    if file_path.is_dir():
+    if stat.S_ISDIR(file_stat.st_mode):
         return redirect(url_for("pages.browse", subpath=filepath))
 
-    # Determine file type
-    file_ext = file_path.suffix.lower()
+    etag = f"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"
+    return _conditional_page(
+        etag, lambda: _render_preview(download_dir, file_path, file_stat.st_size)
+    )
+
+
+def _preview_type(file_name: str) -> str:
+    """Detect the preview type of a file from its name.
+
+    Args:
+        file_name: Base filename
+
+    Returns:
+        One of image, video, audio, transcript, text, metadata or unknown
+    """
+    file_ext = os.path.splitext(file_name)[1].lower()
+    if file_ext == ".txt":
+        return "transcript" if "transcript" in file_name.lower() else "text"
+    return _EXT_TYPE.get(file_ext, "unknown")
+
+
+def _render_preview(download_dir: Path, file_path: Path, file_size: int) -> str:
+    """Render the preview page for a file.
+
+    Args:
+        download_dir: Resolved downloads root
+        file_path: Resolved file to preview
+        file_size: Size of the file in bytes
+
+    Returns:
+        Rendered preview.html
+    """
     file_name = file_path.name
+    file_type = _preview_type(file_name)
+    relative_path = _relative_path(download_dir, file_path)
 
-    # Check for different file types
-    if file_ext in [".jpg", ".jpeg", ".png", ".gif", ".webp"]:
-        file_type = "image"
-    elif file_ext in [".mp4", ".mov", ".webm", ".mkv"]:
-        file_type = "video"
-    elif file_ext == ".txt":
-        # Check if it's a transcript
-        if "transcript" in file_name.lower():
-            file_type = "transcript"
-        else:
-            file_type = "text"
-    elif file_ext == ".json":
-        file_type = "metadata"
-    elif file_ext in [".mp3", ".m4a", ".wav"]:
-        file_type = "audio"
-    else:
-        file_type = "unknown"
-
-    # Read file content for text-based previews
-    content = None
-    if file_type in ["transcript", "text", "metadata"]:
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
-        except Exception as e:
-            logger.error("Error reading file %s: %s", file_path, e)
-            content = f"Error reading file: {e}"
+    content_url = None
+    if file_type in _TEXT_PREVIEW_TYPES:
+        content_url = url_for("pages.preview_file_content", filepath=relative_path)
 
     return render_template(
         "preview.html",
-        file_path=str(file_path.relative_to(download_dir)),
+        file_path=relative_path,
         file_name=file_name,
         file_type=file_type,
-        content=content,
+        file_size=file_size,
+        content_url=content_url,
+        preview_max_bytes=MAX_PREVIEW_BYTES,
     )
 
 
+@pages_bp.route("/preview/content/<path:filepath>")
+def preview_file_content(filepath: str):
+    """Serve the raw text of a transcript, text or metadata file for preview.
+
+    Args:
+        filepath: Relative path from downloads root
+
+    Returns:
+        The file as UTF-8 plain text via send_file, honouring Range and
+        conditional request headers (206/304)
+
+    Raises:
+        HTTPException: 403 if path traversal detected (PathSecurityError)
+        HTTPException: 404 if the path is not a regular file of a text preview type
+
+    Note:
+        The preview page requests the first MAX_PREVIEW_BYTES with a Range
+        header, so large files are never read in full for a preview.
+    """
+    download_dir = _get_download_dir()
+
+    try:
+        file_path = _resolve_cached(download_dir, filepath)
+    except PathSecurityError:
+        abort(403)
+
+    if _preview_type(file_path.name) not in _TEXT_PREVIEW_TYPES or not file_path.is_file():
+        abort(404)
+
+    return send_file(file_path, mimetype="text/plain; charset=utf-8", conditional=True)
+
+
 @pages_bp.route("/history")
 def history():
     """Display download history with optional filtering.
@@ -203,23 +500,27 @@ def history():
         status: Optional filter by job status (e.g., "completed", "failed")
 
     Returns:
-        HTML: Rendered history page (history.html) with:
+        HTML: Streamed history page (history.html) with:
             - jobs: List of Job objects (up to 200, filtered by parameters)
             - filters: Dictionary of active filters {"platform": str|None, "status": str|None}
 
     Behavior:
         - Returns up to 200 most recent jobs
         - Filters are applied cumulatively if both provided
+        - Unknown platform or status values are ignored
         - Jobs are ordered by creation date (newest first)
     """
-    platform = request.args.get("platform")
-    status = request.args.get("status")
+    args = request.args
+    platform = _HISTORY_PLATFORMS.get(args.get("platform", ""))
+    status = _HISTORY_STATUSES.get(args.get("status", ""))
 
-    job_service = JobService()
-    jobs = job_service.list_jobs(platform=platform, status=status, limit=200)
+    jobs = _get_job_service().list_jobs(platform=platform, status=status, limit=200)
+    context = {"jobs": jobs, "filters": {"platform": platform, "status": status}}
 
-    return render_template(
-        "history.html",
-        jobs=jobs,
-        filters={"platform": platform, "status": status},
-    )
+    # Pending flash messages are consumed while the body renders, which for a
+    # streamed page is after the session cookie was sent; render those normally
+    if "_flashes" in session:
+        return render_template("history.html", **context)
+
+    # Stream the page so long histories flush while the job rows render
+    return stream_template("history.html", **context)
@@ -4,7 +4,17 @@ from __future__ import annotations
 
 import logging
 
-from flask import Blueprint, abort, flash, redirect, render_template, request, url_for
+from flask import (
+    Blueprint,
+    abort,
+    current_app,
+    flash,
+    redirect,
+    render_template,
+    request,
+    url_for,
+)
+from markupsafe import escape
 
 from ..security.csrf import validate_csrf_request
 from ..services import SessionService
@@ -13,6 +23,73 @@ logger = logging.getLogger(__name__)
 
 sessions_bp = Blueprint("sessions", __name__)
 
+SESSIONS_TEMPLATE = "sessions.html"
+
+# cookies.txt exports are a few KiB; anything past this is rejected.
+MAX_COOKIES_FILE_BYTES = 1 << 20
+_ALLOWED_COOKIE_EXTS = (".txt",)
+
+_ERR_TPL = '<div class="notification error">%s</div>'
+# Exception text shown to the user is cut to this many characters.
+MAX_ERROR_DETAIL_CHARS = 200
+_NO_FILE = "No file uploaded"
+_NO_SELECTION = "No file selected"
+_BAD_FORMAT = "File must be .txt format (cookies.txt)"
+_TOO_LARGE = "Cookies file is too large"
+_UPLOAD_SUCCESS = (
+    '<div class="notification success">'
+    "Session uploaded successfully! Refresh to see it in the list."
+    "</div>"
+)
+# HTMX fragments for the fixed validation errors, rendered once at import.
+_ERROR_FRAGMENTS = {
+    msg: _ERR_TPL % msg for msg in (_NO_FILE, _NO_SELECTION, _BAD_FORMAT, _TOO_LARGE)
+}
+
+
+@sessions_bp.record_once
+def _preload_templates(state) -> None:
+    """Load the sessions page template once when the blueprint is registered.
+
+    Skipped when templates auto-reload so edits still show up in development.
+
+    Args:
+        state: Blueprint setup state for the registering application.
+    """
+    jinja_env = state.app.jinja_env
+    if not jinja_env.auto_reload:
+        state.app.extensions["sessions_template"] = jinja_env.get_template(SESSIONS_TEMPLATE)
+
+
+def _get_session_service() -> SessionService:
+    """Get the application's shared session service, creating it on first use.
+
+    Returns:
+        SessionService instance shared by all sessions requests.
+    """
+    service = current_app.extensions.get("session_service")
+    if service is None:
+        service = current_app.extensions.setdefault("session_service", SessionService())
+    return service
+
+
+def _htmx_or_flash_error(message: str, status: int, is_htmx: bool):
+    """Report an error as an HTMX notification or a flash message.
+
+    Args:
+        message: Error message to show; escaped before it is inserted into HTML
+        status: HTTP status code for the HTMX response
+        is_htmx: Whether the request came from HTMX
+
+    Returns:
+        Notification fragment with status for HTMX, otherwise a redirect
+        to the sessions list
+    """
+    if is_htmx:
+        return _ERROR_FRAGMENTS.get(message) or _ERR_TPL % escape(message), status
+    flash(message, "error")
+    return redirect(url_for("sessions.list_sessions"))
+
 
 @sessions_bp.route("/sessions")
 def list_sessions():
@@ -31,14 +108,15 @@ def list_sessions():
         to index on exception.
     """
     try:
-        session_service = SessionService()
+        session_service = _get_session_service()
         result = session_service.list_sessions()
         if result["success"]:
             sessions = result["sessions"]
         else:
             sessions = []
             flash(f"Error listing sessions: {result.get('error', 'Unknown error')}", "error")
-        return render_template("sessions.html", sessions=sessions)
+        template = current_app.extensions.get("sessions_template", SESSIONS_TEMPLATE)
+        return render_template(template, sessions=sessions)
     except Exception as e:
         logger.exception("Error listing sessions: %s", e)
         flash(f"Error listing sessions: {e}", "error")
@@ -82,6 +160,7 @@ def upload_session():
         - No file uploaded: Returns 400
         - Empty filename: Returns 400
         - Non-.txt file: Returns 400 with format error message
+        - File larger than MAX_COOKIES_FILE_BYTES: Returns 413
         - Invalid cookies.txt format: Returns 400 with parsing error
 
     File Requirements:
@@ -92,62 +171,49 @@ def upload_session():
     if not validate_csrf_request(request):
         abort(403, "CSRF token validation failed")
 
+    is_htmx = "HX-Request" in request.headers
+
     if "cookies_file" not in request.files:
-        if "HX-Request" in request.headers:
-            return '<div class="notification error">No file uploaded</div>', 400
-        flash("No file uploaded", "error")
-        return redirect(url_for("sessions.list_sessions"))
+        return _htmx_or_flash_error(_NO_FILE, 400, is_htmx)
 
     file = request.files["cookies_file"]
     filename = file.filename or ""
 
     if filename == "":
-        if "HX-Request" in request.headers:
-            return '<div class="notification error">No file selected</div>', 400
-        flash("No file selected", "error")
-        return redirect(url_for("sessions.list_sessions"))
+        return _htmx_or_flash_error(_NO_SELECTION, 400, is_htmx)
 
-    if not filename.endswith(".txt"):
-        if "HX-Request" in request.headers:
-            return (
-                '<div class="notification error">File must be .txt format (cookies.txt)</div>',
-                400,
-            )
-        flash("File must be cookies.txt format", "error")
-        return redirect(url_for("sessions.list_sessions"))
+    if not filename.lower().endswith(_ALLOWED_COOKIE_EXTS):
+        return _htmx_or_flash_error(_BAD_FORMAT, 400, is_htmx)
+
+    if file.content_length and file.content_length > MAX_COOKIES_FILE_BYTES:
+        return _htmx_or_flash_error(_TOO_LARGE, 413, is_htmx)
 
     try:
-        session_service = SessionService()
+        session_service = _get_session_service()
 
-        # Read file content
-        file_content = file.read().decode("utf-8")
+        # Read at most one byte past the limit to detect oversized uploads
+        raw = file.stream.read(MAX_COOKIES_FILE_BYTES + 1)
+        if len(raw) > MAX_COOKIES_FILE_BYTES:
+            return _htmx_or_flash_error(_TOO_LARGE, 413, is_htmx)
+        file_content = raw.decode("utf-8")
 
         # Process the uploaded file
         result = session_service.upload_session(file_content, filename)
 
-        if result["success"]:
-            if "HX-Request" in request.headers:
-                return """
-                <div class="notification success">
-                    Session uploaded successfully! Refresh to see it in the list.
-                </div>
-                """
-
-            flash("Session uploaded successfully", "success")
-        else:
-            error_msg = result.get("error", "Unknown error")
-            if "HX-Request" in request.headers:
-                return f'<div class="notification error">{error_msg}</div>', 400
-            flash(error_msg, "error")
+        if not result["success"]:
+            return _htmx_or_flash_error(result.get("error", "Unknown error"), 400, is_htmx)
 
+        if is_htmx:
+            return _UPLOAD_SUCCESS
+
+        flash("Session uploaded successfully", "success")
         return redirect(url_for("sessions.list_sessions"))
 
     except Exception as e:
         logger.exception("Error uploading session: %s", e)
-        if "HX-Request" in request.headers:
-            return f'<div class="notification error">Failed to upload session: {str(e)}</div>', 500
-        flash(f"Failed to upload session: {e}", "error")
-        return redirect(url_for("sessions.list_sessions"))
+        return _htmx_or_flash_error(
+            f"Failed to upload session: {str(e)[:MAX_ERROR_DETAIL_CHARS]}", 500, is_htmx
+        )
 
 
 @sessions_bp.route("/sessions/<username>/delete", methods=["POST"])
@@ -187,22 +253,23 @@ def delete_session(username: str):
     if not validate_csrf_request(request):
         abort(403, "CSRF token validation failed")
 
+    is_htmx = "HX-Request" in request.headers
+
     try:
-        session_service = SessionService()
+        session_service = _get_session_service()
         result = session_service.delete_session(username)
         if result["success"]:
-            if "HX-Request" in request.headers:
+            if is_htmx:
                 return "", 204
             flash("Session deleted", "success")
         else:
             error_msg = result.get("error", "Session not found")
-            if "HX-Request" in request.headers:
-                return error_msg, 404
+            if is_htmx:
+                return escape(error_msg), 404
             flash(error_msg, "error")
         return redirect(url_for("sessions.list_sessions"))
     except Exception as e:
         logger.exception("Error deleting session: %s", e)
-        if "HX-Request" in request.headers:
-            return f'<div class="notification error">Failed to delete: {str(e)}</div>', 500
-        flash(f"Failed to delete session: {e}", "error")
-        return redirect(url_for("sessions.list_sessions"))
+        return _htmx_or_flash_error(
+            f"Failed to delete session: {str(e)[:MAX_ERROR_DETAIL_CHARS]}", 500, is_htmx
+        )
@@ -12,6 +12,24 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None  # type: ignore[assignment]
+
+# Dates and dataclasses are passed to ``default=str`` like the stdlib encoder does,
+# instead of orjson's own RFC 3339 and dict encodings
+_ORJSON_OPTIONS = (
+    (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if orjson is not None
+    else 0
+)
+
 
 class BaseScraper(abc.ABC):
     """Abstract base class for platform-specific scrapers."""
@@ -33,6 +51,7 @@ class BaseScraper(abc.ABC):
         self.db_path = db_path
         self.download_dir = download_dir
         self.progress_callback = progress_callback
+        self._download_dir_str = os.path.join(str(download_dir), "")
 
     @abc.abstractmethod
     def scrape(self, url: str, job_id: str) -> dict[str, Any]:
@@ -134,6 +153,13 @@ class BaseScraper(abc.ABC):
     ) -> None:
         """Save metadata to a JSON file.
 
+        Uses orjson when it is installed, otherwise the standard library encoder.
+        Both write the same indented UTF-8 JSON: dates and times go through
+        ``str()`` on either path, and metadata orjson cannot encode (integers
+        wider than 64 bits) is written by the standard library. Floats are the
+        exception: orjson spells exponents as ``1e-5`` rather than ``1e-05`` and
+        writes NaN as ``null``.
+
         Args:
             job_id: The job ID
             metadata: Metadata dictionary to save
@@ -141,6 +167,15 @@ class BaseScraper(abc.ABC):
         """
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if orjson is not None:
+            try:
+                data = orjson.dumps(metadata, default=str, option=_ORJSON_OPTIONS)
+            except TypeError:
+                pass
+            else:
+                file_path.write_bytes(data)
+                return
+
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
 
@@ -193,6 +228,74 @@ class BaseScraper(abc.ABC):
             conn.commit()
             return cursor.lastrowid
 
+    def save_file_records(self, job_id: str, records: list[dict[str, Any]]) -> None:
+        """Save several file records to the database in one transaction.
+
+        Args:
+            job_id: The job ID
+            records: File info dicts with file_path, file_type, file_size and
+                optional metadata keys
+        """
+        if not records:
+            return
+
+        with self.get_db_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO files
+                    (job_id, file_path, file_type, file_size, metadata_json, created_at)
+                VALUES (?, ?, ?, ?, ?, datetime('now'))
+                """,
+                [
+                    (
+                        job_id,
+                        record["file_path"],
+                        record["file_type"],
+                        record["file_size"],
+                        json.dumps(record["metadata"]) if record.get("metadata") else None,
+                    )
+                    for record in records
+                ],
+            )
+            conn.commit()
+
+    def _relative_path(self, path: str | Path) -> str:
+        """Get a path relative to the download root.
+
+        Paths built under ``download_dir`` share its string prefix, so slicing
+        it off avoids ``Path.relative_to`` for every saved file.
+
+        Args:
+            path: Path inside the download root
+
+        Returns:
+            Relative path string
+        """
+        path_str = str(path)
+        if path_str.startswith(self._download_dir_str):
+            return path_str[len(self._download_dir_str) :]
+        return os.path.relpath(path_str, self.download_dir)
+
+    def _file_info(self, path: Path, file_type: str) -> dict[str, Any] | None:
+        """Build a file info dict for a downloaded file with a single stat call.
+
+        Args:
+            path: Absolute path of the file
+            file_type: Type of file
+
+        Returns:
+            File info dict, or None if the file does not exist
+        """
+        try:
+            file_size = path.stat().st_size
+        except FileNotFoundError:
+            return None
+        return {
+            "file_path": self._relative_path(path),
+            "file_type": file_type,
+            "file_size": file_size,
+        }
+
     def get_file_size(self, path: Path) -> int:
         """Get file size safely.
 
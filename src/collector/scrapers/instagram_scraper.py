@@ -3,32 +3,189 @@
 from __future__ import annotations
 
 import base64
+import functools
+import hashlib
 import json
 import logging
 import os
-import random
-import tempfile
+import re
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, cast
 
 import instaloader
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from requests.adapters import HTTPAdapter
 
 from ..config import FILE_TYPE_IMAGE, FILE_TYPE_METADATA, FILE_TYPE_VIDEO
 from .base_scraper import BaseScraper
+from .rate_limiter import AdaptiveRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Concurrent CDN downloads for carousel posts, shared across scraper instances
+CAROUSEL_DOWNLOAD_WORKERS = 4
+
+# Same patterns Instaloader uses for Post.caption_hashtags / caption_mentions
+_HASHTAG_RE = re.compile(r"#(\w{1,150})")
+_MENTION_RE = re.compile(r"(?:^|\W|_)@(\w(?:(?:\w|(?:\.(?!\.))){0,28}\w)?)")
+
+# Extensions that identify downloaded videos, and sidecar files that are not media
+_VIDEO_SUFFIXES = frozenset({".mp4", ".mov", ".webm"})
+_SIDECAR_SUFFIXES = frozenset({".json", ".txt", ".xz", ".temp"})
+
+# File type by suffix for story, highlight and profile directory scans;
+# anything else is an image
+_EXT_TYPE = {".mp4": FILE_TYPE_VIDEO, ".mov": FILE_TYPE_VIDEO, ".json": FILE_TYPE_METADATA}
+
+# Keep-alive connections held by the Instaloader API session, per host
+HTTP_POOL_SIZE = 20
+
+_download_executor = ThreadPoolExecutor(
+    max_workers=CAROUSEL_DOWNLOAD_WORKERS, thread_name_prefix="collector-carousel"
+)
+
+# instagram.com/p/<shortcode>/ and instagram.com/reel/<shortcode>/
+_SHORTCODE_RE = re.compile(r"/(p|reel)/([^/?]+)")
+
+# The group that matches names the URL type; /tv/ links are not supported
+_URL_TYPE_RE = re.compile(
+    r"/(?P<post>p|reel)/|/(?P<stories>stories)/|/(?P<highlights>highlights)/|/(?P<unknown>tv)/"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _derive_fernet(key_str: str) -> Fernet:
+    """Derive a Fernet cipher from a passphrase.
+
+    Uses the same SHA-256 derivation as ``SessionManager`` so session files it
+    wrote can be decrypted here. Memoized because every scrape needs the cipher.
+
+    Args:
+        key_str: Passphrase from ``SCRAPER_SESSION_KEY``
+
+    Returns:
+        Fernet cipher for the passphrase
+    """
+    key_hash = hashlib.sha256(key_str.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key_hash))
+
+
+def _resolve_fernet(key_str: str) -> MultiFernet:
+    """Get the cipher for a configured session key.
+
+    Tries the SessionManager derivation first. If the key is already a valid
+    Fernet key (32 bytes, base64-encoded), it is also tried as-is.
+
+    Args:
+        key_str: Value of ``SCRAPER_SESSION_KEY``
+
+    Returns:
+        Cipher that decrypts with any candidate key
+    """
+    ciphers = [_derive_fernet(key_str)]
+    try:
+        if len(base64.urlsafe_b64decode(key_str)) == 32:
+            ciphers.append(Fernet(key_str))
+    except ValueError:
+        pass
+    return MultiFernet(ciphers)
+
+
+# Inode numbers identify files on POSIX; elsewhere they may be synthetic, so
+# directory snapshots fall back to file names.
+_SNAPSHOT_BY_INODE = os.name == "posix"
+
+
+def _entry_key(entry: os.DirEntry[str]) -> int | str:
+    """Get a key identifying a file in a single-directory snapshot.
+
+    Args:
+        entry: Directory entry
+
+    Returns:
+        Inode number on POSIX, otherwise the file name
+    """
+    return entry.inode() if _SNAPSHOT_BY_INODE else entry.name
+
+
+# Profile lookups are cached as plain profile data keyed by username and
+# session file mtime, so rotated cookies never reuse an old lookup and no
+# Instaloader context is kept alive by the cache.
+PROFILE_CACHE_TTL = 15 * 60
+PROFILE_CACHE_MAXSIZE = 256
+
+_profile_cache: dict[tuple[str, int | None], tuple[float, dict[str, Any]]] = {}
+_profile_cache_lock = threading.Lock()
+
+
+def _get_profile(
+    context: instaloader.InstaloaderContext, username: str, session_mtime_ns: int | None
+) -> instaloader.Profile:
+    """Look up a profile, reusing recent lookups made with the same session.
+
+    Results are cached for PROFILE_CACHE_TTL seconds. Failed lookups raise and
+    are not cached.
+
+    Args:
+        context: Instaloader context to bind the profile to
+        username: Instagram username
+        session_mtime_ns: Session file mtime in nanoseconds, or None without one
+
+    Returns:
+        Instagram profile
+    """
+    key = (username.lower(), session_mtime_ns)
+    now = time.monotonic()
+    with _profile_cache_lock:
+        entry = _profile_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return instaloader.Profile(context, dict(entry[1]))
+
+    profile = instaloader.Profile.from_username(context, username)
+    with _profile_cache_lock:
+        if len(_profile_cache) >= PROFILE_CACHE_MAXSIZE:
+            for stale_key in [k for k, (expiry, _) in _profile_cache.items() if expiry <= now]:
+                del _profile_cache[stale_key]
+            if len(_profile_cache) >= PROFILE_CACHE_MAXSIZE:
+                _profile_cache.clear()
+        _profile_cache[key] = (now + PROFILE_CACHE_TTL, dict(profile._node))
+    return profile
+
+
+# Idle Instaloader instances keyed by session file path and mtime. A scraper
+# takes one out for the length of a scrape and puts it back afterwards, so
+# back-to-back jobs reuse the decrypted session and Instaloader's request history
+# while concurrent jobs never share a loader, which is not thread-safe.
+LOADER_POOL_MAXSIZE = 4
+
+_LoaderKey = tuple[str | None, int | None]
+_idle_loaders: dict[_LoaderKey, list[instaloader.Instaloader]] = {}
+_idle_loaders_lock = threading.Lock()
+
 
 class InstagramScraper(BaseScraper):
     """Scraper for Instagram content using Instaloader."""
 
+    # URL type -> name of the method that scrapes it
+    _DISPATCH: dict[str, str] = {
+        "profile": "_scrape_profile",
+        "post": "_scrape_post",
+        "stories": "_scrape_stories",
+        "highlights": "_scrape_highlights",
+    }
+
     def __init__(
         self,
         *args,
         min_delay: float = 5.0,
         max_delay: float = 10.0,
         session_file: Path | None = None,
+        since: datetime | None = None,
         **kwargs,
     ):
         """Initialize Instagram scraper.
@@ -37,12 +194,19 @@ class InstagramScraper(BaseScraper):
             min_delay: Minimum delay between requests in seconds
             max_delay: Maximum delay between requests in seconds
             session_file: Path to encrypted session file for authentication
+            since: Only download profile posts published at or after this time
         """
         super().__init__(*args, **kwargs)
         self.min_delay = min_delay
         self.max_delay = max_delay
+        self._rate_limiter = AdaptiveRateLimiter(min_delay, max_delay)
         self.session_file = session_file
+        # Instaloader reports post dates as naive UTC datetimes
+        if since is not None and since.tzinfo is not None:
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+        self.since = since
         self._use_gallery_dl = False
+        self._loader: tuple[_LoaderKey, instaloader.Instaloader] | None = None
 
     def scrape(self, url: str, job_id: str) -> dict[str, Any]:
         """Scrape Instagram content from URL.
@@ -69,23 +233,21 @@ class InstagramScraper(BaseScraper):
             # Detect URL type
             url_type = self._detect_url_type(url)
 
-            if url_type == "profile":
-                return self._scrape_profile(url, job_id)
-            elif url_type == "post":
-                return self._scrape_post(url, job_id)
-            elif url_type == "stories":
-                return self._scrape_stories(url, job_id)
-            elif url_type == "highlights":
-                return self._scrape_highlights(url, job_id)
-            else:
+            handler = self._DISPATCH.get(url_type)
+            if handler is None:
                 scrape_result["error"] = f"Unsupported URL type: {url_type}"
                 return scrape_result
 
+            return getattr(self, handler)(url, job_id)
+
         except Exception as e:
             logger.exception("Error scraping Instagram URL: %s", url)
             scrape_result["error"] = str(e)
             return scrape_result
 
+        finally:
+            self._release_instaloader()
+
     def _detect_url_type(self, url: str) -> str:
         """Detect the type of Instagram URL.
 
@@ -95,24 +257,48 @@ class InstagramScraper(BaseScraper):
         Returns:
             URL type: 'profile', 'post', 'stories', 'highlights', 'unknown'
         """
-        if "/p/" in url or "/reel/" in url:
-            return "post"
-        elif "/stories/" in url:
-            return "stories"
-        elif "/highlights/" in url:
-            return "highlights"
-        elif "instagram.com/" in url and not any(
-            x in url for x in ["/p/", "/reel/", "/tv/", "/stories/", "/highlights/"]
-        ):
+        match = _URL_TYPE_RE.search(url)
+        if match:
+            return cast(str, match.lastgroup)
+        if "instagram.com/" in url:
             return "profile"
         return "unknown"
 
+    def _session_mtime(self) -> int | None:
+        """Get the modification time of the session file.
+
+        Returns:
+            Session file mtime in nanoseconds, or None if there is no session file
+        """
+        if not self.session_file:
+            return None
+        try:
+            return self.session_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
     def _get_instaloader(self) -> instaloader.Instaloader:
         """Get configured Instaloader instance.
 
+        The loader is kept by the scraper until :meth:`_release_instaloader`
+        returns it to the shared idle pool. An idle loader built from the same
+        session file and mtime is reused, so the session is decrypted once and
+        Instaloader keeps its request history across jobs.
+
         Returns:
             Configured Instaloader instance
         """
+        session_mtime = self._session_mtime()
+        key = (str(self.session_file) if self.session_file else None, session_mtime)
+        if self._loader is not None and self._loader[0] == key:
+            return self._loader[1]
+
+        with _idle_loaders_lock:
+            idle = _idle_loaders.get(key)
+            if idle:
+                self._loader = (key, idle.pop())
+                return self._loader[1]
+
         loader = instaloader.Instaloader(
             download_videos=True,
             download_video_thumbnails=False,
@@ -125,13 +311,10 @@ class InstagramScraper(BaseScraper):
         )
 
         # Load session if available
-        if self.session_file and self.session_file.exists():
+        if self.session_file and session_mtime is not None:
             try:
                 # The session file is encrypted from our session_manager
                 # We need to decrypt it first before passing to Instaloader
-                # But Instaloader expects a specific format, so we decrypt to a temp file
-                from cryptography.fernet import Fernet, InvalidToken
-
                 # Read encrypted session
                 with open(self.session_file, "rb") as f:
                     encrypted_data = f.read()
@@ -140,47 +323,7 @@ class InstagramScraper(BaseScraper):
                 # We'll need the encryption key - check env var
                 key_str = os.environ.get("SCRAPER_SESSION_KEY")
                 if key_str:
-                    from cryptography.hazmat.primitives import hashes
-                    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-
-                    # Derive proper Fernet key
-                    key_bytes = key_str.encode()
-
-                    # Check if key_str is already a valid Fernet key (32 bytes base64-encoded)
-                    try:
-                        # Try to decode - if successful and length is 32, it's already a Fernet key
-                        decoded = base64.urlsafe_b64decode(key_str)
-                        if len(decoded) == 32:
-                            # Already a valid Fernet key
-                            fernet_key = key_str
-                        else:
-                            # Not a valid Fernet key, derive one from passphrase
-                            import secrets
-
-                            salt = secrets.token_bytes(16)  # Generate random salt
-                            kdf = PBKDF2HMAC(
-                                algorithm=hashes.SHA256(),
-                                length=32,
-                                salt=salt,
-                                iterations=100000,
-                            )
-                            derived_key = kdf.derive(key_bytes)
-                            fernet_key = base64.urlsafe_b64encode(derived_key).decode()
-                    except Exception:
-                        # If decoding fails, derive a key from the passphrase
-                        import secrets
-
-                        salt = secrets.token_bytes(16)  # Generate random salt
-                        kdf = PBKDF2HMAC(
-                            algorithm=hashes.SHA256(),
-                            length=32,
-                            salt=salt,
-                            iterations=100000,
-                        )
-                        derived_key = kdf.derive(key_bytes)
-                        fernet_key = base64.urlsafe_b64encode(derived_key).decode()
-
-                    cipher = Fernet(fernet_key)
+                    cipher = _resolve_fernet(key_str)
 
                     try:
                         decrypted_json = cipher.decrypt(encrypted_data)
@@ -189,22 +332,13 @@ class InstagramScraper(BaseScraper):
                         # Extract username from session data if available
                         username = session_data.get("username", "instagram_user")
 
-                        # Create a temporary session file in Instaloader's format
-                        # Instaloader expects: username -> session file with cookies
-                        with tempfile.NamedTemporaryFile(
-                            mode="w", delete=False, suffix=".json"
-                        ) as tmp:
-                            tmp.write(json.dumps(session_data.get("cookies", {})))
-                            tmp_path = Path(tmp.name)
-
-                        # Load session with Instaloader using the actual username
-                        loader.load_session_from_file(username, str(tmp_path))
+                        # Inject the cookies in memory so the plaintext never touches disk
+                        self._load_session_cookies(
+                            loader, username, session_data.get("cookies", [])
+                        )
                         logger.info(
                             "Loaded encrypted Instagram session from file for user %s", username
                         )
-
-                        # Clean up temp file
-                        tmp_path.unlink()
                     except InvalidToken:
                         logger.warning("Could not decrypt session file (wrong key?)")
                     except Exception as e:
@@ -215,8 +349,68 @@ class InstagramScraper(BaseScraper):
             except Exception as e:
                 logger.warning("Could not load session file: %s", e)
 
+        # Keep more connections alive on the API session
+        session = cast(Any, loader.context)._session
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=0
+            ),
+        )
+
+        self._loader = (key, loader)
         return loader
 
+    def _release_instaloader(self) -> None:
+        """Return this scraper's loader to the idle pool for later scrapes.
+
+        Loaders for an older mtime of the same session file are dropped.
+        """
+        if self._loader is None:
+            return
+        key, loader = self._loader
+        self._loader = None
+
+        with _idle_loaders_lock:
+            for stale_key in [k for k in _idle_loaders if k[0] == key[0] and k != key]:
+                del _idle_loaders[stale_key]
+            idle = _idle_loaders.setdefault(key, [])
+            if len(idle) < LOADER_POOL_MAXSIZE:
+                idle.append(loader)
+
+    @staticmethod
+    def _load_session_cookies(
+        loader: instaloader.Instaloader,
+        username: str,
+        cookies: list[dict[str, Any]] | dict[str, str],
+    ) -> None:
+        """Authenticate an Instaloader context with stored session cookies.
+
+        Args:
+            loader: Instaloader instance
+            username: Username the session belongs to
+            cookies: Cookie dicts as saved by ``SessionManager``, or a name to
+                value mapping
+        """
+        if isinstance(cookies, dict):
+            cookies = [{"name": name, "value": value} for name, value in cookies.items()]
+
+        context = cast(Any, loader.context)
+        session = context._session
+        # Swap the anonymous placeholders for the logged-in headers and cookies
+        session.headers.update(context._default_http_header())
+        session.cookies.clear()
+        for cookie in cookies:
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+            if cookie["name"] == "csrftoken":
+                session.headers["X-CSRFToken"] = cookie["value"]
+        context.username = username
+
     def _scrape_profile(self, url: str, job_id: str) -> dict[str, Any]:
         """Scrape all posts from an Instagram profile.
 
@@ -250,7 +444,7 @@ class InstagramScraper(BaseScraper):
             loader = self._get_instaloader()
 
             try:
-                profile = instaloader.Profile.from_username(loader.context, username)
+                profile = _get_profile(loader.context, username, self._session_mtime())
             except Exception as e:
                 error_msg = str(e)
                 if "401" in error_msg or "404" in error_msg or "429" in error_msg:
@@ -282,50 +476,79 @@ class InstagramScraper(BaseScraper):
 
             self.update_progress(15, "Downloading profile posts")
 
-            posts = list(profile.get_posts())
-            total = len(posts)
+            # Iterate lazily so downloads start with the first page of posts;
+            # mediacount is the expected total for progress reporting
+            total = profile_metadata["posts_count"] or 0
             downloaded = 0
             failed = 0
 
-            for post_index, post in enumerate(posts):
+            for post_index, post in enumerate(profile.get_posts()):
+                shortcode = post.shortcode
+                if self.since and post.date_utc < self.since:
+                    # Posts arrive newest first, apart from pinned posts
+                    if post.is_pinned:
+                        continue
+                    break
+
                 try:
+                    post_dir = output_dir / f"{shortcode}_{post.date_utc.strftime('%Y%m%d_%H%M%S')}"
+
+                    # Metadata is only written once every media item of the post
+                    # is on disk, so its presence means an earlier scrape got
+                    # all of them; skip the post without any requests
+                    if (post_dir / "metadata.json").exists():
+                        downloaded += 1
+                        continue
+
                     # Rate limiting
                     if post_index > 0:
-                        delay = random.uniform(self.min_delay, self.max_delay)
+                        delay = self._rate_limiter.next_delay()
                         self.update_progress(
-                            int((post_index / total) * 90) + 10,
+                            min(int((post_index / max(total, 1)) * 90), 89) + 10,
                             f"Downloading post {post_index + 1}/{total} (waiting {delay:.1f}s)...",
                         )
-                        time.sleep(delay)
+                    self._rate_limiter.acquire()
 
                     # Download post
-                    post_dir = (
-                        output_dir / f"{post.shortcode}_{post.date_utc.strftime('%Y%m%d_%H%M%S')}"
-                    )
                     post_dir.mkdir(exist_ok=True)
 
                     # Download media
-                    downloaded_files = self._download_post_media(loader, post, post_dir, job_id)
+                    downloaded_files, complete = self._download_post_media(
+                        loader, post, post_dir, job_id
+                    )
                     scrape_result["files"].extend(downloaded_files)
+                    records = list(downloaded_files)
+
+                    if not complete:
+                        # Leave metadata unwritten so a later scrape retries the post
+                        logger.warning("Incomplete media download for post %s", shortcode)
+                        self.save_file_records(job_id, records)
+                        failed += 1
+                        continue
 
                     # Save post metadata
                     post_metadata = self._extract_post_metadata(post)
                     metadata_path = post_dir / "metadata.json"
                     self.save_metadata(job_id, post_metadata, metadata_path)
 
-                    if metadata_path.exists():
-                        self.save_file_record(
-                            job_id,
-                            str(metadata_path.relative_to(self.download_dir)),
-                            FILE_TYPE_METADATA,
-                            metadata_path.stat().st_size,
-                            post_metadata,
-                        )
+                    metadata_info = self._file_info(metadata_path, FILE_TYPE_METADATA)
+                    if metadata_info:
+                        metadata_info["metadata"] = post_metadata
+                        records.append(metadata_info)
+
+                    # Record the post's files in one transaction
+                    self.save_file_records(job_id, records)
 
                     downloaded += 1
+                    self._rate_limiter.on_success()
 
+                except instaloader.TooManyRequestsException as e:
+                    logger.warning("Rate limited on post %s: %s", shortcode, e)
+                    self._rate_limiter.on_rate_limited()
+                    failed += 1
+                    continue
                 except Exception as e:
-                    logger.warning("Failed to download post %s: %s", post.shortcode, e)
+                    logger.warning("Failed to download post %s: %s", shortcode, e)
                     failed += 1
                     continue
 
@@ -333,12 +556,13 @@ class InstagramScraper(BaseScraper):
             profile_metadata_path = output_dir / "profile_metadata.json"
             self.save_metadata(job_id, profile_metadata, profile_metadata_path)
 
-            if profile_metadata_path.exists():
+            profile_metadata_info = self._file_info(profile_metadata_path, FILE_TYPE_METADATA)
+            if profile_metadata_info:
                 self.save_file_record(
                     job_id,
-                    str(profile_metadata_path.relative_to(self.download_dir)),
+                    profile_metadata_info["file_path"],
                     FILE_TYPE_METADATA,
-                    profile_metadata_path.stat().st_size,
+                    profile_metadata_info["file_size"],
                     profile_metadata,
                 )
 
@@ -395,8 +619,9 @@ class InstagramScraper(BaseScraper):
             self.update_progress(30, "Downloading media")
 
             # Download media
-            downloaded_files = self._download_post_media(loader, post, post_dir, job_id)
+            downloaded_files, _ = self._download_post_media(loader, post, post_dir, job_id)
             scrape_result["files"].extend(downloaded_files)
+            records = list(downloaded_files)
 
             self.update_progress(70, "Saving metadata")
 
@@ -405,14 +630,13 @@ class InstagramScraper(BaseScraper):
             metadata_path = post_dir / "metadata.json"
             self.save_metadata(job_id, post_metadata, metadata_path)
 
-            if metadata_path.exists():
-                self.save_file_record(
-                    job_id,
-                    str(metadata_path.relative_to(self.download_dir)),
-                    FILE_TYPE_METADATA,
-                    metadata_path.stat().st_size,
-                    post_metadata,
-                )
+            metadata_info = self._file_info(metadata_path, FILE_TYPE_METADATA)
+            if metadata_info:
+                metadata_info["metadata"] = post_metadata
+                records.append(metadata_info)
+
+            # Record the post's files in one transaction
+            self.save_file_records(job_id, records)
 
             scrape_result["metadata"] = post_metadata
             scrape_result["success"] = True
@@ -431,7 +655,7 @@ class InstagramScraper(BaseScraper):
         post: instaloader.Post,
         output_dir: Path,
         job_id: str,
-    ) -> list[dict[str, Any]]:
+    ) -> tuple[list[dict[str, Any]], bool]:
         """Download media files from a post.
 
         Args:
@@ -441,13 +665,17 @@ class InstagramScraper(BaseScraper):
             job_id: Job ID
 
         Returns:
-            List of file info dicts
+            Tuple of (file info dicts not yet recorded in the database, whether
+            every media item of the post was downloaded)
         """
         downloaded_files = []
+        shortcode = post.shortcode
+        complete = False
 
         try:
             if post.typename == "GraphSidecar":
                 # Carousel with multiple items
+                items = []
                 for carousel_index, sidecar_node in enumerate(post.get_sidecar_nodes()):
                     if sidecar_node.is_video:
                         url = sidecar_node.video_url
@@ -459,87 +687,102 @@ class InstagramScraper(BaseScraper):
                         file_type = FILE_TYPE_IMAGE
 
                     filename = f"{carousel_index + 1}.{file_extension}"
-                    filepath = output_dir / filename
+                    items.append((url, output_dir / filename, file_type))
 
-                    # Download file
-                    context = cast(Any, loader.context)
-                    context.download_pic(
-                        filename=str(filepath), url=url, mtime=post.date_local.timestamp()
-                    )
-
-                    if filepath.exists():
-                        self.save_file_record(
-                            job_id,
-                            str(filepath.relative_to(self.download_dir)),
-                            file_type,
-                            filepath.stat().st_size,
-                        )
-                        downloaded_files.append(
-                            {
-                                "file_path": str(filepath.relative_to(self.download_dir)),
-                                "file_type": file_type,
-                                "file_size": filepath.stat().st_size,
-                            }
-                        )
-
-            elif post.is_video:
-                # Single video
-                filepath = output_dir / f"video.{post.url.split('.')[-1].split('?')[0]}"
-                loader.download_post(post, target=str(output_dir))
-
-                # Find the downloaded video file
-                for ext in ["mp4", "mov"]:
-                    potential_file = output_dir / f"video.{ext}"
-                    if potential_file.exists():
-                        filepath = potential_file
-                        break
-
-                if filepath.exists():
-                    self.save_file_record(
-                        job_id,
-                        str(filepath.relative_to(self.download_dir)),
-                        FILE_TYPE_VIDEO,
-                        filepath.stat().st_size,
-                    )
-                    downloaded_files.append(
-                        {
-                            "file_path": str(filepath.relative_to(self.download_dir)),
-                            "file_type": FILE_TYPE_VIDEO,
-                            "file_size": filepath.stat().st_size,
-                        }
+                # CDN fetches are independent of the API session, so run them concurrently
+                mtime = post.date_local.timestamp()
+                futures = [
+                    _download_executor.submit(
+                        self._download_carousel_item, loader, url, filepath, mtime
                     )
+                    for url, filepath, _ in items
+                ]
+                complete = all([future.result() for future in futures])
+
+                for _, filepath, file_type in items:
+                    file_info = self._file_info(filepath, file_type)
+                    if file_info:
+                        downloaded_files.append(file_info)
+                    else:
+                        complete = False
 
             else:
-                # Single image
-                filepath = output_dir / "photo.jpg"
+                # Single video or image, named by Instaloader's filename pattern
                 loader.download_post(post, target=str(output_dir))
 
-                # Find the downloaded image file
-                for ext in ["jpg", "webp", "png"]:
-                    potential_file = output_dir / f"photo.{ext}"
-                    if potential_file.exists():
-                        filepath = potential_file
-                        break
-
-                if filepath.exists():
-                    self.save_file_record(
-                        job_id,
-                        str(filepath.relative_to(self.download_dir)),
-                        FILE_TYPE_IMAGE,
-                        filepath.stat().st_size,
-                    )
+                entry = self._newest_media_entry(output_dir)
+                if entry:
+                    suffix = os.path.splitext(entry.name)[1].lower()
                     downloaded_files.append(
                         {
-                            "file_path": str(filepath.relative_to(self.download_dir)),
-                            "file_type": FILE_TYPE_IMAGE,
-                            "file_size": filepath.stat().st_size,
+                            "file_path": self._relative_path(entry.path),
+                            "file_type": (
+                                FILE_TYPE_VIDEO if suffix in _VIDEO_SUFFIXES else FILE_TYPE_IMAGE
+                            ),
+                            "file_size": entry.stat().st_size,
                         }
                     )
+                    complete = True
 
+        except instaloader.TooManyRequestsException:
+            raise
         except Exception as e:
-            logger.error("Error downloading media for post %s: %s", post.shortcode, e)
+            logger.error("Error downloading media for post %s: %s", shortcode, e)
+            complete = False
+
+        return downloaded_files, complete
+
+    @staticmethod
+    def _newest_media_entry(directory: Path) -> os.DirEntry[str] | None:
+        """Find the most recently modified media file in a directory.
+
+        Args:
+            directory: Directory to scan
+
+        Returns:
+            Directory entry of the newest non-sidecar file, or None if there is none
+        """
+        newest = None
+        newest_mtime = 0.0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if os.path.splitext(entry.name)[1].lower() in _SIDECAR_SUFFIXES:
+                    continue
+                mtime = entry.stat().st_mtime
+                if newest is None or mtime > newest_mtime:
+                    newest, newest_mtime = entry, mtime
+        return newest
+
+    @staticmethod
+    def _download_carousel_item(
+        loader: instaloader.Instaloader, url: str, filepath: Path, mtime: float
+    ) -> bool:
+        """Download one carousel item from the CDN.
 
-        return downloaded_files
+        Runs on a worker thread; Instaloader fetches CDN URLs through a fresh
+        anonymous session per call, so concurrent downloads do not share state.
+
+        Args:
+            loader: Instaloader instance
+            url: Media URL
+            filepath: Destination path
+            mtime: Modification time to stamp on the file
+
+        Returns:
+            True if the file exists after the call
+        """
+        if filepath.exists():
+            return True
+        try:
+            response = loader.context.get_raw(url)
+            loader.context.write_raw(response, str(filepath))
+            os.utime(filepath, (mtime, mtime))
+        except Exception as e:
+            logger.warning("Failed to download carousel item %s: %s", filepath.name, e)
+            return False
+        return True
 
     def _extract_post_metadata(self, post: instaloader.Post) -> dict[str, Any]:
         """Extract metadata from a post.
@@ -550,31 +793,37 @@ class InstagramScraper(BaseScraper):
         Returns:
             Metadata dictionary
         """
-        # Extract hashtags
-        hashtags = [tag.strip("#") for tag in post.caption_hashtags if tag]
-
-        # Extract mentions
-        mentions = [mention.strip("@") for mention in post.caption_mentions if mention]
+        # Bind properties read more than once
+        caption = post.caption
+        shortcode = post.shortcode
+        is_video = post.is_video
+        date_utc = post.date_utc
+        date_local = post.date_local
+
+        # Extract lowercased hashtags and mentions from one pass over the caption
+        lowered_caption = caption.lower() if caption else ""
+        hashtags = _HASHTAG_RE.findall(lowered_caption)
+        mentions = _MENTION_RE.findall(lowered_caption)
 
         metadata = {
             "platform": "instagram",
-            "shortcode": post.shortcode,
-            "url": f"https://www.instagram.com/p/{post.shortcode}/",
+            "shortcode": shortcode,
+            "url": f"https://www.instagram.com/p/{shortcode}/",
             "type": post.typename,
             "owner": {
                 "username": post.owner_username,
                 "id": post.owner_id,
             },
-            "caption": post.caption,
+            "caption": caption,
             "hashtags": hashtags,
             "mentions": mentions,
-            "date_utc": post.date_utc.isoformat() if post.date_utc else None,
-            "date_local": post.date_local.isoformat() if post.date_local else None,
+            "date_utc": date_utc.isoformat() if date_utc else None,
+            "date_local": date_local.isoformat() if date_local else None,
             "likes": post.likes,
             "comments": post.comments,
-            "is_video": post.is_video,
-            "video_url": post.video_url if post.is_video else None,
-            "video_view_count": post.video_view_count if post.is_video else None,
+            "is_video": is_video,
+            "video_url": post.video_url if is_video else None,
+            "video_view_count": post.video_view_count if is_video else None,
             "display_url": post.url,
             "sponsored": post.is_sponsored,
             "location": post.location.name if post.location else None,
@@ -615,11 +864,7 @@ class InstagramScraper(BaseScraper):
         Returns:
             Shortcode or None
         """
-        # instagram.com/p/shortcode/
-        # instagram.com/reel/shortcode/
-        import re
-
-        match = re.search(r"/(p|reel)/([^/?]+)", url)
+        match = _SHORTCODE_RE.search(url)
         if match:
             return match.group(2)
         return None
@@ -636,31 +881,46 @@ class InstagramScraper(BaseScraper):
         """
         files = []
         try:
-            for file_path in directory.iterdir():
-                if file_path.is_file() and file_path.name not in ["metadata.json", ".json"]:
-                    file_type = FILE_TYPE_IMAGE  # Default
-                    if file_path.suffix in [".mp4", ".mov"]:
-                        file_type = FILE_TYPE_VIDEO
-                    elif file_path.suffix == ".json":
-                        file_type = FILE_TYPE_METADATA
-
-                    self.save_file_record(
-                        job_id,
-                        str(file_path.relative_to(self.download_dir)),
-                        file_type,
-                        file_path.stat().st_size,
-                    )
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file() or entry.name in ("metadata.json", ".json"):
+                        continue
+
+                    suffix = os.path.splitext(entry.name)[1]
                     files.append(
                         {
-                            "file_path": str(file_path.relative_to(self.download_dir)),
-                            "file_type": file_type,
-                            "file_size": file_path.stat().st_size,
+                            "file_path": self._relative_path(entry.path),
+                            "file_type": _EXT_TYPE.get(suffix, FILE_TYPE_IMAGE),
+                            "file_size": entry.stat().st_size,
                         }
                     )
         except FileNotFoundError:
             pass
+        self.save_file_records(job_id, files)
         return files
 
+    @staticmethod
+    def _iter_files(directory: Path) -> Iterator[os.DirEntry[str]]:
+        """Walk a directory tree with scandir, yielding file entries.
+
+        Args:
+            directory: Directory to walk
+
+        Yields:
+            Directory entries of regular files
+        """
+        stack = [str(directory)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except FileNotFoundError:
+                continue
+
     def _scrape_stories(self, url: str, job_id: str) -> dict[str, Any]:
         """Scrape Instagram stories from a URL.
 
@@ -698,7 +958,7 @@ class InstagramScraper(BaseScraper):
             loader = self._get_instaloader()
 
             try:
-                profile = instaloader.Profile.from_username(loader.context, username)
+                profile = _get_profile(loader.context, username, self._session_mtime())
             except Exception as e:
                 error_msg = str(e)
                 if "401" in error_msg or "404" in error_msg:
@@ -710,9 +970,11 @@ class InstagramScraper(BaseScraper):
             output_dir.mkdir(parents=True, exist_ok=True)
 
             # Get available stories
-            from instaloader.stories import stories  # type: ignore
-
-            story_items = list(stories([profile.userid], loader.context))
+            story_items = [
+                item
+                for story in loader.get_stories(userids=[profile.userid])
+                for item in story.get_items()
+            ]
 
             if not story_items:
                 scrape_result["error"] = "No stories available for this user"
@@ -722,61 +984,50 @@ class InstagramScraper(BaseScraper):
             downloaded = 0
 
             # Track files before downloading to identify new ones
-            existing_files = set()
-            for file_path in output_dir.rglob("*"):
-                if file_path.is_file():
-                    existing_files.add(str(file_path))
+            existing_files = {entry.path for entry in self._iter_files(output_dir)}
 
             for item_index, story_item in enumerate(story_items):
                 try:
                     if item_index > 0:
-                        delay = random.uniform(self.min_delay, self.max_delay)
                         self.update_progress(
                             int((item_index / total) * 90) + 10,
                             f"Downloading story {item_index + 1}/{total}",
                         )
-                        time.sleep(delay)
+                    self._rate_limiter.acquire()
 
                     # Download story using Instaloader
                     loader.download_storyitem(story_item, target=str(output_dir))
 
                     downloaded += 1
+                    self._rate_limiter.on_success()
 
+                except instaloader.TooManyRequestsException as e:
+                    logger.warning("Rate limited on story item: %s", e)
+                    self._rate_limiter.on_rate_limited()
+                    continue
                 except Exception as e:
                     logger.warning("Failed to download story item: %s", e)
                     continue
 
             # Find newly downloaded files
             new_files = []
-            for file_path in output_dir.rglob("*"):
-                if file_path.is_file() and str(file_path) not in existing_files:
-                    file_type = FILE_TYPE_IMAGE
-                    if file_path.suffix in [".mp4", ".mov"]:
-                        file_type = FILE_TYPE_VIDEO
+            metadata_files = []
+            for entry in self._iter_files(output_dir):
+                if entry.path in existing_files:
+                    continue
 
-                    rel_path = str(file_path.relative_to(self.download_dir))
-                    self.save_file_record(
-                        job_id,
-                        rel_path,
-                        file_type,
-                        file_path.stat().st_size,
-                    )
-                    new_files.append(
-                        {
-                            "file_path": rel_path,
-                            "file_type": file_type,
-                            "file_size": file_path.stat().st_size,
-                        }
-                    )
-                elif str(file_path) not in existing_files and file_path.suffix == ".json":
-                    # Handle metadata files
-                    rel_path = str(file_path.relative_to(self.download_dir))
-                    self.save_file_record(
-                        job_id,
-                        rel_path,
-                        FILE_TYPE_METADATA,
-                        file_path.stat().st_size,
-                    )
+                file_type = _EXT_TYPE.get(os.path.splitext(entry.name)[1], FILE_TYPE_IMAGE)
+                file_info = {
+                    "file_path": self._relative_path(entry.path),
+                    "file_type": file_type,
+                    "file_size": entry.stat().st_size,
+                }
+                if file_type == FILE_TYPE_METADATA:
+                    metadata_files.append(file_info)
+                else:
+                    new_files.append(file_info)
+
+            self.save_file_records(job_id, new_files + metadata_files)
 
             scrape_result["files"] = new_files
             scrape_result["success"] = True
@@ -832,7 +1083,7 @@ class InstagramScraper(BaseScraper):
             loader = self._get_instaloader()
 
             try:
-                profile = instaloader.Profile.from_username(loader.context, username)
+                profile = _get_profile(loader.context, username, self._session_mtime())
             except Exception as e:
                 error_msg = str(e)
                 if "401" in error_msg or "404" in error_msg:
@@ -854,62 +1105,26 @@ class InstagramScraper(BaseScraper):
             downloaded = 0
             all_files = []
 
+            # Reels download one after another: they share one Instaloader,
+            # whose context and HTTP session are not thread-safe
             for reel_index, highlight_reel in enumerate(highlights):
+                highlight_title = highlight_reel.title or f"Highlight {reel_index + 1}"
+                self.update_progress(
+                    int((reel_index / total) * 90) + 10, f"Downloading: {highlight_title}"
+                )
+                sanitized_title = self.sanitize_filename(highlight_title, max_length=100)
+                highlight_dir = output_dir / sanitized_title
+                highlight_dir.mkdir(exist_ok=True)
+
                 try:
-                    highlight_title = highlight_reel.title or f"Highlight {reel_index + 1}"
-                    self.update_progress(
-                        int((reel_index / total) * 90) + 10,
-                        f"Downloading: {highlight_title}",
+                    all_files.extend(
+                        self._download_highlight_reel(loader, highlight_reel, highlight_dir, job_id)
                     )
-
-                    # Create directory for this highlight
-                    sanitized_title = self.sanitize_filename(highlight_title, max_length=100)
-                    highlight_dir = output_dir / sanitized_title
-                    highlight_dir.mkdir(exist_ok=True)
-
-                    # Track files before downloading
-                    existing_files = set()
-                    for file_path in highlight_dir.iterdir():
-                        if file_path.is_file():
-                            existing_files.add(str(file_path))
-
-                    # Download items in this highlight reel
-                    for item in highlight_reel.get_items():
-                        loader.download_storyitem(item, target=str(highlight_dir))
-
-                    # Find new files
-                    for file_path in highlight_dir.iterdir():
-                        if file_path.is_file() and str(file_path) not in existing_files:
-                            file_type = FILE_TYPE_IMAGE
-                            if file_path.suffix in [".mp4", ".mov"]:
-                                file_type = FILE_TYPE_VIDEO
-                            elif file_path.suffix == ".json":
-                                file_type = FILE_TYPE_METADATA
-
-                            rel_path = str(file_path.relative_to(self.download_dir))
-                            self.save_file_record(
-                                job_id,
-                                rel_path,
-                                file_type,
-                                file_path.stat().st_size,
-                            )
-                            all_files.append(
-                                {
-                                    "file_path": rel_path,
-                                    "file_type": file_type,
-                                    "file_size": file_path.stat().st_size,
-                                }
-                            )
-
                     downloaded += 1
-
-                    if reel_index < total - 1:
-                        delay = random.uniform(self.min_delay, self.max_delay)
-                        time.sleep(delay)
-
+                except instaloader.TooManyRequestsException as e:
+                    logger.warning("Rate limited on highlight reel: %s", e)
                 except Exception as e:
                     logger.warning("Failed to download highlight reel: %s", e)
-                    continue
 
             scrape_result["files"] = all_files
             scrape_result["success"] = True
@@ -928,3 +1143,56 @@ class InstagramScraper(BaseScraper):
             logger.exception("Error scraping Instagram highlights: %s", url)
             scrape_result["error"] = str(e)
             return scrape_result
+
+    def _download_highlight_reel(
+        self,
+        loader: instaloader.Instaloader,
+        highlight_reel: Any,
+        highlight_dir: Path,
+        job_id: str,
+    ) -> list[dict[str, Any]]:
+        """Download one highlight reel and record its new files.
+
+        Every story item download is paced by the scraper's rate limiter.
+
+        Args:
+            loader: Configured Instaloader instance
+            highlight_reel: Instaloader highlight reel
+            highlight_dir: Directory for this reel's files
+            job_id: Job ID for file records
+
+        Returns:
+            File info dicts for files added by this reel
+        """
+        # Track files before downloading
+        with os.scandir(highlight_dir) as entries:
+            existing = {_entry_key(entry) for entry in entries if entry.is_file()}
+
+        # Download items in this highlight reel
+        for item in highlight_reel.get_items():
+            self._rate_limiter.acquire()
+            try:
+                loader.download_storyitem(item, target=str(highlight_dir))
+            except instaloader.TooManyRequestsException:
+                self._rate_limiter.on_rate_limited()
+                raise
+            self._rate_limiter.on_success()
+
+        # Find new files in a single pass, reusing each entry's stat
+        reel_files = []
+        with os.scandir(highlight_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or _entry_key(entry) in existing:
+                    continue
+
+                suffix = os.path.splitext(entry.name)[1]
+                reel_files.append(
+                    {
+                        "file_path": self._relative_path(entry.path),
+                        "file_type": _EXT_TYPE.get(suffix, FILE_TYPE_IMAGE),
+                        "file_size": entry.stat().st_size,
+                    }
+                )
+
+        self.save_file_records(job_id, reel_files)
+        return reel_files
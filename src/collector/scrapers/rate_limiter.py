@@ -0,0 +1,95 @@
+"""Adaptive request pacing for scrapers."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+# Upper bound for the interval after repeated rate-limit responses (seconds)
+MAX_BACKOFF_SECONDS = 60.0
+
+# Factor applied to the interval after each successful request
+SUCCESS_DECAY = 0.9
+
+# Relative jitter applied to each scheduled interval
+JITTER_RATIO = 0.2
+
+
+class AdaptiveRateLimiter:
+    """Pace requests, speeding up on success and backing off on rate limits.
+
+    The interval starts at ``max_delay`` and decays towards ``min_delay`` while
+    requests succeed. Each rate-limit response doubles it, up to
+    ``max_backoff``. The wait is measured from the last request, so time spent
+    downloading counts towards the next delay. The limiter may be shared
+    between threads: all state changes happen under one lock, and concurrent
+    callers of :meth:`acquire` are spaced at least ``min_delay`` apart.
+    """
+
+    def __init__(
+        self,
+        min_delay: float,
+        max_delay: float,
+        max_backoff: float = MAX_BACKOFF_SECONDS,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            min_delay: Smallest interval between requests in seconds
+            max_delay: Initial interval between requests in seconds
+            max_backoff: Largest interval after rate-limit responses in seconds
+        """
+        self.min_delay = min_delay
+        self.max_backoff = max(max_backoff, max_delay)
+        self._interval = max(max_delay, min_delay)
+        self._next_at = 0.0
+        self._reserved_at = 0.0
+        self._lock = threading.Lock()
+        self.consecutive_rate_limits = 0
+
+    def next_delay(self) -> float:
+        """Get the time left before the next request may be made.
+
+        Returns:
+            Seconds to wait, or 0 if a request may be made now
+        """
+        with self._lock:
+            next_at = max(self._next_at, self._reserved_at)
+        return max(0.0, next_at - time.monotonic())
+
+    def acquire(self) -> None:
+        """Block until the next request may be made.
+
+        The slot is reserved before sleeping, so threads sharing the limiter
+        queue up behind each other instead of all waking at once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at, self._reserved_at)
+            self._reserved_at = start + self.min_delay
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        """Record a successful request and shorten the interval."""
+        with self._lock:
+            self.consecutive_rate_limits = 0
+            self._interval = max(self.min_delay, self._interval * SUCCESS_DECAY)
+            self._schedule()
+
+    def on_rate_limited(self) -> None:
+        """Record a rate-limit response and double the interval."""
+        with self._lock:
+            self.consecutive_rate_limits += 1
+            self._interval = min(self.max_backoff, max(self._interval, self.min_delay, 1.0) * 2)
+            self._schedule()
+
+    def _schedule(self) -> None:
+        """Set the earliest time for the next request, with jitter.
+
+        Must be called with ``self._lock`` held.
+        """
+        jitter = random.uniform(1 - JITTER_RATIO, 1 + JITTER_RATIO)
+        self._next_at = time.monotonic() + max(self.min_delay, self._interval * jitter)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any, cast
 
@@ -15,6 +16,48 @@ from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Playlist, channel and legacy user URLs, matched in a single pass
+_PLAYLIST_RE = re.compile(r"playlist\?list=|/channel/|/c/|/user/")
+
+# Downloaded file suffixes recorded as audio rather than video
+_AUDIO_EXTS = frozenset({".m4a", ".mp3"})
+
+# Info dict fields copied into scrape metadata, in output order; None values are
+# skipped. Fields listed in _YT_ALIASES are stored under a different name.
+_YT_KEYS: tuple[str, ...] = (
+    "id",
+    "title",
+    "description",
+    "uploader",
+    "uploader_id",
+    "uploader_url",
+    "channel",
+    "channel_id",
+    "channel_url",
+    "duration",
+    "view_count",
+    "like_count",
+    "upload_date",
+    "release_date",
+    "availability",
+    "tags",
+    "categories",
+    "live_status",
+    "playable_in_embed",
+    "width",
+    "height",
+    "fps",
+    "format",
+    "format_id",
+    "ext",
+    "filesize",
+    "webpage_url",
+)
+_YT_ALIASES = {"webpage_url": "url"}
+
+# Write buffer for streaming transcripts to disk (bytes)
+TRANSCRIPT_WRITE_BUFFER = 64 * 1024
+
 
 class YouTubeScraper(BaseScraper):
     """Scraper for YouTube content using yt-dlp."""
@@ -75,13 +118,7 @@ class YouTubeScraper(BaseScraper):
         Returns:
             True if playlist/channel, False if single video
         """
-        playlist_patterns = [
-            r"playlist\?list=",
-            r"/channel/",
-            r"/c/",
-            r"/user/",
-        ]
-        return any(re.search(pattern, url) for pattern in playlist_patterns)
+        return _PLAYLIST_RE.search(url) is not None
 
     def _scrape_single_video(self, url: str, job_id: str) -> dict[str, Any]:
         """Scrape a single YouTube video.
@@ -125,22 +162,21 @@ class YouTubeScraper(BaseScraper):
             }
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # First extract info without downloading
+                # Run the extractor once; format selection happens on download
                 self.update_progress(10, "Fetching video metadata")
-                info = ydl.extract_info(url, download=False)
+                info = ydl.extract_info(url, download=False, process=False)
 
                 if not info:
                     scrape_result["error"] = "Could not extract video info"
                     return scrape_result
 
                 title = info.get("title", "Unknown Title")
-                _uploader = info.get("uploader", "Unknown Channel")
                 scrape_result["title"] = title
 
                 self.update_progress(20, f"Downloading: {title}")
 
-                # Download the video
-                info = ydl.extract_info(url, download=True)
+                # Download the video, reusing the extracted info
+                info = ydl.process_ie_result(info, download=True)
 
                 # Get the actual file path
                 video_path = ydl.prepare_filename(info)
@@ -156,21 +192,13 @@ class YouTubeScraper(BaseScraper):
                 metadata_path = video_file.parent / "metadata.json"
                 self.save_metadata(job_id, metadata, metadata_path)
 
-                if metadata_path.exists():
-                    self.save_file_record(
-                        job_id,
-                        str(metadata_path.relative_to(self.download_dir)),
-                        FILE_TYPE_METADATA,
-                        metadata_path.stat().st_size,
-                        metadata,
-                    )
-                    scrape_result["files"].append(
-                        {
-                            "file_path": str(metadata_path.relative_to(self.download_dir)),
-                            "file_type": FILE_TYPE_METADATA,
-                            "file_size": metadata_path.stat().st_size,
-                        }
-                    )
+                # File records are written together once all files are in place
+                records = []
+
+                file_info = self._file_info(metadata_path, FILE_TYPE_METADATA)
+                if file_info:
+                    scrape_result["files"].append(file_info)
+                    records.append({**file_info, "metadata": metadata})
 
                 self.update_progress(80, "Fetching transcript")
 
@@ -179,42 +207,21 @@ class YouTubeScraper(BaseScraper):
                 if video_id:
                     transcript_path = self._fetch_transcript(video_id, video_file.parent)
                     if transcript_path:
-                        self.save_file_record(
-                            job_id,
-                            str(transcript_path.relative_to(self.download_dir)),
-                            FILE_TYPE_TRANSCRIPT,
-                            transcript_path.stat().st_size,
-                        )
-                        scrape_result["files"].append(
-                            {
-                                "file_path": str(transcript_path.relative_to(self.download_dir)),
-                                "file_type": FILE_TYPE_TRANSCRIPT,
-                                "file_size": transcript_path.stat().st_size,
-                            }
-                        )
+                        file_info = self._file_info(transcript_path, FILE_TYPE_TRANSCRIPT)
+                        if file_info:
+                            scrape_result["files"].append(file_info)
+                            records.append(file_info)
 
                 self.update_progress(90, "Finalizing")
 
                 # Record video file
-                if video_file.exists():
-                    file_type = (
-                        FILE_TYPE_VIDEO
-                        if video_file.suffix not in [".m4a", ".mp3"]
-                        else FILE_TYPE_AUDIO
-                    )
-                    self.save_file_record(
-                        job_id,
-                        str(video_file.relative_to(self.download_dir)),
-                        file_type,
-                        video_file.stat().st_size,
-                    )
-                    scrape_result["files"].append(
-                        {
-                            "file_path": str(video_file.relative_to(self.download_dir)),
-                            "file_type": file_type,
-                            "file_size": video_file.stat().st_size,
-                        }
-                    )
+                file_type = FILE_TYPE_AUDIO if video_file.suffix in _AUDIO_EXTS else FILE_TYPE_VIDEO
+                file_info = self._file_info(video_file, file_type)
+                if file_info:
+                    scrape_result["files"].append(file_info)
+                    records.append(file_info)
+
+                self.save_file_records(job_id, records)
 
                 scrape_result["success"] = True
                 self.update_progress(100, "Complete")
@@ -338,12 +345,12 @@ class YouTubeScraper(BaseScraper):
                     return None
 
             # Format as plain text
-            transcript_text = self._format_transcript(fetched.to_raw_data())
-
-            # Save to file
+            # Stream formatted lines to the file instead of building the full text
             transcript_path = output_dir / "transcript.txt"
-            with open(transcript_path, "w", encoding="utf-8") as f:
-                f.write(transcript_text)
+            with open(
+                transcript_path, "w", encoding="utf-8", buffering=TRANSCRIPT_WRITE_BUFFER
+            ) as f:
+                f.writelines(self._iter_transcript_lines(fetched.to_raw_data()))
 
             logger.info("Saved transcript for video %s", video_id)
             return transcript_path
@@ -352,29 +359,20 @@ class YouTubeScraper(BaseScraper):
             logger.warning("Could not fetch transcript for %s: %s", video_id, e)
             return None
 
-    def _format_transcript(self, transcript: list[dict]) -> str:
-        """Format transcript as readable text.
+    @staticmethod
+    def _iter_transcript_lines(transcript: list[dict]) -> Iterator[str]:
+        """Format transcript entries as readable lines.
 
         Args:
             transcript: List of transcript entries
 
-        Returns:
-            Formatted transcript text
+        Yields:
+            Lines of the form ``[MM:SS] text``, each ending with a newline
         """
-        lines = []
         for entry in transcript:
-            text = entry.get("text", "")
-            start = entry.get("start", 0)
-            _duration = entry.get("duration", 0)
-
             # Format timestamp as MM:SS
-            minutes = int(start // 60)
-            seconds = int(start % 60)
-            timestamp = f"{minutes:02d}:{seconds:02d}"
-
-            lines.append(f"[{timestamp}] {text}")
-
-        return "\n".join(lines)
+            minutes, seconds = divmod(int(entry.get("start", 0)), 60)
+            yield f"[{minutes:02d}:{seconds:02d}] {entry.get('text', '')}\n"
 
     def _extract_metadata(self, yt_dlp_info: dict) -> dict[str, Any]:
         """Extract relevant metadata from yt-dlp info dict.
@@ -385,36 +383,9 @@ class YouTubeScraper(BaseScraper):
         Returns:
             Cleaned metadata dictionary
         """
-        metadata_dict = {
-            "platform": "youtube",
-            "id": yt_dlp_info.get("id"),
-            "title": yt_dlp_info.get("title"),
-            "description": yt_dlp_info.get("description"),
-            "uploader": yt_dlp_info.get("uploader"),
-            "uploader_id": yt_dlp_info.get("uploader_id"),
-            "uploader_url": yt_dlp_info.get("uploader_url"),
-            "channel": yt_dlp_info.get("channel"),
-            "channel_id": yt_dlp_info.get("channel_id"),
-            "channel_url": yt_dlp_info.get("channel_url"),
-            "duration": yt_dlp_info.get("duration"),
-            "view_count": yt_dlp_info.get("view_count"),
-            "like_count": yt_dlp_info.get("like_count"),
-            "upload_date": yt_dlp_info.get("upload_date"),
-            "release_date": yt_dlp_info.get("release_date"),
-            "availability": yt_dlp_info.get("availability"),
-            "tags": yt_dlp_info.get("tags"),
-            "categories": yt_dlp_info.get("categories"),
-            "live_status": yt_dlp_info.get("live_status"),
-            "playable_in_embed": yt_dlp_info.get("playable_in_embed"),
-            "width": yt_dlp_info.get("width"),
-            "height": yt_dlp_info.get("height"),
-            "fps": yt_dlp_info.get("fps"),
-            "format": yt_dlp_info.get("format"),
-            "format_id": yt_dlp_info.get("format_id"),
-            "ext": yt_dlp_info.get("ext"),
-            "filesize": yt_dlp_info.get("filesize"),
-            "url": yt_dlp_info.get("webpage_url"),
-        }
-
-        # Remove None values
-        return {k: v for k, v in metadata_dict.items() if v is not None}
+        metadata: dict[str, Any] = {"platform": "youtube"}
+        for key in _YT_KEYS:
+            value = yt_dlp_info.get(key)
+            if value is not None:
+                metadata[_YT_ALIASES.get(key, key)] = value
+        return metadata
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from flask import abort, send_file
@@ -13,12 +14,14 @@ class PathSecurityError(Exception):
     pass
 
 
-def resolve_user_path(base_dir: Path, user_path: str) -> Path:
+def resolve_user_path(base_dir: Path, user_path: str, base_resolved: bool = False) -> Path:
     """Resolve a user-provided relative path beneath base directory.
 
     Args:
         base_dir: The allowed base directory
         user_path: User-provided relative path
+        base_resolved: Whether base_dir is already resolved; callers that
+            resolve it once up front skip re-resolving it on every call
 
     Returns:
         Resolved absolute path
@@ -26,19 +29,37 @@ def resolve_user_path(base_dir: Path, user_path: str) -> Path:
     Raises:
         PathSecurityError: If path attempts traversal outside base_dir
     """
-    base_dir = base_dir.resolve()
+    if not base_resolved:
+        base_dir = base_dir.resolve()
     resolved = (base_dir / user_path).resolve()
 
-    if not is_within_base(base_dir, resolved):
+    if not _contains(str(base_dir), str(resolved)):
         raise PathSecurityError(f"Path '{user_path}' resolves outside allowed directory")
 
     return resolved
 
 
+def _contains(base: str, candidate: str) -> bool:
+    """Check if a resolved candidate path string is inside a resolved base.
+
+    Args:
+        base: Resolved base directory
+        candidate: Resolved path to verify
+
+    Returns:
+        True if candidate equals or is below base, False otherwise
+    """
+    try:
+        return os.path.commonpath([base, candidate]) == base
+    except ValueError:
+        # Different drives on Windows, or mixed absolute/relative paths
+        return False
+
+
 def is_within_base(base_dir: Path, candidate: Path) -> bool:
     """Check if candidate path is inside base_dir.
 
-    Uses robust path containment checks across platforms.
+    Both paths are resolved before comparison.
 
     Args:
         base_dir: The base directory to check against
@@ -48,11 +69,8 @@ def is_within_base(base_dir: Path, candidate: Path) -> bool:
         True if candidate is within base_dir, False otherwise
     """
     try:
-        base_resolved = base_dir.resolve()
-        candidate_resolved = candidate.resolve()
-        candidate_resolved.relative_to(base_resolved)
-        return True
-    except (ValueError, OSError):
+        return _contains(str(base_dir.resolve()), str(candidate.resolve()))
+    except OSError:
         return False
 
 
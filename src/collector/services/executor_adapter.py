@@ -2,22 +2,67 @@
 
 from __future__ import annotations
 
+import os
+import weakref
 from collections.abc import Callable
-from threading import Thread
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
+# Worker threads used when no explicit limit is configured. Jobs beyond the
+# limit wait in the executor queue instead of each getting a new thread.
+DEFAULT_JOB_WORKERS = min(32, (os.cpu_count() or 4) * 5)
+
+# Live adapters, so shutdown can reach every worker pool
+_adapters: weakref.WeakSet[ExecutorAdapter] = weakref.WeakSet()
+
+
+def shutdown_executors() -> None:
+    """Stop every job executor, dropping jobs that have not started yet.
+
+    Queued jobs stay pending in the database and are failed as stale after a
+    restart. Running jobs are left to finish.
+    """
+    for adapter in list(_adapters):
+        adapter.shutdown()
+
 
 class ExecutorAdapter:
     """Execution adapter for background task submission."""
 
-    def submit_job(self, func: Callable[..., Any], *args: Any) -> Thread:
-        """Submit a background job using daemon thread with Flask app context."""
+    def __init__(self, max_workers: int = DEFAULT_JOB_WORKERS):
+        """Initialize the adapter with a bounded worker pool.
+
+        Args:
+            max_workers: Maximum number of jobs running at once
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="collector-job"
+        )
+        _adapters.add(self)
+
+    def shutdown(self) -> None:
+        """Stop accepting jobs and cancel the ones still queued."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit_job(self, func: Callable[..., Any], *args: Any) -> Future[Any]:
+        """Submit a background job to the worker pool with Flask app context.
+
+        The application object is captured at submission time, because the
+        ``current_app`` proxy is not bound inside the worker thread.
+
+        Args:
+            func: Job callable
+            *args: Positional arguments for ``func``
+
+        Returns:
+            Future resolved with the job's return value or exception
+        """
         from flask import current_app
 
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
+
         def run_with_app_context():
-            with current_app.app_context():
-                func(*args)
+            with app.app_context():
+                return func(*args)
 
-        thread = Thread(target=run_with_app_context, daemon=True)
-        thread.start()
-        return thread
+        return self._executor.submit(run_with_app_context)
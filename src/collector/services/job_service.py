@@ -7,6 +7,8 @@ operations with the repository layer.
 from __future__ import annotations
 
 import logging
+import os
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -17,12 +19,20 @@ from ..config.settings import (
     STATUS_PENDING,
     STATUS_RUNNING,
 )
+from ..models.file import File
 from ..models.job import Job
 from ..repositories.file_repository import FileRepository
-from ..repositories.job_repository import JobRepository
+from ..repositories.job_repository import UPDATABLE_JOB_FIELDS, JobRepository
 
 logger = logging.getLogger(__name__)
 
+# Pending jobs created after this point may still be waiting in this process's
+# executor queue, so they are never failed as stale
+_PROCESS_STARTED_AT = datetime.now(timezone.utc)
+
+# Seconds job statistics are reused before the aggregates are queried again
+STATS_CACHE_TTL = 1.0
+
 
 class JobService:
     """Service for managing job lifecycle and operations."""
@@ -43,6 +53,7 @@ class JobService:
         self.job_repository = job_repository or JobRepository()
         self.file_repository = file_repository or FileRepository()
         self.download_dir = download_dir
+        self._stats_cache: tuple[float, dict[str, int]] | None = None
 
     def create_job(self, url: str, platform: str, title: str | None = None) -> Job:
         """Create a new job.
@@ -56,7 +67,9 @@ class JobService:
             The created job instance
         """
         logger.info("Creating new job for URL: %s, platform: %s", url, platform)
-        return self.job_repository.create_job(url, platform, title)
+        job = self.job_repository.create_job(url, platform, title)
+        self._stats_cache = None
+        return job
 
     def update_job(self, job_id: str, **fields: Any) -> bool:
         """Update job fields with safe/allowed field enforcement.
@@ -68,38 +81,17 @@ class JobService:
         Returns:
             True if updated successfully, False if job not found or no valid fields
         """
-        # Define allowed fields for updates (prevents accidental updates of sensitive fields)
-        allowed_fields = {
-            "status",
-            "title",
-            "progress",
-            "current_operation",
-            "error_message",
-            "retry_count",
-            "bytes_downloaded",
-            "completed_at",
-        }
-
-        # Filter to only allowed fields
-        safe_fields = {k: v for k, v in fields.items() if k in allowed_fields}
+        # Only the repository's updatable fields (prevents updating sensitive fields)
+        safe_fields = {k: v for k, v in fields.items() if k in UPDATABLE_JOB_FIELDS}
         if not safe_fields:
             logger.warning("No valid fields provided for job update: %s", fields.keys())
             return False
 
-        job = self.job_repository.get_by_id(job_id)
-        if not job:
+        if not self.job_repository.update_fields(job_id, safe_fields):
             logger.warning("Job not found for update: %s", job_id)
             return False
 
-        # Update job fields
-        for field, value in safe_fields.items():
-            setattr(job, field, value)
-
-        # Update timestamp
-        job.update_timestamp()
-
-        # Save to repository
-        self.job_repository.update(job)
+        self._stats_cache = None
         logger.info("Updated job %s with fields: %s", job_id, list(safe_fields.keys()))
         return True
 
@@ -120,26 +112,29 @@ class JobService:
         Returns:
             List of active job instances ordered by creation time
         """
-        jobs = self.job_repository.get_active_jobs()
-
         stale_cutoff = datetime.now(timezone.utc) - timedelta(minutes=30)
-        active_jobs: list[Job] = []
+        stale_count = self.job_repository.mark_stale_as_failed(
+            stale_cutoff,
+            "Job was stale and was automatically failed after restart.",
+            pending_cutoff=_PROCESS_STARTED_AT,
+        )
+        if stale_count:
+            self._stats_cache = None
+            logger.warning("Marked %d stale active jobs as failed", stale_count)
+
+        return self.job_repository.get_active_jobs()
 
-        for job in jobs:
-            updated_at = getattr(job, "updated_at", None)
-            if isinstance(updated_at, datetime) and updated_at < stale_cutoff:
-                logger.warning("Marking stale active job as failed: %s", job.id)
-                self.update_job(
-                    job.id,
-                    status=STATUS_FAILED,
-                    error_message="Job was stale and was automatically failed after restart.",
-                    completed_at=datetime.now(timezone.utc).isoformat(),
-                )
-                continue
+    def get_active_jobs_with_files(self) -> list[tuple[Job, list[File]]]:
+        """Get all active jobs paired with their files.
 
-            active_jobs.append(job)
+        Files for every active job are fetched with one query rather than one per job.
 
-        return active_jobs
+        Returns:
+            List of (job, files) pairs ordered by job creation time
+        """
+        jobs = self.get_active_jobs()
+        files_by_job = self.file_repository.get_files_for_jobs([job.id for job in jobs])
+        return [(job, files_by_job.get(job.id, [])) for job in jobs]
 
     def list_jobs(
         self,
@@ -157,23 +152,11 @@ class JobService:
             offset: Offset for pagination
 
         Returns:
-            List of job instances
+            List of job instances, newest first
         """
-        # Build filter criteria
-        filters = {}
-        if platform:
-            filters["platform"] = platform
-        if status:
-            filters["status"] = status
-
-        # Get jobs with filters
-        if filters:
-            jobs = self.job_repository.find_by(**filters)
-        else:
-            jobs = self.job_repository.get_all()
-
-        # Apply pagination
-        return jobs[offset : offset + limit]
+        return self.job_repository.list_jobs(
+            platform=platform, status=status, limit=limit, offset=offset
+        )
 
     def get_job_files(self, job_id: str) -> list[Any]:
         """Get all files associated with a job.
@@ -186,6 +169,20 @@ class JobService:
         """
         return self.file_repository.get_job_files(job_id)
 
+    def get_job_with_files(self, job_id: str) -> tuple[Job, list[File]] | None:
+        """Get a job and its files with a single query.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Tuple of (job, files), or None if the job is not found
+        """
+        result = self.job_repository.get_job_with_files(job_id)
+        if not result:
+            return None
+        return result["job"], result["files"]
+
     def prepare_retry_job(self, job_id: str) -> Job | None:
         """Prepare a retry job by creating a replacement job.
 
@@ -233,36 +230,50 @@ class JobService:
 
         # Delete physical files if requested
         if delete_files and self.download_dir:
-            files = self.file_repository.get_job_files(job_id)
-            for file_record in files:
-                file_path = self.download_dir / file_record.file_path
-                try:
-                    if file_path.exists():
-                        file_path.unlink()
-                        logger.debug("Deleted file: %s", file_path)
-                except Exception as e:
-                    logger.warning("Could not delete file %s: %s", file_path, e)
-
-            # Try to remove empty directories
-            for file_record in files:
-                file_path = self.download_dir / file_record.file_path
-                try:
-                    parent = file_path.parent
-                    while parent != self.download_dir:
-                        if parent.is_dir() and not any(parent.iterdir()):
-                            parent.rmdir()
-                            logger.debug("Removed empty directory: %s", parent)
-                        parent = parent.parent
-                except Exception:
-                    pass
+            self._remove_files(self.file_repository.get_job_files(job_id))
 
         # Delete from database
         self.file_repository.delete_job_files(job_id)
         self.job_repository.delete_by_id(job_id)
+        self._stats_cache = None
 
         logger.info("Deleted job %s (delete_files=%s)", job_id, delete_files)
         return True
 
+    def _remove_files(self, files: list[File]) -> None:
+        """Delete files from the download directory and prune emptied directories.
+
+        Directories are removed deepest first; ``rmdir`` fails on non-empty
+        directories, which leaves them in place without a separate listing.
+
+        Args:
+            files: File records whose paths are relative to the download directory
+        """
+        root = os.fspath(self.download_dir)
+        parents: set[str] = set()
+
+        for file_record in files:
+            path = os.path.join(root, file_record.file_path)
+            try:
+                os.unlink(path)
+                logger.debug("Deleted file: %s", path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not delete file %s: %s", path, e)
+
+            parent = os.path.dirname(path)
+            while parent not in parents and parent.startswith(root + os.sep):
+                parents.add(parent)
+                parent = os.path.dirname(parent)
+
+        for parent in sorted(parents, key=lambda p: p.count(os.sep), reverse=True):
+            try:
+                os.rmdir(parent)
+                logger.debug("Removed empty directory: %s", parent)
+            except OSError:
+                pass
+
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a job.
 
@@ -288,10 +299,21 @@ class JobService:
     def get_job_statistics(self) -> dict[str, int]:
         """Get statistics about jobs in the system.
 
+        Results are reused for ``STATS_CACHE_TTL`` seconds, so bursts of
+        dashboard refreshes share one set of aggregate queries. Job writes made
+        through this service clear the cache.
+
         Returns:
             Dictionary with job statistics
         """
-        return self.job_repository.get_job_statistics()
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is not None and now - cached[0] < STATS_CACHE_TTL:
+            return dict(cached[1])
+
+        stats = self.job_repository.get_job_statistics()
+        self._stats_cache = (now, stats)
+        return dict(stats)
 
     def cleanup_old_jobs(self, days: int = 30) -> int:
         """Delete jobs older than the specified number of days.
@@ -302,4 +324,6 @@ class JobService:
         Returns:
             Number of jobs deleted
         """
-        return self.job_repository.cleanup_old_jobs(days)
+        deleted = self.job_repository.cleanup_old_jobs(days)
+        self._stats_cache = None
+        return deleted
@@ -17,7 +17,6 @@ from ..config.settings import (
     INSTAGRAM_PATTERNS,
     STATUS_COMPLETED,
     STATUS_FAILED,
-    STATUS_RUNNING,
     YOUTUBE_PATTERNS,
 )
 from ..repositories.file_repository import FileRepository
@@ -122,11 +121,13 @@ class ScraperService:
 
         return callback
 
-    def execute_download(self, job_id: str) -> dict[str, Any]:
+    def execute_download(self, job_id: str, since: datetime | None = None) -> dict[str, Any]:
         """Execute a download job in the background.
 
         Args:
             job_id: Job ID to execute
+            since: Only download Instagram profile posts published at or after
+                this time; ignored for other URLs
 
         Returns:
             Dictionary with execution result
@@ -139,8 +140,10 @@ class ScraperService:
         url = job.url
         platform = job.platform
 
-        # Update status to running
-        self.job_repository.update_job_status(job_id, STATUS_RUNNING)
+        # Update status to running, unless the job was cancelled or failed while queued
+        if not self.job_repository.start_job(job_id):
+            logger.info("Skipping job %s, no longer pending", job_id)
+            return {"success": False, "error": "Job is no longer pending"}
 
         try:
             progress_callback = self.make_progress_callback(job_id)
@@ -175,6 +178,7 @@ class ScraperService:
                     download_dir=self.download_dir,
                     progress_callback=progress_callback,
                     session_file=session_file,
+                    since=since,
                 )
 
             # Execute scrape
@@ -214,6 +218,7 @@ class ScraperService:
         platform: str,
         progress_callback: Callable[[int, str], None] | None = None,
         session_file: Path | None = None,
+        since: datetime | None = None,
     ) -> Any:
         """Get appropriate scraper instance for a platform.
 
@@ -221,6 +226,7 @@ class ScraperService:
             platform: Platform name ('youtube' or 'instagram')
             progress_callback: Optional progress callback function
             session_file: Optional session file for Instagram
+            since: Optional Instagram profile post cutoff
 
         Returns:
             Scraper instance
@@ -240,6 +246,7 @@ class ScraperService:
                 download_dir=self.download_dir,
                 progress_callback=progress_callback,
                 session_file=session_file,
+                since=since,
             )
         else:
             raise ValueError(f"Unsupported platform: {platform}")
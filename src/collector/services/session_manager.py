@@ -7,9 +7,14 @@ from cookies.txt files.
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import logging
+import os
+import re
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +22,81 @@ from cryptography.fernet import Fernet, InvalidToken
 
 logger = logging.getLogger(__name__)
 
+# Instagram sessions typically last about a week
+SESSION_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# File name suffix of saved sessions
+SESSION_SUFFIX = ".session"
+
+# Characters not allowed in session file names
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Instagram cookies kept from a cookies.txt export
+_WANTED_COOKIES = frozenset(
+    {b"sessionid", b"ds_user_id", b"mid", b"ig_did", b"rur", b"shbid", b"csrftoken"}
+)
+
+# One Netscape cookie line: domain, flag, path, secure, expiration, name, value.
+# Comment lines (including #HttpOnly_ entries) and short lines do not match.
+_COOKIE_LINE_RE = re.compile(
+    rb"^[ \t]*([^\s#][^\t\n]*)\t[^\t\n]*\t([^\t\n]*)\t([^\t\n]*)"
+    rb"\t([^\t\n]*)\t([^\t\n]*)\t([^\t\r\n]*)",
+    re.MULTILINE,
+)
+
+
+def _parse_cookies(data: bytes) -> list[dict[str, Any]]:
+    """Extract Instagram session cookies from Netscape cookies.txt content.
+
+    Lines are matched with one regex scan, and only cookies with a wanted name
+    and an Instagram domain are decoded.
+
+    Args:
+        data: Raw cookies.txt content
+
+    Returns:
+        List of cookie dictionaries
+    """
+    cookies = []
+    for match in _COOKIE_LINE_RE.finditer(data):
+        domain, path, secure, expiration, name, value = match.groups()
+        if name not in _WANTED_COOKIES or b"instagram.com" not in domain:
+            continue
+        cookies.append(
+            {
+                "domain": domain.decode(),
+                "path": path.decode(),
+                "secure": secure.lower() == b"true",
+                "expiration": expiration.decode(),
+                "name": name.decode(),
+                "value": value.decode().rstrip(),
+            }
+        )
+    return cookies
+
+
+@lru_cache(maxsize=8)
+def _derive_cipher(encryption_key: str) -> Fernet:
+    """Build the Fernet cipher for a configured session key.
+
+    The result is cached per key, since a session manager is created for
+    most session requests.
+
+    Args:
+        encryption_key: Configured session encryption key
+
+    Returns:
+        Fernet cipher for the key
+    """
+    if len(encryption_key.split(".")) >= 2:
+        # Already a valid Fernet key
+        return Fernet(encryption_key)
+
+    # Derive a proper Fernet key from the provided key
+    # Fernet requires 32-byte base64-encoded key
+    key_hash = hashlib.sha256(encryption_key.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key_hash))
+
 
 class SessionManager:
     """Manages encrypted Instagram sessions."""
@@ -34,24 +114,7 @@ class SessionManager:
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize Fernet cipher if key is provided
-        self.cipher: Fernet | None = None
-        if encryption_key:
-            # Ensure key is proper base64 for Fernet
-            key_bytes = (
-                encryption_key.encode()
-                if len(encryption_key.split(".")) < 2
-                else encryption_key.encode()
-            )
-            if len(encryption_key.split(".")) >= 2:
-                # Already a valid Fernet key
-                self.cipher = Fernet(encryption_key)
-            else:
-                # Derive a proper Fernet key from the provided key
-                # Fernet requires 32-byte base64-encoded key
-                import hashlib
-
-                key_hash = hashlib.sha256(key_bytes).digest()
-                self.cipher = Fernet(base64.urlsafe_b64encode(key_hash))
+        self.cipher: Fernet | None = _derive_cipher(encryption_key) if encryption_key else None
 
     def _get_cipher(self) -> Fernet:
         """Get Fernet cipher instance.
@@ -80,60 +143,59 @@ class SessionManager:
         Raises:
             ValueError: If file format is invalid
         """
-        cookies = []
+        return self._load_cookies(cookies_file.read_bytes(), str(cookies_file))
 
-        with open(cookies_file, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
+    def load_cookies_from_text(self, text: str, source_name: str) -> dict[str, Any]:
+        """Load cookies from cookies.txt content already in memory.
 
-                # Parse Netscape cookie format
-                # tab-separated: domain \t flag \t path \t secure \t expiration \t name \t value
-                parts = line.split("\t")
-                if len(parts) < 7:
-                    continue
+        Args:
+            text: Content of a cookies.txt file (Netscape format)
+            source_name: Name recorded as the source of the cookies
+
+        Returns:
+            Dictionary with cookie data
+
+        Raises:
+            ValueError: If no Instagram cookies are found
+        """
+        return self._load_cookies(text.encode("utf-8"), source_name)
+
+    def _load_cookies(self, data: bytes, source_name: str) -> dict[str, Any]:
+        """Parse cookies.txt content into cookie data.
+
+        Args:
+            data: Raw cookies.txt content
+            source_name: File name or path the content came from
 
-                cookie = {
-                    "domain": parts[0],
-                    "path": parts[2],
-                    "secure": parts[3].lower() == "true",
-                    "expiration": parts[4],
-                    "name": parts[5],
-                    "value": parts[6],
-                }
-
-                # Filter for Instagram session cookies
-                cookie_name = str(cookie["name"])
-                cookie_domain = str(cookie["domain"])
-                if "instagram.com" in cookie_domain and cookie_name in [
-                    "sessionid",
-                    "ds_user_id",
-                    "mid",
-                    "ig_did",
-                    "rur",
-                    "shbid",
-                    "csrftoken",
-                ]:
-                    cookies.append(cookie)
+        Returns:
+            Dictionary with cookie data
+
+        Raises:
+            ValueError: If no Instagram cookies are found
+        """
+        cookies = _parse_cookies(data)
 
         if not cookies:
             raise ValueError(
-                f"No valid Instagram cookies found in {cookies_file}. "
+                f"No valid Instagram cookies found in {source_name}. "
                 "Please export cookies from Instagram using a browser extension."
             )
 
-        logger.info("Loaded %d Instagram cookies from %s", len(cookies), cookies_file)
+        logger.info("Loaded %d Instagram cookies from %s", len(cookies), source_name)
 
         return {
             "cookies": cookies,
-            "source_file": str(cookies_file),
+            "source_file": source_name,
             "loaded_at": datetime.now(timezone.utc).isoformat(),
+            "expires_at_epoch": time.time() + SESSION_MAX_AGE_SECONDS,
         }
 
     def save_session(self, username: str, session_data: dict[str, Any]) -> Path:
         """Encrypt and save session data to disk.
 
+        Sessions saved without an ``expires_at_epoch`` are given one
+        ``SESSION_MAX_AGE_SECONDS`` from now.
+
         Args:
             username: Instagram username
             session_data: Session data to encrypt and save
@@ -143,18 +205,24 @@ class SessionManager:
         """
         cipher = self._get_cipher()
 
-        # Serialize session data
-        session_json = json.dumps(session_data, default=str)
+        if "expires_at_epoch" not in session_data:
+            session_data = {
+                **session_data,
+                "expires_at_epoch": time.time() + SESSION_MAX_AGE_SECONDS,
+            }
+
+        # Serialize session data compactly, since every byte is encrypted and stored
+        payload = json.dumps(
+            session_data, default=str, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
 
         # Encrypt
-        encrypted_data = cipher.encrypt(session_json.encode())
+        encrypted_data = cipher.encrypt(payload)
 
         # Save to file
         safe_username = self._sanitize_username(username)
-        session_file = self.sessions_dir / f"{safe_username}.session"
-
-        with open(session_file, "wb") as f:
-            f.write(encrypted_data)
+        session_file = self.sessions_dir / f"{safe_username}{SESSION_SUFFIX}"
+        session_file.write_bytes(encrypted_data)
 
         logger.info("Saved encrypted session for %s to %s", username, session_file)
 
@@ -175,7 +243,7 @@ class SessionManager:
 
         cipher = self._get_cipher()
         safe_username = self._sanitize_username(username)
-        session_file = self.sessions_dir / f"{safe_username}.session"
+        session_file = self.sessions_dir / f"{safe_username}{SESSION_SUFFIX}"
 
         if not session_file.exists():
             logger.warning("No saved session found for %s", username)
@@ -206,27 +274,29 @@ class SessionManager:
         Returns:
             List of session info dictionaries
         """
-        sessions = []
+        entries: list[tuple[str, str, float]] = []
 
-        for session_file in self.sessions_dir.glob("*.session"):
-            try:
-                # Get file modification time
-                mtime = datetime.fromtimestamp(session_file.stat().st_mtime)
-
-                # Extract username from filename
-                username = session_file.stem
-
-                sessions.append(
-                    {
-                        "username": username,
-                        "file": str(session_file),
-                        "created_at": mtime.isoformat(),
-                    }
-                )
-            except Exception as e:
-                logger.warning("Error reading session file %s: %s", session_file, e)
-
-        return sorted(sessions, key=lambda x: x["created_at"], reverse=True)
+        # One directory pass; each entry is stat'ed once for its mtime
+        with os.scandir(self.sessions_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(SESSION_SUFFIX):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError as e:
+                    logger.warning("Error reading session file %s: %s", entry.path, e)
+                    continue
+                entries.append((entry.name[: -len(SESSION_SUFFIX)], entry.path, mtime))
+
+        entries.sort(key=lambda e: e[2], reverse=True)
+        return [
+            {
+                "username": username,
+                "file": path,
+                "created_at": datetime.fromtimestamp(mtime).isoformat(),
+            }
+            for username, path, mtime in entries
+        ]
 
     def delete_session(self, username: str) -> bool:
         """Delete a saved session.
@@ -238,7 +308,7 @@ class SessionManager:
             True if deleted, False if not found
         """
         safe_username = self._sanitize_username(username)
-        session_file = self.sessions_dir / f"{safe_username}.session"
+        session_file = self.sessions_dir / f"{safe_username}{SESSION_SUFFIX}"
 
         if session_file.exists():
             session_file.unlink()
@@ -257,9 +327,7 @@ class SessionManager:
             Sanitized username safe for filenames
         """
         # Remove special characters
-        import re
-
-        return re.sub(r'[<>:"/\\|?*]', "_", username)
+        return _UNSAFE_FILENAME_RE.sub("_", username)
 
     def cookies_to_session_dict(self, cookies_data: dict[str, Any]) -> dict[str, Any]:
         """Convert loaded cookies to session dictionary for Instaloader.
@@ -278,6 +346,7 @@ class SessionManager:
         return {
             "cookies": cookies_dict,
             "loaded_at": cookies_data.get("loaded_at"),
+            "expires_at_epoch": cookies_data.get("expires_at_epoch"),
         }
 
     def validate_session(self, session_data: dict[str, Any]) -> bool:
@@ -289,6 +358,11 @@ class SessionManager:
         Returns:
             True if session appears valid, False otherwise
         """
+        expires_at_epoch = session_data.get("expires_at_epoch")
+        if expires_at_epoch is not None:
+            return time.time() < expires_at_epoch
+
+        # Sessions saved before expires_at_epoch was recorded
         loaded_at = session_data.get("loaded_at")
         if not loaded_at:
             return False
@@ -297,7 +371,7 @@ class SessionManager:
         # Check if loaded within last 7 days
         try:
             loaded_date = datetime.fromisoformat(loaded_at)
-            expiry = loaded_date + timedelta(days=7)
+            expiry = loaded_date + timedelta(seconds=SESSION_MAX_AGE_SECONDS)
             return datetime.now(timezone.utc) < expiry
         except Exception:
             return False
@@ -7,7 +7,7 @@ suitable for controller integration.
 from __future__ import annotations
 
 import logging
-import tempfile
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -19,6 +19,9 @@ from .session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Username segment of an Instagram profile URL
+_INSTAGRAM_USER_RE = re.compile(r"instagram\.com/([^/?]+)")
+
 
 class SessionService:
     """Service for managing Instagram sessions."""
@@ -61,17 +64,14 @@ class SessionService:
         if not self.session_manager:
             return {"success": False, "error": "Session manager not available"}
 
-        if not filename.endswith(".txt"):
+        if not filename.lower().endswith(".txt"):
             return {"success": False, "error": "File must be .txt format (cookies.txt)"}
 
         try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as tmp:
-                tmp.write(cookies_file_content)
-                tmp_path = Path(tmp.name)
-
-            # Load cookies from file
-            cookies_data = self.session_manager.load_cookies_from_file(tmp_path)
+            # Parse the uploaded cookies in memory
+            cookies_data = self.session_manager.load_cookies_from_text(
+                cookies_file_content, filename
+            )
 
             # Create a username/session identifier from the cookies
             username = None
@@ -93,9 +93,6 @@ class SessionService:
             }
             session_file = self.session_manager.save_session(username, session_dict)
 
-            # Clean up temp file
-            tmp_path.unlink()
-
             logger.info("Session uploaded successfully for username: %s", username)
             return {
                 "success": True,
@@ -265,10 +262,8 @@ class SessionService:
         Returns:
             Dictionary with session result
         """
-        import re
-
         # Extract username from URL
-        match = re.search(r"instagram\.com/([^/?]+)", url)
+        match = _INSTAGRAM_USER_RE.search(url)
         if not match:
             return {"success": False, "error": "Could not extract username from URL"}
 
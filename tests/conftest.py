@@ -200,6 +200,7 @@ def auto_mock_templates():
     with (
         patch("collector.routes.jobs.render_template", return_value=mock_html),
         patch("collector.routes.pages.render_template", return_value=mock_html),
+        patch("collector.routes.pages.stream_template", return_value=mock_html),
         patch("collector.routes.sessions.render_template", return_value=mock_html),
         patch("flask.render_template", return_value=mock_html),
     ):
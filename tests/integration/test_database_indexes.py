@@ -4,12 +4,13 @@ This module tests that indexes are properly created and used for queries.
 """
 
 
-def test_jobs_indexes_exist(app):
+def test_jobs_indexes_exist(app, tmp_db_path):
     """Test that all job indexes are created."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
 
     with app.app_context():
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
+        assert db_config.db_path == tmp_db_path
 
         with db_config.get_connection() as conn:
             # Get indexes for jobs table
@@ -26,6 +27,7 @@ def test_jobs_indexes_exist(app):
                 "idx_jobs_platform",
                 "idx_jobs_created_at",
                 "idx_jobs_status_created",
+                "idx_jobs_platform_status_created",
             }
 
             assert expected_indexes.issubset(index_names), (
@@ -35,10 +37,10 @@ def test_jobs_indexes_exist(app):
 
 def test_files_indexes_exist(app):
     """Test that all file indexes are created."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
 
     with app.app_context():
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         with db_config.get_connection() as conn:
             # Get indexes for files table
@@ -62,12 +64,12 @@ def test_files_indexes_exist(app):
             )
 
 
-def test_settings_has_no_custom_indexes(app):
-    """Test that settings table has no custom indexes (only primary key)."""
-    from src.collector.config.database import DatabaseConfig
+def test_settings_indexes_exist(app):
+    """Test that settings only adds the case-insensitive key index."""
+    from src.collector.config.database import get_db_config
 
     with app.app_context():
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         with db_config.get_connection() as conn:
             # Get indexes for settings table
@@ -76,13 +78,34 @@ def test_settings_has_no_custom_indexes(app):
                 "WHERE type='index' AND tbl_name='settings' AND name LIKE 'idx_%'"
             ).fetchall()
 
-            # Should be empty (only auto-created primary key index exists)
-            assert len(indexes) == 0, "Settings table should not have custom indexes"
+            # The primary key index is implicit; only the NOCASE index is custom
+            assert {row[0] for row in indexes} == {"idx_settings_key_nocase"}
+
+
+def test_index_usage_on_settings_prefix_nocase(app):
+    """Test that case-insensitive settings prefix lookups use the NOCASE index."""
+    from src.collector.config.database import get_db_config
+
+    with app.app_context():
+        db_config = get_db_config()
+
+        with db_config.get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM settings WHERE key LIKE ? ESCAPE '\\'",
+                ("youtube%",),
+            ).fetchall()
+
+            plan_list = [dict(row) for row in plan]
+            plan_str = str(plan_list)
+
+            assert "idx_settings_key_nocase" in plan_str, (
+                f"Query should use idx_settings_key_nocase index. Plan: {plan_list}"
+            )
 
 
 def test_index_usage_on_active_jobs(app):
     """Test that get_active_jobs uses the status index."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
     from src.collector.repositories.job_repository import JobRepository
 
     with app.app_context():
@@ -94,7 +117,7 @@ def test_index_usage_on_active_jobs(app):
         job_repo.create_job("https://example.com/3", "youtube")
 
         # Check query plan
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         with db_config.get_connection() as conn:
             plan = conn.execute(
@@ -114,7 +137,7 @@ def test_index_usage_on_active_jobs(app):
 
 def test_index_usage_on_job_files(app):
     """Test that get_job_files uses the job_id index."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
     from src.collector.repositories.file_repository import FileRepository
     from src.collector.repositories.job_repository import JobRepository
 
@@ -127,7 +150,7 @@ def test_index_usage_on_job_files(app):
         file_repo.create_file(job.id, "/path/to/video.mp4", "video", 1024000)
 
         # Check query plan
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         with db_config.get_connection() as conn:
             plan = conn.execute(
@@ -145,7 +168,7 @@ def test_index_usage_on_job_files(app):
 
 def test_index_usage_on_recent_jobs(app):
     """Test that get_recent_jobs uses the created_at index."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
     from src.collector.repositories.job_repository import JobRepository
 
     with app.app_context():
@@ -156,7 +179,7 @@ def test_index_usage_on_recent_jobs(app):
         job_repo.create_job("https://example.com/2", "instagram")
 
         # Check query plan
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         with db_config.get_connection() as conn:
             plan = conn.execute(
@@ -177,7 +200,7 @@ def test_index_usage_on_recent_jobs(app):
 
 def test_index_usage_on_job_statistics(app):
     """Test that get_job_statistics uses the status index."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
     from src.collector.repositories.job_repository import JobRepository
 
     with app.app_context():
@@ -188,7 +211,7 @@ def test_index_usage_on_job_statistics(app):
         job_repo.create_job("https://example.com/2", "instagram")
 
         # Check query plan
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         with db_config.get_connection() as conn:
             plan = conn.execute(
@@ -206,10 +229,10 @@ def test_index_usage_on_job_statistics(app):
 
 def test_get_index_info_method(app):
     """Test that get_index_info returns correct index information."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
 
     with app.app_context():
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         # Get indexes for jobs table
         job_indexes = db_config.get_index_info("jobs")
@@ -222,6 +245,7 @@ def test_get_index_info_method(app):
         assert "idx_jobs_platform" in index_names
         assert "idx_jobs_created_at" in index_names
         assert "idx_jobs_status_created" in index_names
+        assert "idx_jobs_platform_status_created" in index_names
 
         # Get indexes for files table
         file_indexes = db_config.get_index_info("files")
@@ -238,10 +262,10 @@ def test_get_index_info_method(app):
 
 def test_ensure_indexes_is_idempotent(app):
     """Test that ensure_indexes can be called multiple times safely."""
-    from src.collector.config.database import DatabaseConfig
+    from src.collector.config.database import get_db_config
 
     with app.app_context():
-        db_config = DatabaseConfig()
+        db_config = get_db_config()
 
         # Call ensure_indexes twice - should not fail
         from src.collector.models.file import File
@@ -258,4 +282,16 @@ def test_ensure_indexes_is_idempotent(app):
 
         # Verify indexes exist
         job_indexes = db_config.get_index_info("jobs")
-        assert len(job_indexes) == 4, "Should have exactly 4 job indexes"
+        assert len(job_indexes) == 5, "Should have exactly 5 job indexes"
+
+
+def test_connections_use_wal(tmp_path):
+    """Test that connections enable WAL with relaxed synchronous writes."""
+    from src.collector.config.database import DatabaseConfig
+
+    db_config = DatabaseConfig(tmp_path / "wal.db")
+
+    with db_config.get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL == 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 
 class TestApiRoutes:
     """Test cases for API routes."""
@@ -51,3 +53,46 @@ class TestApiRoutes:
         assert response.content_type == "application/json"
         data = response.get_json()
         assert data["encryption_enabled"] is False
+
+    def test_config_status_etag_not_modified(self, client):
+        """Test a matching If-None-Match header returns 304 without a body."""
+        first = client.get("/api/config/status")
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/config/status", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == etag
+
+    def test_config_status_cached(self, client):
+        """Test repeated requests reuse the cached payload."""
+        with patch("collector.routes.api.SessionService") as mock_service:
+            mock_service.return_value.get_config_status.return_value = {
+                "success": True,
+                "encryption_enabled": True,
+                "downloads_dir": "/test/downloads",
+            }
+
+            client.get("/api/config/status")
+            response = client.get("/api/config/status")
+
+        assert response.get_json() == {
+            "encryption_enabled": True,
+            "downloads_dir": "/test/downloads",
+        }
+        mock_service.assert_called_once()
+
+    def test_config_status_refreshed_after_settings_write(self, app, client):
+        """Test a settings write invalidates the cached payload."""
+        first = client.get("/api/config/status")
+
+        with app.app_context():
+            from collector.repositories.settings_repository import SettingsRepository
+
+            SettingsRepository().set_setting("download_dir", "/new/downloads")
+
+        second = client.get("/api/config/status")
+
+        assert second.get_json()["downloads_dir"] == "/new/downloads"
+        assert second.headers["ETag"] != first.headers["ETag"]
@@ -0,0 +1,92 @@
+"""Tests for CSRF helpers."""
+
+from __future__ import annotations
+
+import re
+from unittest.mock import PropertyMock, patch
+
+from flask import Request
+
+from collector.security.csrf import (
+    CSRF_SESSION_KEY,
+    generate_csrf_token,
+    validate_csrf_request,
+)
+
+
+def test_generate_csrf_token_is_urlsafe():
+    """Test generated tokens are unpadded URL-safe base64 of CSRF_TOKEN_LENGTH bytes."""
+    tokens = {generate_csrf_token() for _ in range(20)}
+
+    assert len(tokens) == 20
+    for token in tokens:
+        assert len(token) == 43
+        assert re.fullmatch(r"[A-Za-z0-9_-]+", token)
+
+
+class TestValidateCsrfRequest:
+    """Test cases for CSRF request validation."""
+
+    def test_header_token_skips_form_parsing(self, app):
+        """Test a header token is validated without reading the form body."""
+        with (
+            app.test_request_context(
+                "/sessions/upload", method="POST", headers={"X-CSRFToken": "token"}
+            ),
+            patch.object(Request, "form", new_callable=PropertyMock) as mock_form,
+        ):
+            from flask import request, session
+
+            session[CSRF_SESSION_KEY] = "token"
+
+            assert validate_csrf_request(request) is True
+            mock_form.assert_not_called()
+
+    def test_form_token_fallback(self, app):
+        """Test the form field is used when the header is absent."""
+        with app.test_request_context(
+            "/sessions/upload", method="POST", data={"csrf_token": "token"}
+        ):
+            from flask import request, session
+
+            session[CSRF_SESSION_KEY] = "token"
+
+            assert validate_csrf_request(request) is True
+
+    def test_missing_session_token_skips_form_parsing(self, app):
+        """Test requests without a session token are rejected before parsing the body."""
+        with (
+            app.test_request_context("/sessions/upload", method="POST"),
+            patch.object(Request, "form", new_callable=PropertyMock) as mock_form,
+        ):
+            from flask import request
+
+            assert validate_csrf_request(request) is False
+            mock_form.assert_not_called()
+
+    def test_mismatched_token(self, app):
+        """Test a token that does not match the session is rejected."""
+        with app.test_request_context(
+            "/sessions/upload", method="POST", headers={"X-CSRFToken": "wrong"}
+        ):
+            from flask import request, session
+
+            session[CSRF_SESSION_KEY] = "token"
+
+            assert validate_csrf_request(request) is False
+
+    def test_xhr_without_token_reads_session_once(self, app):
+        """Test the XHR fallback reuses the session token already read for validation."""
+        with app.test_request_context(
+            "/sessions/upload", method="POST", headers={"X-Requested-With": "XMLHttpRequest"}
+        ):
+            from flask import request, session
+
+            session[CSRF_SESSION_KEY] = "token"
+
+            with patch(
+                "collector.security.csrf.get_csrf_token_from_session", return_value="token"
+            ) as mock_get:
+                assert validate_csrf_request(request) is True
+
+            mock_get.assert_called_once()
@@ -0,0 +1,76 @@
+"""Tests for the background job executor adapter."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flask import current_app
+
+from collector.services.executor_adapter import ExecutorAdapter, shutdown_executors
+
+
+class TestExecutorAdapter:
+    """Test cases for ExecutorAdapter job submission."""
+
+    def test_runs_job_in_app_context(self, app):
+        """Test the job sees the submitting app and its result reaches the future."""
+        with app.app_context():
+            future = ExecutorAdapter().submit_job(lambda n: (current_app.name, n * 2), 21)
+
+        assert future.result(timeout=5) == (app.name, 42)
+
+    def test_job_exception_is_captured(self, app):
+        """Test an exception raised by the job is set on the future."""
+
+        def fail():
+            raise ValueError("boom")
+
+        with app.app_context():
+            future = ExecutorAdapter().submit_job(fail)
+
+        assert isinstance(future.exception(timeout=5), ValueError)
+
+    def test_concurrency_is_bounded(self, app):
+        """Test no more than max_workers jobs run at the same time."""
+        adapter = ExecutorAdapter(max_workers=2)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def job():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        with app.app_context():
+            futures = [adapter.submit_job(job) for _ in range(6)]
+
+        for future in futures:
+            future.result(timeout=5)
+        assert peak == 2
+
+    def test_shutdown_cancels_queued_jobs(self, app):
+        """Test shutting down drops queued jobs and lets the running one finish."""
+        adapter = ExecutorAdapter(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def job():
+            started.set()
+            return release.wait(5)
+
+        with app.app_context():
+            running = adapter.submit_job(job)
+            queued = adapter.submit_job(lambda: None)
+
+        assert started.wait(5)
+        shutdown_executors()
+        release.set()
+
+        assert running.result(timeout=5) is True
+        assert queued.cancelled()
@@ -1,8 +1,36 @@
 """Tests for Instagram scraper."""
 
+import os
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
+from cryptography.fernet import Fernet
+
+from collector.models.file import File
+from collector.scrapers.instagram_scraper import (
+    HTTP_POOL_SIZE,
+    PROFILE_CACHE_TTL,
+    InstagramScraper,
+    _derive_fernet,
+    _get_profile,
+    _idle_loaders,
+    _profile_cache,
+    _resolve_fernet,
+)
+from collector.scrapers.rate_limiter import AdaptiveRateLimiter
+from collector.services.session_manager import SessionManager
+
 
-from collector.scrapers.instagram_scraper import InstagramScraper
+@pytest.fixture(autouse=True)
+def clear_profile_cache():
+    """Keep cached profile lookups and idle loaders from leaking between tests."""
+    _profile_cache.clear()
+    _idle_loaders.clear()
+    yield
+    _profile_cache.clear()
+    _idle_loaders.clear()
 
 
 class TestInstagramScraper:
@@ -69,6 +97,11 @@ class TestInstagramScraper:
             scraper._detect_url_type("https://instagram.com/highlights/username/") == "highlights"
         )
 
+    def test_detect_url_type_unknown(self, scraper):
+        """Test unsupported and non-Instagram URLs are reported as unknown."""
+        assert scraper._detect_url_type("https://www.instagram.com/tv/ABC123/") == "unknown"
+        assert scraper._detect_url_type("https://example.com/natgeo") == "unknown"
+
     def test_scrape_stories_requires_session(self, scraper):
         """Test that stories scraping requires an authenticated session."""
         result = scraper._scrape_stories("https://www.instagram.com/stories/test/", "job-123")
@@ -80,3 +113,532 @@ class TestInstagramScraper:
         result = scraper._scrape_highlights("https://www.instagram.com/highlights/test/", "job-123")
         assert not result["success"]
         assert "authenticated session" in result["error"].lower()
+
+    def test_instaloader_is_cached(self, scraper):
+        """Test the Instaloader instance is reused across calls."""
+        with patch("collector.scrapers.instagram_scraper.instaloader.Instaloader") as mock_cls:
+            first = scraper._get_instaloader()
+            second = scraper._get_instaloader()
+
+        assert first is second
+        assert mock_cls.call_count == 1
+
+    def test_instaloader_reused_by_later_scrapers(self, scraper, tmp_path):
+        """Test a released loader serves the next scraper; a held one is not shared."""
+        with patch("collector.scrapers.instagram_scraper.instaloader.Instaloader") as mock_cls:
+            mock_cls.side_effect = lambda **kwargs: MagicMock()
+            first = scraper._get_instaloader()
+            other = InstagramScraper(db_path=tmp_path / "db", download_dir=tmp_path)
+            assert other._get_instaloader() is not first
+
+            scraper.scrape("https://example.com/unsupported", "job-1")
+            later = InstagramScraper(db_path=tmp_path / "db", download_dir=tmp_path)
+
+            assert later._get_instaloader() is first
+        assert mock_cls.call_count == 2
+
+    def test_instaloader_rebuilt_when_session_changes(self, scraper, tmp_path):
+        """Test a new session file mtime invalidates the cached loader."""
+        session_file = tmp_path / "session.enc"
+        session_file.write_bytes(b"encrypted")
+        scraper.session_file = session_file
+
+        with (
+            patch.dict(os.environ, {}, clear=False),
+            patch("collector.scrapers.instagram_scraper.instaloader.Instaloader") as mock_cls,
+        ):
+            os.environ.pop("SCRAPER_SESSION_KEY", None)
+            scraper._get_instaloader()
+            scraper._get_instaloader()
+            os.utime(session_file, (0, 0))
+            scraper._get_instaloader()
+
+        assert mock_cls.call_count == 2
+
+    def test_derive_fernet_matches_session_manager(self, tmp_path):
+        """Test passphrase derivation decrypts sessions written by SessionManager."""
+        manager = SessionManager(tmp_path, encryption_key="passphrase")
+        token = manager.cipher.encrypt(b"session")
+
+        assert _derive_fernet("passphrase").decrypt(token) == b"session"
+        assert _derive_fernet("passphrase") is _derive_fernet("passphrase")
+
+    def test_iter_files_walks_subdirectories(self, tmp_path):
+        """Test the scandir walk yields files from nested directories only."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "a.jpg").write_bytes(b"a")
+        (tmp_path / "sub" / "b.mp4").write_bytes(b"b")
+
+        names = sorted(entry.name for entry in InstagramScraper._iter_files(tmp_path))
+
+        assert names == ["a.jpg", "b.mp4"]
+
+    def test_get_profile_cached_per_session(self):
+        """Test profile data is reused per session mtime and failures are retried."""
+        context, other_context = MagicMock(), MagicMock()
+        node = {"username": "natgeo", "id": 1}
+
+        with patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile:
+            mock_profile.from_username.side_effect = [
+                RuntimeError("429"),
+                MagicMock(_node=node),
+                MagicMock(_node=node),
+            ]
+
+            with pytest.raises(RuntimeError):
+                _get_profile(context, "natgeo", 1)
+            _get_profile(context, "natgeo", 1)
+            _get_profile(other_context, "NatGeo", 1)
+            _get_profile(context, "natgeo", 2)
+
+        assert mock_profile.from_username.call_count == 3
+        mock_profile.assert_called_once_with(other_context, node)
+
+    def test_get_profile_expires(self):
+        """Test cached profile data is fetched again after the TTL."""
+        node = {"username": "expiring", "id": 1}
+
+        with (
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile,
+            patch(
+                "collector.scrapers.instagram_scraper.time.monotonic",
+                side_effect=[0.0, PROFILE_CACHE_TTL + 1.0],
+            ),
+        ):
+            mock_profile.from_username.return_value = MagicMock(_node=node)
+            _get_profile(MagicMock(), "expiring", None)
+            _get_profile(MagicMock(), "expiring", None)
+
+        assert mock_profile.from_username.call_count == 2
+
+    def test_scrape_stories_records_only_new_files(self, scraper, tmp_path):
+        """Test story scraping records files that were not present before the download."""
+        scraper.session_file = tmp_path / "session.enc"
+        scraper.session_file.write_bytes(b"encrypted")
+        output_dir = scraper.download_dir / "instagram" / "test" / "stories"
+        output_dir.mkdir(parents=True)
+        (output_dir / "old.jpg").write_bytes(b"old")
+
+        def download_storyitem(item, target):
+            (Path(target) / f"{item}.mp4").write_bytes(b"video")
+            (Path(target) / f"{item}.json").write_bytes(b"{}")
+
+        story = MagicMock()
+        story.get_items.return_value = ["s1"]
+        loader = MagicMock()
+        loader.get_stories.return_value = [story]
+        loader.download_storyitem.side_effect = download_storyitem
+        scraper._rate_limiter = AdaptiveRateLimiter(0, 0)
+
+        with (
+            patch.object(scraper, "_get_instaloader", return_value=loader),
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile"),
+            patch.object(scraper, "save_file_records") as mock_save,
+        ):
+            result = scraper._scrape_stories("https://www.instagram.com/stories/test/", "job-1")
+
+        assert result["success"]
+        assert result["files"] == [
+            {
+                "file_path": str(Path("instagram/test/stories/s1.mp4")),
+                "file_type": "video",
+                "file_size": 5,
+            }
+        ]
+        mock_save.assert_called_once()
+        saved = sorted((r["file_path"], r["file_type"]) for r in mock_save.call_args.args[1])
+        assert saved == [
+            (str(Path("instagram/test/stories/s1.json")), "metadata"),
+            (str(Path("instagram/test/stories/s1.mp4")), "video"),
+        ]
+
+    def test_scrape_highlights_records_only_new_files(self, scraper, tmp_path):
+        """Test highlight scraping records files that were not present before the download."""
+        scraper.session_file = tmp_path / "session.enc"
+        scraper.session_file.write_bytes(b"encrypted")
+        reel_dir = scraper.download_dir / "instagram" / "test" / "highlights" / "Trip"
+        reel_dir.mkdir(parents=True)
+        (reel_dir / "old.jpg").write_bytes(b"old")
+
+        def download_storyitem(item, target):
+            (Path(target) / f"{item}.jpg").write_bytes(b"image")
+            (Path(target) / f"{item}.json").write_bytes(b"{}")
+
+        reel = MagicMock(title="Trip")
+        reel.get_items.return_value = ["h1"]
+        loader = MagicMock()
+        loader.download_storyitem.side_effect = download_storyitem
+        scraper._rate_limiter = AdaptiveRateLimiter(0, 0)
+
+        with (
+            patch.object(scraper, "_get_instaloader", return_value=loader),
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile,
+            patch.object(scraper, "save_file_records") as mock_save,
+        ):
+            mock_profile.from_username.return_value.get_highlight_reels.return_value = [reel]
+            result = scraper._scrape_highlights(
+                "https://www.instagram.com/highlights/test/", "job-1"
+            )
+
+        assert result["success"]
+        saved = sorted((r["file_path"], r["file_type"], r["file_size"]) for r in result["files"])
+        assert saved == [
+            (str(Path("instagram/test/highlights/Trip/h1.jpg")), "image", 5),
+            (str(Path("instagram/test/highlights/Trip/h1.json")), "metadata", 2),
+        ]
+        mock_save.assert_called_once_with("job-1", result["files"])
+
+    def test_scrape_highlights_shared_directory(self, scraper, tmp_path):
+        """Test reels with the same title record only the files they downloaded."""
+        scraper.session_file = tmp_path / "session.enc"
+        scraper.session_file.write_bytes(b"encrypted")
+
+        def download_storyitem(item, target):
+            (Path(target) / f"{item}.jpg").write_bytes(b"image")
+
+        reels = [MagicMock(title="Trip"), MagicMock(title="Trip"), MagicMock(title="Food")]
+        for index, reel in enumerate(reels):
+            reel.get_items.return_value = [f"h{index}"]
+        loader = MagicMock()
+        loader.download_storyitem.side_effect = download_storyitem
+        scraper._rate_limiter = AdaptiveRateLimiter(0, 0)
+
+        with (
+            patch.object(scraper, "_get_instaloader", return_value=loader),
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile,
+            patch.object(scraper, "save_file_records"),
+        ):
+            mock_profile.from_username.return_value.get_highlight_reels.return_value = reels
+            result = scraper._scrape_highlights(
+                "https://www.instagram.com/highlights/test/", "job-1"
+            )
+
+        assert result["metadata"]["reels_downloaded"] == 3
+        base = Path("instagram/test/highlights")
+        assert [f["file_path"] for f in result["files"]] == [
+            str(base / "Trip" / "h0.jpg"),
+            str(base / "Trip" / "h1.jpg"),
+            str(base / "Food" / "h2.jpg"),
+        ]
+
+    def test_highlight_items_each_paced(self, scraper, tmp_path):
+        """Test every highlight item waits on the rate limiter before downloading."""
+        reel = MagicMock()
+        reel.get_items.return_value = ["h1", "h2", "h3"]
+        calls: list[str] = []
+        loader = MagicMock()
+        loader.download_storyitem.side_effect = lambda item, target: calls.append(item)
+        scraper._rate_limiter = MagicMock()
+        scraper._rate_limiter.acquire.side_effect = lambda: calls.append("acquire")
+
+        with patch.object(scraper, "save_file_records"):
+            scraper._download_highlight_reel(loader, reel, tmp_path, "job-1")
+
+        assert calls == ["acquire", "h1", "acquire", "h2", "acquire", "h3"]
+        assert scraper._rate_limiter.on_success.call_count == 3
+
+    def test_save_file_records_single_transaction(self, scraper):
+        """Test batched file records are all written with their metadata."""
+        with scraper.get_db_connection() as conn:
+            conn.execute(File.get_create_table_sql())
+
+        scraper.save_file_records(
+            "job-1",
+            [
+                {"file_path": "a.jpg", "file_type": "image", "file_size": 1},
+                {
+                    "file_path": "a.json",
+                    "file_type": "metadata",
+                    "file_size": 2,
+                    "metadata": {"k": 1},
+                },
+            ],
+        )
+        scraper.save_file_records("job-1", [])
+
+        with scraper.get_db_connection() as conn:
+            rows = conn.execute(
+                "SELECT file_path, file_type, file_size, metadata_json FROM files ORDER BY id"
+            ).fetchall()
+        assert [tuple(row) for row in rows] == [
+            ("a.jpg", "image", 1, None),
+            ("a.json", "metadata", 2, '{"k": 1}'),
+        ]
+
+    def test_download_carousel_items(self, scraper):
+        """Test carousel items are fetched from the CDN and returned with their types."""
+        post_dir = scraper.download_dir / "post"
+        post_dir.mkdir()
+        nodes = [
+            MagicMock(is_video=False, display_url="https://cdn/1.jpg"),
+            MagicMock(is_video=True, video_url="https://cdn/2.mp4"),
+            MagicMock(is_video=False, display_url="https://cdn/broken.jpg"),
+        ]
+        post = MagicMock(typename="GraphSidecar")
+        post.get_sidecar_nodes.return_value = nodes
+        post.date_local.timestamp.return_value = 1_700_000_000.0
+
+        def get_raw(url):
+            if "broken" in url:
+                raise ConnectionError("boom")
+            return url.encode()
+
+        loader = MagicMock()
+        loader.context.get_raw.side_effect = get_raw
+        loader.context.write_raw.side_effect = lambda resp, name: Path(name).write_bytes(resp)
+
+        files, complete = scraper._download_post_media(loader, post, post_dir, "job-1")
+
+        assert [(f["file_path"], f["file_type"]) for f in files] == [
+            (str(Path("post/1.jpg")), "image"),
+            (str(Path("post/2.mp4")), "video"),
+        ]
+        assert complete is False
+        assert (post_dir / "1.jpg").stat().st_mtime == 1_700_000_000.0
+
+    def test_instaloader_session_uses_connection_pool(self, scraper):
+        """Test the loader's HTTPS adapter keeps a larger keep-alive pool."""
+        loader = scraper._get_instaloader()
+
+        adapter = loader.context._session.get_adapter("https://www.instagram.com/")
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+
+    def test_file_info(self, scraper):
+        """Test file info is built from one stat and is None for missing files."""
+        path = scraper.download_dir / "a.jpg"
+        path.write_bytes(b"abc")
+
+        assert scraper._file_info(path, "image") == {
+            "file_path": "a.jpg",
+            "file_type": "image",
+            "file_size": 3,
+        }
+        assert scraper._file_info(scraper.download_dir / "missing.jpg", "image") is None
+
+    def test_find_downloaded_files(self, scraper):
+        """Test downloaded files are classified and recorded, skipping post metadata."""
+        (scraper.download_dir / "a.mp4").write_bytes(b"video")
+        (scraper.download_dir / "metadata.json").write_bytes(b"{}")
+        (scraper.download_dir / "sub").mkdir()
+
+        with patch.object(scraper, "save_file_records") as mock_save:
+            files = scraper._find_downloaded_files(scraper.download_dir, "job-1")
+
+        assert files == [{"file_path": "a.mp4", "file_type": "video", "file_size": 5}]
+        mock_save.assert_called_once_with("job-1", files)
+
+    def test_scrape_profile_iterates_posts_lazily(self, scraper):
+        """Test profile posts are consumed one at a time, using mediacount as the total."""
+        consumed = []
+
+        def get_posts():
+            for shortcode in ("A", "B"):
+                consumed.append(shortcode)
+                yield MagicMock(shortcode=shortcode)
+
+        profile = MagicMock(mediacount=2)
+        profile.get_posts.side_effect = get_posts
+        scraper._rate_limiter = AdaptiveRateLimiter(0, 0)
+        downloads = []
+
+        def download_post_media(loader, post, post_dir, job_id):
+            downloads.append((post.shortcode, list(consumed)))
+            return [], True
+
+        with (
+            patch.object(scraper, "_get_instaloader"),
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile,
+            patch.object(scraper, "_download_post_media", side_effect=download_post_media),
+            patch.object(scraper, "_extract_post_metadata", return_value={}),
+            patch.object(scraper, "save_file_records"),
+            patch.object(scraper, "save_file_record"),
+        ):
+            mock_profile.from_username.return_value = profile
+            result = scraper._scrape_profile("https://www.instagram.com/test/", "job-1")
+
+        assert result["success"]
+        assert downloads == [("A", ["A"]), ("B", ["A", "B"])]
+
+    def test_scrape_profile_skips_completed_posts(self, scraper):
+        """Test posts whose metadata was already written are not downloaded again."""
+        done = MagicMock(shortcode="DONE")
+        done.date_utc.strftime.return_value = "20240101_000000"
+        new = MagicMock(shortcode="NEW")
+        new.date_utc.strftime.return_value = "20240102_000000"
+        done_dir = scraper.download_dir / "instagram" / "test" / "DONE_20240101_000000"
+        done_dir.mkdir(parents=True)
+        (done_dir / "metadata.json").write_bytes(b"{}")
+        profile = MagicMock(mediacount=2)
+        profile.get_posts.return_value = iter([new, done])
+        scraper._rate_limiter = AdaptiveRateLimiter(0, 0)
+
+        with (
+            patch.object(scraper, "_get_instaloader"),
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile,
+            patch.object(scraper, "_download_post_media", return_value=([], True)) as mock_download,
+            patch.object(scraper, "_extract_post_metadata", return_value={}),
+            patch.object(scraper, "save_file_records"),
+            patch.object(scraper, "save_file_record"),
+        ):
+            mock_profile.from_username.return_value = profile
+            result = scraper._scrape_profile("https://www.instagram.com/test/", "job-1")
+
+        assert result["success"]
+        assert [c.args[1].shortcode for c in mock_download.call_args_list] == ["NEW"]
+
+    def test_scrape_profile_retries_incomplete_posts(self, scraper):
+        """Test a post with failed media gets no metadata, so the next scrape retries it."""
+        post = MagicMock(shortcode="PART")
+        post.date_utc.strftime.return_value = "20240101_000000"
+        post_dir = scraper.download_dir / "instagram" / "test" / "PART_20240101_000000"
+        profile = MagicMock(mediacount=1)
+        profile.get_posts.side_effect = lambda: iter([post])
+        scraper._rate_limiter = AdaptiveRateLimiter(0, 0)
+
+        with (
+            patch.object(scraper, "_get_instaloader"),
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile,
+            patch.object(
+                scraper, "_download_post_media", return_value=([], False)
+            ) as mock_download,
+            patch.object(scraper, "_extract_post_metadata", return_value={}),
+            patch.object(scraper, "save_file_records"),
+            patch.object(scraper, "save_file_record"),
+        ):
+            mock_profile.from_username.return_value = profile
+            mock_profile.return_value = profile
+            scraper._scrape_profile("https://www.instagram.com/test/", "job-1")
+            scraper._scrape_profile("https://www.instagram.com/test/", "job-2")
+
+        assert not (post_dir / "metadata.json").exists()
+        assert mock_download.call_count == 2
+
+    def test_extract_post_metadata(self, scraper):
+        """Test post metadata maps Instaloader properties, omitting video fields for images."""
+        post = MagicMock(
+            shortcode="ABC",
+            is_video=False,
+            caption="Hello #Cats and #dogs with @Friend.one, mail a@b",
+            location=None,
+        )
+
+        metadata = scraper._extract_post_metadata(post)
+
+        assert metadata["url"] == "https://www.instagram.com/p/ABC/"
+        assert metadata["hashtags"] == ["cats", "dogs"]
+        assert metadata["mentions"] == ["friend.one"]
+        assert metadata["video_url"] is None
+        assert metadata["location"] is None
+
+    def test_download_single_post_finds_instaloader_file(self, scraper):
+        """Test a single-media post is found by scanning rather than guessing its name."""
+        post_dir = scraper.download_dir / "post"
+        post_dir.mkdir()
+        (post_dir / "metadata.json").write_bytes(b"{}")
+        post = MagicMock(typename="GraphVideo")
+        loader = MagicMock()
+        loader.download_post.side_effect = lambda post, target: (
+            Path(target) / "2024-01-01_12-00-00_UTC.mp4"
+        ).write_bytes(b"video")
+
+        files, complete = scraper._download_post_media(loader, post, post_dir, "job-1")
+
+        assert complete is True
+        assert files == [
+            {
+                "file_path": str(Path("post/2024-01-01_12-00-00_UTC.mp4")),
+                "file_type": "video",
+                "file_size": 5,
+            }
+        ]
+
+    def test_scrape_dispatches_by_url_type(self, scraper):
+        """Test scrape() routes each URL type to its handler and rejects unknown types."""
+        with patch.object(scraper, "_scrape_post", return_value={"success": True}) as mock_post:
+            assert scraper.scrape("https://www.instagram.com/p/ABC/", "job-1") == {"success": True}
+        mock_post.assert_called_once_with("https://www.instagram.com/p/ABC/", "job-1")
+
+        result = scraper.scrape("https://www.instagram.com/tv/ABC/", "job-1")
+        assert result["error"] == "Unsupported URL type: unknown"
+
+    def test_scrape_profile_stops_at_since(self, scraper):
+        """Test profile iteration stops at the first unpinned post older than the cutoff."""
+        cutoff = datetime(2024, 1, 10)
+        posts = [
+            MagicMock(shortcode="PINNED", date_utc=datetime(2023, 1, 1), is_pinned=True),
+            MagicMock(shortcode="NEW", date_utc=datetime(2024, 1, 11), is_pinned=False),
+            MagicMock(shortcode="OLD", date_utc=datetime(2024, 1, 9), is_pinned=False),
+            MagicMock(shortcode="OLDER", date_utc=datetime(2024, 1, 8), is_pinned=False),
+        ]
+        remaining = iter(posts)
+        profile = MagicMock(mediacount=4)
+        profile.get_posts.return_value = remaining
+        scraper.since = cutoff
+        scraper._rate_limiter = AdaptiveRateLimiter(0, 0)
+
+        with (
+            patch.object(scraper, "_get_instaloader"),
+            patch("collector.scrapers.instagram_scraper.instaloader.Profile") as mock_profile,
+            patch.object(scraper, "_download_post_media", return_value=([], True)) as mock_download,
+            patch.object(scraper, "_extract_post_metadata", return_value={}),
+            patch.object(scraper, "save_file_records"),
+            patch.object(scraper, "save_file_record"),
+        ):
+            mock_profile.from_username.return_value = profile
+            scraper._scrape_profile("https://www.instagram.com/test/", "job-1")
+
+        assert [c.args[1].shortcode for c in mock_download.call_args_list] == ["NEW"]
+        assert [post.shortcode for post in remaining] == ["OLDER"]
+
+    def test_since_is_normalized_to_naive_utc(self, tmp_path):
+        """Test an aware cutoff is converted to the naive UTC form Instaloader uses."""
+        since = datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+
+        scraper = InstagramScraper(db_path=tmp_path / "db", download_dir=tmp_path, since=since)
+
+        assert scraper.since == datetime(2024, 1, 1, 10)
+
+    def test_resolve_fernet_accepts_raw_and_derived_keys(self, tmp_path):
+        """Test a raw Fernet key decrypts both direct and SessionManager-derived tokens."""
+        raw_key = Fernet.generate_key().decode()
+        direct = Fernet(raw_key).encrypt(b"direct")
+        derived = SessionManager(tmp_path, encryption_key=raw_key).cipher.encrypt(b"derived")
+
+        cipher = _resolve_fernet(raw_key)
+
+        assert cipher.decrypt(direct) == b"direct"
+        assert cipher.decrypt(derived) == b"derived"
+        assert (
+            _resolve_fernet("passphrase").decrypt(_derive_fernet("passphrase").encrypt(b"x"))
+            == b"x"
+        )
+
+    def test_relative_path(self, scraper):
+        """Test paths under the download root are sliced to a relative path."""
+        path = scraper.download_dir / "instagram" / "user" / "a.jpg"
+
+        assert scraper._relative_path(path) == str(Path("instagram/user/a.jpg"))
+        assert scraper._relative_path(str(path)) == str(Path("instagram/user/a.jpg"))
+        assert scraper._relative_path(scraper.download_dir.parent / "x") == os.path.join("..", "x")
+
+    def test_instaloader_loads_session_cookies_in_memory(self, scraper, tmp_path):
+        """Test an encrypted session is decrypted and its cookies injected into the loader."""
+        manager = SessionManager(tmp_path, encryption_key="passphrase")
+        scraper.session_file = manager.save_session(
+            "user",
+            {
+                "username": "12345",
+                "cookies": [
+                    {"name": "sessionid", "value": "sid", "domain": ".instagram.com", "path": "/"},
+                    {"name": "csrftoken", "value": "tok", "domain": ".instagram.com", "path": "/"},
+                ],
+            },
+        )
+
+        with patch.dict(os.environ, {"SCRAPER_SESSION_KEY": "passphrase"}):
+            loader = scraper._get_instaloader()
+
+        session = loader.context._session
+        assert loader.context.username == "12345"
+        assert session.cookies.get("sessionid", domain=".instagram.com") == "sid"
+        assert session.headers["X-CSRFToken"] == "tok"
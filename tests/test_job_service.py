@@ -51,30 +51,29 @@ class TestJobService:
         """Test successful job update."""
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
-        mock_job = Mock(spec=Job)
-        mock_repo.get_by_id.return_value = mock_job
+        mock_repo.update_fields.return_value = True
 
         service = JobService()
         result = service.update_job("job123", status="completed", progress=100)
 
         assert result is True
-        mock_repo.get_by_id.assert_called_once_with("job123")
-        mock_job.update_timestamp.assert_called_once()
-        mock_repo.update.assert_called_once_with(mock_job)
+        mock_repo.update_fields.assert_called_once_with(
+            "job123", {"status": "completed", "progress": 100}
+        )
+        mock_repo.get_by_id.assert_not_called()
 
     @patch("collector.services.job_service.JobRepository")
     def test_update_job_not_found(self, mock_repo_class):
         """Test updating a job that doesn't exist."""
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
-        mock_repo.get_by_id.return_value = None
+        mock_repo.update_fields.return_value = False
 
         service = JobService()
         result = service.update_job("nonexistent", status="completed")
 
         assert result is False
-        mock_repo.get_by_id.assert_called_once_with("nonexistent")
-        mock_repo.update.assert_not_called()
+        mock_repo.update_fields.assert_called_once_with("nonexistent", {"status": "completed"})
 
     @patch("collector.services.job_service.JobRepository")
     def test_update_job_invalid_fields(self, mock_repo_class):
@@ -88,7 +87,7 @@ class TestJobService:
         result = service.update_job("job123", invalid_field="value")
 
         assert result is False
-        mock_repo.update.assert_not_called()
+        mock_repo.update_fields.assert_not_called()
 
     @patch("collector.services.job_service.JobRepository")
     def test_get_job(self, mock_repo_class):
@@ -111,33 +110,53 @@ class TestJobService:
         mock_repo_class.return_value = mock_repo
         mock_jobs = [Mock(spec=Job), Mock(spec=Job)]
         mock_repo.get_active_jobs.return_value = mock_jobs
+        mock_repo.mark_stale_as_failed.return_value = 0
 
         service = JobService()
         result = service.get_active_jobs()
 
         assert result == mock_jobs
+        mock_repo.mark_stale_as_failed.assert_called_once()
         mock_repo.get_active_jobs.assert_called_once()
 
+    def test_get_active_jobs_with_files(self):
+        """Test active jobs are paired with files from one bulk lookup."""
+        job_repo = Mock(spec=JobRepository)
+        file_repo = Mock(spec=FileRepository)
+        job_a = Job(id="a", url="https://example.com/a", platform="youtube")
+        job_b = Job(id="b", url="https://example.com/b", platform="youtube")
+        job_repo.get_active_jobs.return_value = [job_a, job_b]
+        job_repo.mark_stale_as_failed.return_value = 0
+        file_a = Mock()
+        file_repo.get_files_for_jobs.return_value = {"a": [file_a]}
+
+        service = JobService(job_repo, file_repo)
+        result = service.get_active_jobs_with_files()
+
+        assert result == [(job_a, [file_a]), (job_b, [])]
+        file_repo.get_files_for_jobs.assert_called_once_with(["a", "b"])
+
     @patch("collector.services.job_service.JobRepository")
     def test_list_jobs_with_filters(self, mock_repo_class):
-        """Test listing jobs with filters."""
+        """Test listing jobs passes filters and pagination to the repository."""
         mock_repo = Mock()
         mock_repo_class.return_value = mock_repo
         mock_jobs = [Mock(spec=Job), Mock(spec=Job), Mock(spec=Job)]
-        mock_repo.find_by.return_value = mock_jobs
-        mock_repo.get_all.return_value = mock_jobs
+        mock_repo.list_jobs.return_value = mock_jobs
 
         service = JobService()
 
         # Test with platform filter
         result = service.list_jobs(platform="youtube")
-        mock_repo.find_by.assert_called_once_with(platform="youtube")
+        mock_repo.list_jobs.assert_called_once_with(
+            platform="youtube", status=None, limit=100, offset=0
+        )
         assert result == mock_jobs
 
-        # Test with no filters
+        # Test with no filters and an explicit page
         mock_repo.reset_mock()
-        result = service.list_jobs()
-        mock_repo.get_all.assert_called_once()
+        result = service.list_jobs(limit=10, offset=20)
+        mock_repo.list_jobs.assert_called_once_with(platform=None, status=None, limit=10, offset=20)
         assert result == mock_jobs
 
     @patch("collector.services.job_service.JobRepository")
@@ -200,8 +219,8 @@ class TestJobService:
 
     @patch("collector.services.job_service.FileRepository")
     @patch("collector.services.job_service.JobRepository")
-    def test_delete_job_with_files(self, mock_job_repo_class, mock_file_repo_class):
-        """Test deleting a job with files."""
+    def test_delete_job_with_files(self, mock_job_repo_class, mock_file_repo_class, tmp_path):
+        """Test deleting a job removes its files and the directories they emptied."""
         mock_job_repo = Mock()
         mock_job_repo_class.return_value = mock_job_repo
         mock_file_repo = Mock()
@@ -210,30 +229,28 @@ class TestJobService:
         mock_job = Mock(spec=Job)
         mock_job_repo.get_by_id.return_value = mock_job
 
-        mock_file1 = Mock()
-        mock_file1.file_path = "video1.mp4"
-        mock_file2 = Mock()
-        mock_file2.file_path = "video2.mp4"
-        mock_file_repo.get_job_files.return_value = [mock_file1, mock_file2]
+        (tmp_path / "youtube" / "a" / "b").mkdir(parents=True)
+        (tmp_path / "youtube" / "a" / "b" / "video1.mp4").write_bytes(b"x")
+        (tmp_path / "youtube" / "a" / "video2.mp4").write_bytes(b"x")
+        (tmp_path / "youtube" / "other.mp4").write_bytes(b"x")
 
-        download_dir = Path("/tmp/downloads")
-        service = JobService(download_dir=download_dir)
-
-        with (
-            patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.unlink") as mock_unlink,
-            patch("pathlib.Path.is_dir", return_value=True),
-            patch("pathlib.Path.iterdir", return_value=[]),
-            patch("pathlib.Path.rmdir"),
-        ):
-            result = service.delete_job("job123", delete_files=True)
-
-            assert result is True
-            mock_job_repo.get_by_id.assert_called_once_with("job123")
-            mock_file_repo.get_job_files.assert_called_once_with("job123")
-            assert mock_unlink.call_count == 2
-            mock_file_repo.delete_job_files.assert_called_once_with("job123")
-            mock_job_repo.delete_by_id.assert_called_once_with("job123")
+        mock_files = []
+        for file_path in ["youtube/a/b/video1.mp4", "youtube/a/video2.mp4", "youtube/gone.mp4"]:
+            mock_file = Mock()
+            mock_file.file_path = file_path
+            mock_files.append(mock_file)
+        mock_file_repo.get_job_files.return_value = mock_files
+
+        service = JobService(download_dir=tmp_path)
+        result = service.delete_job("job123", delete_files=True)
+
+        assert result is True
+        mock_job_repo.get_by_id.assert_called_once_with("job123")
+        mock_file_repo.get_job_files.assert_called_once_with("job123")
+        assert not (tmp_path / "youtube" / "a").exists()
+        assert (tmp_path / "youtube" / "other.mp4").exists()
+        mock_file_repo.delete_job_files.assert_called_once_with("job123")
+        mock_job_repo.delete_by_id.assert_called_once_with("job123")
 
     @patch("collector.services.job_service.JobRepository")
     @patch("collector.services.job_service.JobService.update_job")
@@ -282,6 +299,32 @@ class TestJobService:
         assert result == mock_stats
         mock_repo.get_job_statistics.assert_called_once()
 
+    def test_job_statistics_cached_until_write(self):
+        """Test statistics are reused within the TTL and refreshed after a write."""
+        job_repo = Mock(spec=JobRepository)
+        job_repo.get_job_statistics.side_effect = [{"total_jobs": 1}, {"total_jobs": 2}]
+        service = JobService(job_repo, Mock(spec=FileRepository))
+
+        assert service.get_job_statistics() == {"total_jobs": 1}
+        assert service.get_job_statistics() == {"total_jobs": 1}
+        job_repo.get_job_statistics.assert_called_once()
+
+        service.create_job("https://example.com", "youtube")
+
+        assert service.get_job_statistics() == {"total_jobs": 2}
+
+    def test_job_statistics_expire(self):
+        """Test cached statistics are queried again once the TTL has passed."""
+        job_repo = Mock(spec=JobRepository)
+        job_repo.get_job_statistics.return_value = {"total_jobs": 1}
+        service = JobService(job_repo, Mock(spec=FileRepository))
+
+        with patch("collector.services.job_service.time.monotonic", side_effect=[100.0, 101.5]):
+            service.get_job_statistics()
+            service.get_job_statistics()
+
+        assert job_repo.get_job_statistics.call_count == 2
+
     @patch("collector.services.job_service.JobRepository")
     def test_cleanup_old_jobs(self, mock_repo_class):
         """Test cleaning up old jobs."""
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from unittest.mock import Mock
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
 
 from collector.models.job import Job
 
@@ -68,6 +68,65 @@ class TestJobsRoutes:
         assert response.status_code == 302
         assert response.headers["Location"].endswith("/")
 
+    def test_download_passes_since_date(
+        self, client, mock_scraper_service, mock_job_service, mock_executor_adapter, auto_mock_csrf
+    ):
+        """Test the optional since date is submitted with the job as UTC midnight."""
+        test_url = "https://www.instagram.com/testuser/"
+        mock_scraper_service.return_value.validate_url.return_value = (True, None)
+        mock_scraper_service.return_value.detect_platform.return_value = "instagram"
+        mock_job_service.return_value.create_job.return_value = Job(
+            id="job-123", url=test_url, platform="instagram", status="pending"
+        )
+
+        response = client.post(
+            "/download",
+            data={"url": test_url, "since": "2024-03-01"},
+            headers={"HX-Request": "true"},
+        )
+
+        assert response.status_code == 200
+        mock_executor_adapter.return_value.submit_job.assert_called_once_with(
+            mock_scraper_service.return_value.execute_download,
+            "job-123",
+            datetime(2024, 3, 1, tzinfo=timezone.utc),
+        )
+
+    def test_download_invalid_since_date_htmx(
+        self, client, mock_scraper_service, mock_job_service, mock_executor_adapter, auto_mock_csrf
+    ):
+        """Test a malformed since date is rejected before a job is created."""
+        mock_scraper_service.return_value.validate_url.return_value = (True, None)
+
+        response = client.post(
+            "/download",
+            data={"url": "https://www.instagram.com/testuser/", "since": "03/01/2024"},
+            headers={"HX-Request": "true"},
+        )
+
+        assert response.status_code == 400
+        assert b"YYYY-MM-DD" in response.data
+        mock_job_service.return_value.create_job.assert_not_called()
+        mock_executor_adapter.return_value.submit_job.assert_not_called()
+
+    def test_download_reuses_executor_adapter(
+        self, client, mock_scraper_service, mock_job_service, mock_executor_adapter, auto_mock_csrf
+    ):
+        """Test the executor adapter is created once and shared across requests."""
+        mock_scraper_service.return_value.validate_url.return_value = (True, None)
+        mock_scraper_service.return_value.detect_platform.return_value = "youtube"
+        mock_job_service.return_value.create_job.return_value = Job(
+            id="job-123", url="https://www.youtube.com/watch?v=test123", platform="youtube"
+        )
+
+        for _ in range(2):
+            client.post("/download", data={"url": "https://www.youtube.com/watch?v=test123"})
+
+        mock_executor_adapter.assert_called_once_with(
+            max_workers=client.application.config["SCRAPER_MAX_CONCURRENT"]
+        )
+        assert mock_executor_adapter.return_value.submit_job.call_count == 2
+
     def test_download_with_invalid_url_htmx(self, client, mock_scraper_service, auto_mock_csrf):
         """Test download route with invalid URL via HTMX."""
         test_url = "not-a-valid-url"
@@ -142,28 +201,26 @@ class TestJobsRoutes:
             Mock(file_type="thumbnail", file_path="thumb.jpg", size_bytes=50000),
         ]
 
-        mock_job_service.return_value.get_job.return_value = sample_job
-        mock_job_service.return_value.get_job_files.return_value = test_files
+        mock_job_service.return_value.get_job_with_files.return_value = (sample_job, test_files)
 
         response = client.get(f"/job/{sample_job.id}", headers={"HX-Request": "true"})
 
         assert response.status_code == 200
-        mock_job_service.return_value.get_job.assert_called_once_with(sample_job.id)
-        mock_job_service.return_value.get_job_files.assert_called_once_with(sample_job.id)
+        mock_job_service.return_value.get_job_with_files.assert_called_once_with(sample_job.id)
+        mock_job_service.return_value.get_job_files.assert_not_called()
 
     def test_job_detail_found_regular(self, client, mock_job_service, sample_job, auto_mock_csrf):
         """Test job detail page with regular request returns full page."""
-        mock_job_service.return_value.get_job.return_value = sample_job
-        mock_job_service.return_value.get_job_files.return_value = []
+        mock_job_service.return_value.get_job_with_files.return_value = (sample_job, [])
 
         response = client.get(f"/job/{sample_job.id}")
 
         assert response.status_code == 200
-        mock_job_service.return_value.get_job.assert_called_once_with(sample_job.id)
+        mock_job_service.return_value.get_job_with_files.assert_called_once_with(sample_job.id)
 
     def test_job_detail_not_found_htmx(self, client, mock_job_service, auto_mock_csrf):
         """Test job detail page with non-existent job via HTMX."""
-        mock_job_service.return_value.get_job.return_value = None
+        mock_job_service.return_value.get_job_with_files.return_value = None
 
         response = client.get("/job/nonexistent-job", headers={"HX-Request": "true"})
 
@@ -171,7 +228,7 @@ class TestJobsRoutes:
 
     def test_job_detail_not_found_regular(self, client, mock_job_service, auto_mock_csrf):
         """Test job detail page with non-existent job via regular request."""
-        mock_job_service.return_value.get_job.return_value = None
+        mock_job_service.return_value.get_job_with_files.return_value = None
 
         response = client.get("/job/nonexistent-job")
 
@@ -191,6 +248,91 @@ class TestJobsRoutes:
         assert response.status_code == 200
         mock_job_service.return_value.get_job.assert_called_once_with(sample_job.id)
 
+    def test_job_status_cached_between_polls(
+        self, client, mock_job_service, sample_job, auto_mock_csrf
+    ):
+        """Test repeated polls within the TTL reuse the cached job and files."""
+        mock_job_service.return_value.get_job.return_value = sample_job
+        mock_job_service.return_value.get_job_files.return_value = []
+
+        first = client.get(f"/job/{sample_job.id}/status")
+        second = client.get(f"/job/{sample_job.id}/status")
+
+        assert first.status_code == second.status_code == 200
+        assert first.headers["Cache-Control"] == "private, max-age=1"
+        mock_job_service.return_value.get_job.assert_called_once_with(sample_job.id)
+        mock_job_service.return_value.get_job_files.assert_called_once_with(sample_job.id)
+
+    def test_job_status_cache_invalidated_on_cancel(
+        self, client, mock_job_service, sample_job, auto_mock_csrf
+    ):
+        """Test cancelling a job drops its cached polling state."""
+        mock_job_service.return_value.get_job.return_value = sample_job
+        mock_job_service.return_value.get_job_files.return_value = []
+        mock_job_service.return_value.cancel_job.return_value = True
+
+        client.get(f"/job/{sample_job.id}/status")
+        client.post(f"/job/{sample_job.id}/cancel", headers={"HX-Request": "true"})
+        client.get(f"/job/{sample_job.id}/status")
+
+        assert mock_job_service.return_value.get_job_files.call_count == 2
+
+    def test_job_status_uses_preloaded_template(
+        self, app, client, mock_job_service, sample_job, auto_mock_csrf
+    ):
+        """Test the job card is rendered from the template loaded at registration."""
+        from jinja2 import Template
+
+        mock_job_service.return_value.get_job.return_value = sample_job
+        mock_job_service.return_value.get_job_files.return_value = []
+
+        with patch("collector.routes.jobs.render_template", return_value="") as mock_render:
+            client.get(f"/job/{sample_job.id}/status")
+
+        template = mock_render.call_args.args[0]
+        assert isinstance(template, Template)
+        assert template is app.extensions["job_card_template"]
+
+    def test_job_status_not_modified(self, client, mock_job_service, sample_job, auto_mock_csrf):
+        """Test a poll with the current ETag returns 304 without loading files."""
+        mock_job_service.return_value.get_job.return_value = sample_job
+        mock_job_service.return_value.get_job_files.return_value = []
+        etag = client.get(f"/job/{sample_job.id}/status").headers["ETag"]
+        mock_job_service.return_value.get_job_files.reset_mock()
+
+        response = client.get(f"/job/{sample_job.id}/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        mock_job_service.return_value.get_job_files.assert_not_called()
+
+    def test_job_status_sets_etag(self, client, mock_job_service, sample_job, auto_mock_csrf):
+        """Test a changed job returns the full partial with a fresh weak ETag."""
+        mock_job_service.return_value.get_job.return_value = sample_job
+        mock_job_service.return_value.get_job_files.return_value = []
+
+        response = client.get(
+            f"/job/{sample_job.id}/status", headers={"If-None-Match": 'W/"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith(f'W/"{sample_job.updated_at.isoformat()}-')
+
+    def test_job_status_etag_changes_with_csrf_token(
+        self, client, mock_job_service, sample_job, auto_mock_csrf
+    ):
+        """Test a new session CSRF token re-renders the card with its hidden token inputs."""
+        mock_job_service.return_value.get_job.return_value = sample_job
+        mock_job_service.return_value.get_job_files.return_value = []
+        etag = client.get(f"/job/{sample_job.id}/status").headers["ETag"]
+        with client.session_transaction() as sess:
+            sess["_csrf_token"] = "rotated-token"
+
+        response = client.get(f"/job/{sample_job.id}/status", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
     def test_job_status_not_found(self, client, mock_job_service, auto_mock_csrf):
         """Test job status endpoint with non-existent job."""
         mock_job_service.return_value.get_job.return_value = None
@@ -205,21 +347,21 @@ class TestJobsRoutes:
 
     def test_active_jobs_with_jobs(self, client, mock_job_service, sample_job, auto_mock_csrf):
         """Test active jobs endpoint with jobs."""
-        mock_job_service.return_value.get_active_jobs.return_value = [sample_job]
+        mock_job_service.return_value.get_active_jobs_with_files.return_value = [(sample_job, [])]
 
         response = client.get("/jobs/active")
 
         assert response.status_code == 200
-        mock_job_service.return_value.get_active_jobs.assert_called_once()
+        mock_job_service.return_value.get_active_jobs_with_files.assert_called_once()
 
     def test_active_jobs_empty(self, client, mock_job_service, auto_mock_csrf):
         """Test active jobs endpoint with no jobs."""
-        mock_job_service.return_value.get_active_jobs.return_value = []
+        mock_job_service.return_value.get_active_jobs_with_files.return_value = []
 
         response = client.get("/jobs/active")
 
         assert response.status_code == 200
-        mock_job_service.return_value.get_active_jobs.assert_called_once()
+        mock_job_service.return_value.get_active_jobs_with_files.assert_called_once()
 
     # ========================================================================
     # POST /job/<job_id>/cancel tests
@@ -274,6 +416,14 @@ class TestJobsRoutes:
 
         assert response.status_code == 403
 
+    def test_cancel_job_missing_csrf_htmx(self, client, mock_job_service):
+        """Test CSRF failure via HTMX returns a notification before the view runs."""
+        response = client.post("/job/job-123/cancel", headers={"HX-Request": "true"})
+
+        assert response.status_code == 403
+        assert b"CSRF validation failed" in response.data
+        mock_job_service.assert_not_called()
+
     # ========================================================================
     # POST /job/<job_id>/retry tests
     # ========================================================================
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from unittest.mock import patch
 
 
@@ -19,6 +20,17 @@ class TestPagesRoutes:
         assert response.status_code == 200
         # Just verify the page loads, template mocking is handled by conftest
 
+    def test_index_uses_preloaded_template(self, app, client):
+        """Test the dashboard is rendered from the template loaded at registration."""
+        from jinja2 import Template
+
+        with patch("collector.routes.pages.render_template", return_value="") as mock_render:
+            client.get("/")
+
+        template = mock_render.call_args.args[0]
+        assert isinstance(template, Template)
+        assert template is app.extensions["dashboard_template"]
+
     # ========================================================================
     # GET /browse tests
     # ========================================================================
@@ -37,6 +49,157 @@ class TestPagesRoutes:
         assert response.status_code == 200
         # Verify the route loads successfully (template content is mocked)
 
+    def test_browse_lists_folders_first(self, client, tmp_download_dir):
+        """Test browse lists folders before files with sizes and relative paths."""
+        subdir = tmp_download_dir / "youtube"
+        subdir.mkdir()
+        (subdir / "b.mp4").write_bytes(b"12345")
+        (subdir / "A.jpg").write_bytes(b"1")
+        (subdir / "zdir").mkdir()
+
+        with patch("collector.routes.pages.render_template", return_value="") as mock_render:
+            response = client.get("/browse/youtube")
+
+        assert response.status_code == 200
+        kwargs = mock_render.call_args.kwargs
+        assert kwargs["names"] == ["zdir", "A.jpg", "b.mp4"]
+        assert kwargs["is_dirs"] == [True, False, False]
+        assert kwargs["sizes"] == [None, 1, 5]
+        assert kwargs["rel_paths"] == ["youtube/zdir", "youtube/A.jpg", "youtube/b.mp4"]
+
+    def test_browse_only_filter(self, client, tmp_download_dir):
+        """Test only=dirs and only=files restrict the listing to one kind of entry."""
+        (tmp_download_dir / "folder").mkdir()
+        (tmp_download_dir / "clip.mp4").write_bytes(b"1")
+
+        with patch("collector.routes.pages.render_template", return_value="") as mock_render:
+            client.get("/browse?only=dirs")
+            dirs = mock_render.call_args.kwargs["names"]
+            client.get("/browse?only=files")
+            files = mock_render.call_args.kwargs["names"]
+            client.get("/browse?only=bogus")
+            both = mock_render.call_args.kwargs["names"]
+
+        assert dirs == ["folder"]
+        assert files == ["clip.mp4"]
+        assert both == ["folder", "clip.mp4"]
+
+    def test_resolved_paths_are_cached(self, client, tmp_download_dir):
+        """Test repeated requests for a path reuse the resolved result."""
+        (tmp_download_dir / "youtube").mkdir()
+
+        with patch(
+            "collector.routes.pages.resolve_user_path",
+            return_value=(tmp_download_dir / "youtube").resolve(),
+        ) as mock_resolve:
+            client.get("/browse/youtube")
+            client.get("/browse/youtube")
+
+        mock_resolve.assert_called_once()
+
+    def test_resolve_cache_expires(self, client, tmp_download_dir):
+        """Test cached resolutions expire after RESOLVE_CACHE_TTL."""
+        (tmp_download_dir / "youtube").mkdir()
+
+        with (
+            patch(
+                "collector.routes.pages.resolve_user_path",
+                return_value=(tmp_download_dir / "youtube").resolve(),
+            ) as mock_resolve,
+            patch("collector.routes.pages.RESOLVE_CACHE_TTL", 0.0),
+        ):
+            client.get("/browse/youtube")
+            client.get("/browse/youtube")
+
+        assert mock_resolve.call_count == 2
+
+    def test_browse_relative_paths_are_canonical(self, client, tmp_download_dir):
+        """Test entry paths are relative to the root even for non-canonical subpaths."""
+        (tmp_download_dir / "youtube" / "chan").mkdir(parents=True)
+
+        with patch("collector.routes.pages.render_template", return_value="") as mock_render:
+            client.get("/browse/youtube/./")
+
+        assert mock_render.call_args.kwargs["rel_paths"] == ["youtube/chan"]
+
+    def test_download_dir_is_memoized(self, app, client, tmp_path):
+        """Test the resolved download dir is reused until the config changes."""
+        client.get("/browse")
+        cached = app.extensions["download_dir"]
+        client.get("/browse")
+        assert app.extensions["download_dir"] is cached
+
+        other = tmp_path / "other"
+        other.mkdir()
+        app.config["SCRAPER_DOWNLOAD_DIR"] = str(other)
+        client.get("/browse")
+        assert app.extensions["download_dir"][1] == other.resolve()
+
+    def test_browse_not_modified(self, client, tmp_download_dir):
+        """Test an unchanged directory answers If-None-Match with 304."""
+        (tmp_download_dir / "a.mp4").write_bytes(b"1")
+
+        first = client.get("/browse")
+        etag = first.headers["ETag"]
+        assert first.headers["Cache-Control"] == "private, no-cache"
+
+        with patch("collector.routes.pages.render_template") as mock_render:
+            second = client.get("/browse", headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        mock_render.assert_not_called()
+
+    def test_browse_etag_changes_with_entries(self, client, tmp_download_dir):
+        """Test adding an entry changes the directory ETag."""
+        import os
+
+        etag = client.get("/browse").headers["ETag"]
+        (tmp_download_dir / "new.mp4").write_bytes(b"1")
+        st = tmp_download_dir.stat()
+        os.utime(tmp_download_dir, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        response = client.get("/browse", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_browse_etag_changes_when_file_grows(self, client, tmp_download_dir):
+        """Test a file growing in place changes the ETag though the directory mtime does not."""
+        target = tmp_download_dir / "partial.mp4"
+        target.write_bytes(b"1")
+        dir_stat = tmp_download_dir.stat()
+        etag = client.get("/browse").headers["ETag"]
+
+        with target.open("ab") as f:
+            f.write(b"2345")
+        os.utime(tmp_download_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        response = client.get("/browse", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_browse_etag_changes_with_csrf_token(self, client, tmp_download_dir):
+        """Test a new session CSRF token changes the ETag so the page is re-rendered."""
+        etag = client.get("/browse").headers["ETag"]
+        with client.session_transaction() as sess:
+            sess["_csrf_token"] = "rotated-token"
+
+        response = client.get("/browse", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_browse_pending_flash_skips_304(self, client, tmp_download_dir):
+        """Test a pending flash message forces a full render."""
+        etag = client.get("/browse").headers["ETag"]
+        with client.session_transaction() as sess:
+            sess["_flashes"] = [("error", "Path not found: x")]
+
+        response = client.get("/browse", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+
     def test_browse_subdirectory(self, client, tmp_download_dir):
         """Test browsing subdirectory."""
         subdir = tmp_download_dir / "youtube"
@@ -190,17 +353,123 @@ class TestPagesRoutes:
             response = client.get(f"/preview/{malicious_path}")
             assert response.status_code == 403, f"Should reject path: {malicious_path}"
 
-    def test_preview_file_read_error(self, client, tmp_download_dir):
-        """Test previewing file with read error."""
-        test_file = tmp_download_dir / "unreadable.txt"
-        test_file.write_text("content")
+    def test_preview_detects_file_types(self, client, tmp_download_dir):
+        """Test preview maps extensions to types case-insensitively."""
+        expected = {
+            "photo.JPG": "image",
+            "clip.webm": "video",
+            "song.m4a": "audio",
+            "info.json": "metadata",
+            "Video_Transcript.txt": "transcript",
+            "notes.TXT": "text",
+            "archive.zip": "unknown",
+            "noext": "unknown",
+        }
+        for name in expected:
+            (tmp_download_dir / name).write_text("x")
+
+        with patch("collector.routes.pages.render_template", return_value="") as mock_render:
+            for name, file_type in expected.items():
+                client.get(f"/preview/{name}")
+                assert mock_render.call_args.kwargs["file_type"] == file_type, name
+
+    def test_preview_file_path_is_relative(self, client, tmp_download_dir):
+        """Test the preview receives the file path relative to the downloads root."""
+        (tmp_download_dir / "youtube").mkdir()
+        (tmp_download_dir / "youtube" / "clip.mp4").write_bytes(b"1")
+
+        with patch("collector.routes.pages.render_template", return_value="") as mock_render:
+            client.get("/preview/youtube/clip.mp4")
+
+        assert mock_render.call_args.kwargs["file_path"] == "youtube/clip.mp4"
+
+    def test_preview_stats_file_once(self, client, tmp_download_dir):
+        """Test preview checks existence and type with a single stat call."""
+        import os
 
-        # Mock open to raise permission error
-        with patch("builtins.open", side_effect=PermissionError("Permission denied")):
-            response = client.get("/preview/unreadable.txt")
+        (tmp_download_dir / "clip.mp4").write_bytes(b"1")
 
-            assert response.status_code == 200
-            # Error is handled and returns 200 with error message in content
+        with patch("collector.routes.pages.os.stat", wraps=os.stat) as mock_stat:
+            response = client.get("/preview/clip.mp4")
+
+        assert response.status_code == 200
+        mock_stat.assert_called_once()
+
+    def test_preview_not_modified(self, client, tmp_download_dir):
+        """Test an unchanged file answers If-None-Match with 304 without reading it."""
+        (tmp_download_dir / "notes.txt").write_text("hello")
+        etag = client.get("/preview/notes.txt").headers["ETag"]
+
+        with patch("builtins.open") as mock_open:
+            response = client.get("/preview/notes.txt", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        mock_open.assert_not_called()
+
+    def test_preview_page_links_text_content(self, client, tmp_download_dir):
+        """Test text previews link to the content endpoint instead of embedding the file."""
+        from collector.routes.pages import MAX_PREVIEW_BYTES
+
+        (tmp_download_dir / "notes.txt").write_text("hello")
+
+        with (
+            patch("collector.routes.pages.render_template", return_value="") as mock_render,
+            patch("builtins.open", side_effect=PermissionError("Permission denied")),
+        ):
+            response = client.get("/preview/notes.txt")
+
+        assert response.status_code == 200
+        kwargs = mock_render.call_args.kwargs
+        assert kwargs["content_url"] == "/preview/content/notes.txt"
+        assert kwargs["file_size"] == 5
+        assert kwargs["preview_max_bytes"] == MAX_PREVIEW_BYTES
+
+    def test_preview_page_binary_has_no_content_url(self, client, tmp_download_dir):
+        """Test non-text previews do not link to the content endpoint."""
+        (tmp_download_dir / "clip.mp4").write_bytes(b"1")
+
+        with patch("collector.routes.pages.render_template", return_value="") as mock_render:
+            client.get("/preview/clip.mp4")
+
+        assert mock_render.call_args.kwargs["content_url"] is None
+
+    # ========================================================================
+    # GET /preview/content tests
+    # ========================================================================
+
+    def test_preview_content_serves_text(self, client, tmp_download_dir):
+        """Test the content endpoint serves the file as UTF-8 plain text."""
+        (tmp_download_dir / "meta.json").write_text('{"title": "<b>x</b>"}')
+
+        response = client.get("/preview/content/meta.json")
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/plain"
+        assert response.data == b'{"title": "<b>x</b>"}'
+
+    def test_preview_content_range(self, client, tmp_download_dir):
+        """Test the content endpoint honours Range requests."""
+        (tmp_download_dir / "big.txt").write_text("abcdefghij")
+
+        response = client.get("/preview/content/big.txt", headers={"Range": "bytes=0-3"})
+
+        assert response.status_code == 206
+        assert response.data == b"abcd"
+
+    def test_preview_content_rejects_non_text(self, client, tmp_download_dir):
+        """Test the content endpoint only serves text preview types."""
+        (tmp_download_dir / "clip.mp4").write_bytes(b"1")
+        (tmp_download_dir / "folder.txt").mkdir()
+
+        assert client.get("/preview/content/clip.mp4").status_code == 404
+        assert client.get("/preview/content/folder.txt").status_code == 404
+        assert client.get("/preview/content/missing.txt").status_code == 404
+
+    def test_preview_content_path_traversal(self, client):
+        """Test the content endpoint blocks path traversal."""
+        response = client.get("/preview/content/../../../etc/passwd.txt")
+
+        assert response.status_code == 403
 
     # ========================================================================
     # GET /history tests
@@ -217,6 +486,44 @@ class TestPagesRoutes:
             platform=None, status=None, limit=200
         )
 
+    def test_history_streams_template(self, client, mock_job_service_for_pages):
+        """Test history is rendered with stream_template."""
+        mock_job_service_for_pages.return_value.list_jobs.return_value = []
+
+        with patch("collector.routes.pages.stream_template", return_value="") as mock_stream:
+            client.get("/history?platform=youtube")
+
+        mock_stream.assert_called_once_with(
+            "history.html", jobs=[], filters={"platform": "youtube", "status": None}
+        )
+
+    def test_history_with_flash_renders_normally(self, client, mock_job_service_for_pages):
+        """Test pending flash messages switch history to a non-streamed render."""
+        mock_job_service_for_pages.return_value.list_jobs.return_value = []
+        with client.session_transaction() as sess:
+            sess["_flashes"] = [("success", "Job deleted")]
+
+        with (
+            patch("collector.routes.pages.stream_template") as mock_stream,
+            patch("collector.routes.pages.render_template", return_value="") as mock_render,
+        ):
+            client.get("/history")
+
+        mock_stream.assert_not_called()
+        mock_render.assert_called_once_with(
+            "history.html", jobs=[], filters={"platform": None, "status": None}
+        )
+
+    def test_history_reuses_job_service(self, client, mock_job_service_for_pages):
+        """Test the job service is created once and reused across requests."""
+        mock_job_service_for_pages.return_value.list_jobs.return_value = []
+
+        client.get("/history")
+        client.get("/history")
+
+        mock_job_service_for_pages.assert_called_once_with()
+        assert mock_job_service_for_pages.return_value.list_jobs.call_count == 2
+
     def test_history_with_platform_filter(self, client, mock_job_service_for_pages):
         """Test history page with platform filter."""
         mock_job_service_for_pages.return_value.list_jobs.return_value = []
@@ -249,3 +556,14 @@ class TestPagesRoutes:
         mock_job_service_for_pages.return_value.list_jobs.assert_called_once_with(
             platform="youtube", status="completed", limit=200
         )
+
+    def test_history_ignores_unknown_filters(self, client, mock_job_service_for_pages):
+        """Test unknown or empty filter values are dropped."""
+        mock_job_service_for_pages.return_value.list_jobs.return_value = []
+
+        response = client.get("/history?platform=myspace&status=")
+
+        assert response.status_code == 200
+        mock_job_service_for_pages.return_value.list_jobs.assert_called_once_with(
+            platform=None, status=None, limit=200
+        )
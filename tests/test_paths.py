@@ -0,0 +1,49 @@
+"""Tests for path-safety helpers."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from collector.security.paths import PathSecurityError, is_within_base, resolve_user_path
+
+
+class TestResolveUserPath:
+    """Test cases for resolving user paths under a base directory."""
+
+    def test_resolves_nested_path(self, tmp_path):
+        """Test a path below the base resolves to its absolute location."""
+        (tmp_path / "a").mkdir()
+
+        assert resolve_user_path(tmp_path, "a/./b.txt") == (tmp_path / "a" / "b.txt").resolve()
+
+    def test_rejects_traversal(self, tmp_path):
+        """Test parent traversal out of the base is rejected."""
+        with pytest.raises(PathSecurityError):
+            resolve_user_path(tmp_path / "base", "../outside")
+
+    def test_rejects_sibling_prefix(self, tmp_path):
+        """Test a sibling sharing the base name as a prefix is rejected."""
+        (tmp_path / "base").mkdir()
+        (tmp_path / "base-other").mkdir()
+
+        with pytest.raises(PathSecurityError):
+            resolve_user_path(tmp_path / "base", "../base-other/file")
+
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_rejects_symlink_escape(self, tmp_path):
+        """Test a symlink inside the base that points outside is rejected."""
+        base = tmp_path / "base"
+        base.mkdir()
+        (base / "link").symlink_to(tmp_path)
+
+        with pytest.raises(PathSecurityError):
+            resolve_user_path(base.resolve(), "link/secret", base_resolved=True)
+
+    def test_base_may_be_the_target(self, tmp_path):
+        """Test resolving to the base itself is allowed."""
+        base = tmp_path.resolve()
+
+        assert resolve_user_path(base, ".", base_resolved=True) == base
+        assert is_within_base(base, base)
@@ -0,0 +1,87 @@
+"""Tests for the adaptive scraper rate limiter."""
+
+import threading
+from unittest.mock import patch
+
+from collector.scrapers.rate_limiter import AdaptiveRateLimiter
+
+
+class TestAdaptiveRateLimiter:
+    """Test adaptive request pacing."""
+
+    def test_first_request_does_not_wait(self):
+        """Test a fresh limiter allows the first request immediately."""
+        assert AdaptiveRateLimiter(5.0, 10.0).next_delay() == 0.0
+
+    def test_success_decays_towards_min_delay(self):
+        """Test successful requests shorten the interval down to the minimum."""
+        limiter = AdaptiveRateLimiter(1.0, 10.0)
+
+        for _ in range(50):
+            limiter.on_success()
+
+        assert limiter._interval == 1.0
+        assert 0.0 < limiter.next_delay() <= 1.2
+
+    def test_rate_limit_doubles_interval_up_to_cap(self):
+        """Test rate-limit responses back off exponentially to the cap."""
+        limiter = AdaptiveRateLimiter(1.0, 2.0, max_backoff=10.0)
+
+        limiter.on_rate_limited()
+        assert limiter._interval == 4.0
+
+        for _ in range(5):
+            limiter.on_rate_limited()
+
+        assert limiter._interval == 10.0
+        assert limiter.consecutive_rate_limits == 6
+
+        limiter.on_success()
+        assert limiter.consecutive_rate_limits == 0
+
+    def test_acquire_sleeps_for_remaining_delay(self):
+        """Test acquire sleeps only when the next request is not yet allowed."""
+        limiter = AdaptiveRateLimiter(1.0, 1.0)
+
+        with patch("collector.scrapers.rate_limiter.time.sleep") as mock_sleep:
+            limiter.acquire()
+            mock_sleep.assert_not_called()
+
+            limiter.on_success()
+            limiter.acquire()
+
+        mock_sleep.assert_called_once()
+        assert 0.0 < mock_sleep.call_args.args[0] <= 1.2
+
+    def test_acquire_reserves_slots_for_concurrent_callers(self):
+        """Test back-to-back acquires queue behind each other by the minimum delay."""
+        limiter = AdaptiveRateLimiter(1.0, 5.0)
+
+        with patch("collector.scrapers.rate_limiter.time.sleep") as mock_sleep:
+            limiter.acquire()
+            limiter.acquire()
+            limiter.acquire()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert 0.9 < delays[0] <= 1.0
+        assert 1.9 < delays[1] <= 2.0
+
+    def test_concurrent_updates_are_not_lost(self):
+        """Test rate-limit responses recorded from many threads are all counted."""
+        limiter = AdaptiveRateLimiter(0.0, 0.0, max_backoff=1000.0)
+        barrier = threading.Barrier(8)
+
+        def record():
+            barrier.wait()
+            for _ in range(500):
+                limiter.on_rate_limited()
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter.consecutive_rate_limits == 4000
+        assert limiter._interval == 1000.0
@@ -0,0 +1,250 @@
+"""Tests for repository data access against a real SQLite database."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from collector.repositories.file_repository import FileRepository
+from collector.repositories.job_repository import JobRepository
+
+
+class TestBaseRepository:
+    """Test cases for shared BaseRepository helpers."""
+
+    def test_parallel_preserves_order(self, app):
+        """Test parallel() returns results in submission order."""
+        with app.app_context():
+            repo = JobRepository()
+            results = repo.parallel(
+                [lambda db, n=n: db.execute_query(f"SELECT {n} as n") for n in range(5)]
+            )
+
+        assert [rows[0]["n"] for rows in results] == [0, 1, 2, 3, 4]
+
+    def test_parallel_single_query(self, app):
+        """Test parallel() with a single query runs inline."""
+        with app.app_context():
+            repo = JobRepository()
+            results = repo.parallel([lambda db: db.execute_query("SELECT 1 as n")])
+
+        assert results == [[{"n": 1}]]
+
+
+class TestFileRepository:
+    """Test cases for FileRepository queries."""
+
+    def test_get_files_for_jobs_groups_by_job(self, app):
+        """Test bulk file lookup groups files under their job IDs."""
+        with app.app_context():
+            job_repo = JobRepository()
+            job_a = job_repo.create_job("https://example.com/a", "youtube")
+            job_b = job_repo.create_job("https://example.com/b", "youtube")
+            job_c = job_repo.create_job("https://example.com/c", "youtube")
+            file_repo = FileRepository()
+            file_repo.create_file(job_a.id, "a1.mp4", "video", 1)
+            file_repo.create_file(job_b.id, "b1.mp4", "video", 1)
+            file_repo.create_file(job_a.id, "a2.jpg", "image", 1)
+
+            files = file_repo.get_files_for_jobs([job_a.id, job_b.id, job_c.id])
+
+        assert [f.file_path for f in files[job_a.id]] == ["a1.mp4", "a2.jpg"]
+        assert [f.file_path for f in files[job_b.id]] == ["b1.mp4"]
+        assert job_c.id not in files
+
+    def test_get_files_for_jobs_empty(self, app):
+        """Test bulk file lookup with no job IDs skips the query."""
+        with app.app_context():
+            assert FileRepository().get_files_for_jobs([]) == {}
+
+
+class TestJobRepository:
+    """Test cases for JobRepository queries."""
+
+    def test_create_job_persists_id(self, app):
+        """Test a created job can be read back by its generated ID."""
+        with app.app_context():
+            job_repo = JobRepository()
+            job = job_repo.create_job("https://example.com", "youtube")
+
+            assert job_repo.get_by_id(job.id).url == "https://example.com"
+
+    def test_get_job_with_files(self, app):
+        """Test the joined lookup returns the job and its files in order."""
+        with app.app_context():
+            job_repo = JobRepository()
+            job = job_repo.create_job("https://example.com", "youtube", "Title")
+            other = job_repo.create_job("https://example.com/other", "youtube")
+            file_repo = FileRepository()
+            file_repo.create_file(job.id, "a.mp4", "video", 10, {"k": "v"})
+            file_repo.create_file(job.id, "b.jpg", "image", 5)
+            file_repo.create_file(other.id, "c.mp4", "video", 1)
+
+            result = job_repo.get_job_with_files(job.id)
+
+        assert result["job"].id == job.id
+        assert result["job"].title == "Title"
+        assert [f.file_path for f in result["files"]] == ["a.mp4", "b.jpg"]
+        assert result["files"][0].file_size == 10
+        assert result["files"][0].job_id == job.id
+
+    def test_get_job_with_files_no_files(self, app):
+        """Test the joined lookup returns an empty file list for a bare job."""
+        with app.app_context():
+            job_repo = JobRepository()
+            job = job_repo.create_job("https://example.com", "youtube")
+
+            result = job_repo.get_job_with_files(job.id)
+
+        assert result["job"].id == job.id
+        assert result["files"] == []
+
+    def test_get_job_with_files_missing(self, app):
+        """Test the joined lookup returns None for an unknown job."""
+        with app.app_context():
+            assert JobRepository().get_job_with_files("missing") is None
+
+    def test_list_jobs_filters_and_pages_newest_first(self, app):
+        """Test list_jobs filters in SQL and pages newest jobs first."""
+        with app.app_context():
+            job_repo = JobRepository()
+            for i, platform in enumerate(["youtube", "instagram", "youtube", "youtube"]):
+                job = job_repo.create_job(f"https://example.com/{i}", platform)
+                job_repo.execute_custom_update(
+                    "UPDATE jobs SET created_at = ? WHERE id = ?",
+                    (f"2024-01-0{i + 1}T00:00:00", job.id),
+                )
+            job_repo.update_job_status(job.id, "completed")
+
+            youtube = job_repo.list_jobs(platform="youtube")
+            page = job_repo.list_jobs(platform="youtube", limit=1, offset=1)
+            completed = job_repo.list_jobs(platform="youtube", status="completed")
+
+        assert [j.url for j in youtube] == [
+            "https://example.com/3",
+            "https://example.com/2",
+            "https://example.com/0",
+        ]
+        assert [j.url for j in page] == ["https://example.com/2"]
+        assert [j.url for j in completed] == ["https://example.com/3"]
+
+    def test_mark_stale_as_failed(self, app):
+        """Test only active jobs last updated before the cutoff are failed."""
+        with app.app_context():
+            job_repo = JobRepository()
+            stale = job_repo.create_job("https://example.com/stale", "youtube")
+            fresh = job_repo.create_job("https://example.com/fresh", "youtube")
+            done = job_repo.create_job("https://example.com/done", "youtube")
+            job_repo.complete_job(done.id)
+            job_repo.execute_custom_update(
+                "UPDATE jobs SET updated_at = '2020-01-01 00:00:00' WHERE id IN (?, ?)",
+                (stale.id, done.id),
+            )
+
+            count = job_repo.mark_stale_as_failed(
+                datetime.now(timezone.utc) - timedelta(minutes=30), "stale"
+            )
+
+            assert count == 1
+            assert job_repo.get_by_id(stale.id).status == "failed"
+            assert job_repo.get_by_id(stale.id).error_message == "stale"
+            assert job_repo.get_by_id(fresh.id).status == "pending"
+            assert job_repo.get_by_id(done.id).status == "completed"
+            assert [j.id for j in job_repo.get_active_jobs()] == [fresh.id]
+
+    def test_mark_stale_spares_queued_pending_jobs(self, app):
+        """Test pending jobs updated after pending_cutoff are not failed."""
+        with app.app_context():
+            job_repo = JobRepository()
+            queued = job_repo.create_job("https://example.com/queued", "youtube")
+            running = job_repo.create_job("https://example.com/running", "youtube")
+            job_repo.start_job(running.id)
+            job_repo.execute_custom_update(
+                "UPDATE jobs SET updated_at = '2020-06-01 00:00:00' WHERE id IN (?, ?)",
+                (queued.id, running.id),
+            )
+
+            count = job_repo.mark_stale_as_failed(
+                datetime.now(timezone.utc) - timedelta(minutes=30),
+                "stale",
+                pending_cutoff=datetime(2020, 1, 1, tzinfo=timezone.utc),
+            )
+
+            assert count == 1
+            assert job_repo.get_by_id(queued.id).status == "pending"
+            assert job_repo.get_by_id(running.id).status == "failed"
+
+    def test_start_job_only_from_pending(self, app):
+        """Test start_job refuses jobs that left the pending state."""
+        with app.app_context():
+            job_repo = JobRepository()
+            job = job_repo.create_job("https://example.com", "youtube")
+            cancelled = job_repo.create_job("https://example.com/c", "youtube")
+            job_repo.update_job_status(cancelled.id, "cancelled")
+
+            assert job_repo.start_job(job.id) is True
+            assert job_repo.start_job(job.id) is False
+            assert job_repo.start_job(cancelled.id) is False
+            assert job_repo.get_by_id(job.id).status == "running"
+
+    def test_update_fields(self, app):
+        """Test update_fields writes the given columns and bumps updated_at."""
+        with app.app_context():
+            job_repo = JobRepository()
+            job = job_repo.create_job("https://example.com", "youtube")
+            job_repo.execute_custom_update(
+                "UPDATE jobs SET updated_at = '2020-01-01 00:00:00' WHERE id = ?", (job.id,)
+            )
+
+            assert job_repo.update_fields(job.id, {"progress": 40, "current_operation": "x"})
+            updated = job_repo.get_by_id(job.id)
+
+        assert updated.progress == 40
+        assert updated.current_operation == "x"
+        assert updated.status == "pending"
+        assert updated.updated_at.year > 2020
+
+    def test_update_fields_missing_job(self, app):
+        """Test update_fields reports a missing job without raising."""
+        with app.app_context():
+            assert JobRepository().update_fields("missing", {"progress": 1}) is False
+
+    def test_update_fields_rejects_unknown_columns(self, app):
+        """Test update_fields refuses columns outside the updatable set."""
+        with app.app_context(), pytest.raises(ValueError):
+            JobRepository().update_fields("any", {"platform": "instagram"})
+
+
+class TestStatistics:
+    """Test cases for aggregate statistics queries."""
+
+    def test_file_statistics(self, app):
+        """Test file statistics combine the concurrent aggregates."""
+        with app.app_context():
+            job = JobRepository().create_job("https://example.com", "youtube")
+            file_repo = FileRepository()
+            file_repo.create_file(job.id, "a.mp4", "video", 100, {"k": "v"})
+            file_repo.create_file(job.id, "b.mp4", "video", 50)
+            file_repo.create_file(job.id, "c.jpg", "image", 10)
+
+            stats = file_repo.get_file_statistics()
+
+        assert stats["total_files"] == 3
+        assert stats["total_size"] == 160
+        assert stats["by_type"]["video"] == {"count": 2, "total_size": 150}
+        assert stats["files_with_metadata"] == 1
+
+    def test_job_statistics(self, app):
+        """Test job statistics combine the concurrent aggregates."""
+        with app.app_context():
+            job_repo = JobRepository()
+            job = job_repo.create_job("https://example.com/1", "youtube")
+            job_repo.create_job("https://example.com/2", "instagram")
+            FileRepository().create_file(job.id, "a.mp4", "video", 100)
+
+            stats = job_repo.get_job_statistics()
+
+        assert stats["total_jobs"] == 2
+        assert stats["status_pending"] == 2
+        assert stats["jobs_with_files"] == 1
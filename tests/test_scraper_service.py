@@ -1,5 +1,6 @@
 """Tests for ScraperService."""
 
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import ANY, Mock, patch
 
@@ -285,7 +286,7 @@ class TestScraperService:
 
         assert result["success"] is True
         assert result["title"] == "Test Video"
-        mock_repo.update_job_status.assert_called_once_with("job123", "running")
+        mock_repo.start_job.assert_called_once_with("job123")
         mock_youtube_class.assert_called_once()
         mock_scraper.scrape.assert_called_once_with("https://www.youtube.com/watch?v=123", "job123")
         mock_repo.update_job.assert_called_once()
@@ -321,7 +322,7 @@ class TestScraperService:
 
         assert result["success"] is True
         assert result["title"] == "Test Post"
-        mock_repo.update_job_status.assert_called_once_with("job123", "running")
+        mock_repo.start_job.assert_called_once_with("job123")
         mock_session_manager.load_session.assert_called_once_with("testuser")
         mock_session_manager.validate_session.assert_called_once_with(mock_session_data)
         mock_insta_class.assert_called_once_with(
@@ -329,12 +330,29 @@ class TestScraperService:
             download_dir=None,
             progress_callback=ANY,
             session_file=Path("/path/to/session.file"),
+            since=None,
         )
         mock_scraper.scrape.assert_called_once_with(
             "https://www.instagram.com/testuser/p/123", "job123"
         )
         mock_repo.update_job.assert_called_once()
 
+    @patch("collector.services.scraper_service.JobRepository")
+    @patch("collector.services.scraper_service.InstagramScraperClass")
+    def test_execute_download_passes_since(self, mock_insta_class, mock_repo_class):
+        """Test the post cutoff given with the job reaches the Instagram scraper."""
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.get_by_id.return_value = Mock(
+            url="https://www.instagram.com/testuser/", platform="instagram"
+        )
+        mock_insta_class.return_value.scrape.return_value = {"success": True}
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        ScraperService().execute_download("job123", since)
+
+        assert mock_insta_class.call_args.kwargs["since"] == since
+
     @patch("collector.services.scraper_service.JobRepository")
     def test_execute_download_job_not_found(self, mock_repo_class):
         """Test executing download when job is not found."""
@@ -349,6 +367,24 @@ class TestScraperService:
         assert result["error"] == "Job not found"
         mock_repo.get_by_id.assert_called_once_with("nonexistent")
 
+    @patch("collector.services.scraper_service.JobRepository")
+    @patch("collector.services.scraper_service.YouTubeScraperClass")
+    def test_execute_download_skips_job_no_longer_pending(
+        self, mock_youtube_class, mock_repo_class
+    ):
+        """Test a job cancelled or failed while queued is not scraped."""
+        mock_repo = Mock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.get_by_id.return_value = Mock(url="https://youtu.be/x", platform="youtube")
+        mock_repo.start_job.return_value = False
+
+        service = ScraperService()
+        result = service.execute_download("job123")
+
+        assert result["success"] is False
+        mock_youtube_class.assert_not_called()
+        mock_repo.update_job.assert_not_called()
+
     @patch("collector.services.scraper_service.JobRepository")
     @patch("collector.services.scraper_service.YouTubeScraperClass")
     def test_execute_download_scraper_failure(self, mock_youtube_class, mock_repo_class):
@@ -371,7 +407,7 @@ class TestScraperService:
 
         assert result["success"] is False
         assert result["error"] == "Scraping failed"
-        mock_repo.update_job_status.assert_called_once_with("job123", "running")
+        mock_repo.start_job.assert_called_once_with("job123")
         mock_repo.update_job.assert_called_once()
 
     @patch("collector.services.scraper_service.JobRepository")
@@ -394,5 +430,5 @@ class TestScraperService:
 
         assert result["success"] is False
         assert "Test exception" in result["error"]
-        mock_repo.update_job_status.assert_called_once_with("job123", "running")
+        mock_repo.start_job.assert_called_once_with("job123")
         mock_repo.update_job.assert_called_once()
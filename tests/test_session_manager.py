@@ -0,0 +1,154 @@
+"""Tests for SessionManager cookie parsing and session storage."""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from collector.services.session_manager import SESSION_MAX_AGE_SECONDS, SessionManager
+
+COOKIES_TXT = (
+    "# Netscape HTTP Cookie File\n"
+    "\n"
+    ".instagram.com\tTRUE\t/\tTRUE\t1999999999\tsessionid\tabc%3A123\r\n"
+    ".instagram.com\tTRUE\t/\tFALSE\t1999999999\tds_user_id\t42\n"
+    ".instagram.com\tTRUE\t/\tTRUE\t1999999999\tunrelated\tx\n"
+    ".example.com\tTRUE\t/\tTRUE\t1999999999\tsessionid\tother\n"
+    "#HttpOnly_.instagram.com\tTRUE\t/\tTRUE\t1999999999\tmid\tcommented\n"
+    ".instagram.com\tTRUE\t/\tTRUE\n"
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Provide a SessionManager storing sessions under a temporary directory."""
+    return SessionManager(config_dir=tmp_path, encryption_key="test-key")
+
+
+class TestLoadCookies:
+    """Test cases for cookies.txt parsing."""
+
+    def test_keeps_instagram_session_cookies(self, manager, tmp_path):
+        """Test only wanted Instagram cookies are kept, with fields decoded."""
+        cookies_file = tmp_path / "cookies.txt"
+        cookies_file.write_text(COOKIES_TXT)
+
+        result = manager.load_cookies_from_file(cookies_file)
+
+        assert result["cookies"] == [
+            {
+                "domain": ".instagram.com",
+                "path": "/",
+                "secure": True,
+                "expiration": "1999999999",
+                "name": "sessionid",
+                "value": "abc%3A123",
+            },
+            {
+                "domain": ".instagram.com",
+                "path": "/",
+                "secure": False,
+                "expiration": "1999999999",
+                "name": "ds_user_id",
+                "value": "42",
+            },
+        ]
+        assert result["source_file"] == str(cookies_file)
+
+    def test_load_from_text(self, manager):
+        """Test in-memory cookies.txt content parses like a file."""
+        result = manager.load_cookies_from_text(COOKIES_TXT, "upload.txt")
+
+        assert [c["name"] for c in result["cookies"]] == ["sessionid", "ds_user_id"]
+        assert result["source_file"] == "upload.txt"
+
+    def test_no_instagram_cookies_raises(self, manager, tmp_path):
+        """Test a file without Instagram session cookies is rejected."""
+        cookies_file = tmp_path / "cookies.txt"
+        cookies_file.write_text(".example.com\tTRUE\t/\tTRUE\t0\tsessionid\tx\n")
+
+        with pytest.raises(ValueError, match="No valid Instagram cookies"):
+            manager.load_cookies_from_file(cookies_file)
+
+
+class TestCipher:
+    """Test cases for session key handling."""
+
+    def test_cipher_shared_between_instances(self, tmp_path):
+        """Test managers built with the same key reuse one derived cipher."""
+        first = SessionManager(config_dir=tmp_path, encryption_key="shared-key")
+        second = SessionManager(config_dir=tmp_path, encryption_key="shared-key")
+
+        assert first.cipher is second.cipher
+
+    def test_no_key_has_no_cipher(self, tmp_path):
+        """Test a manager without a key cannot encrypt sessions."""
+        manager = SessionManager(config_dir=tmp_path)
+
+        assert manager.cipher is None
+        with pytest.raises(ValueError, match="No encryption key"):
+            manager.save_session("user", {})
+
+    def test_save_and_load_round_trip(self, manager):
+        """Test a saved session decrypts back to the original data."""
+        data = {"cookies": {"sessionid": "abc"}, "name": "caf\u00e9", "expires_at_epoch": 1.5}
+        session_file = manager.save_session("user", data)
+
+        assert manager.load_session("user") == data
+        assert manager.cipher.decrypt(session_file.read_bytes()).startswith(b'{"cookies":{')
+
+    def test_unsafe_username_characters_replaced(self, manager):
+        """Test characters unsafe in file names are replaced in the session path."""
+        session_file = manager.save_session('a/b:c*"d', {})
+
+        assert session_file.name == "a_b_c__d.session"
+        assert manager.delete_session('a/b:c*"d') is True
+
+
+class TestValidateSession:
+    """Test cases for session expiry checks."""
+
+    def test_saved_session_gets_expiry(self, manager):
+        """Test sessions saved without an expiry are valid for the max age."""
+        manager.save_session("user", {"cookies": {}})
+
+        loaded = manager.load_session("user")
+
+        assert loaded["expires_at_epoch"] > time.time() + SESSION_MAX_AGE_SECONDS - 60
+        assert manager.validate_session(loaded) is True
+
+    def test_expiry_epoch(self, manager):
+        """Test the recorded expiry decides validity."""
+        assert manager.validate_session({"expires_at_epoch": time.time() + 60}) is True
+        assert manager.validate_session({"expires_at_epoch": time.time() - 60}) is False
+
+    def test_falls_back_to_loaded_at(self, manager):
+        """Test sessions without an expiry are checked against loaded_at."""
+        now = datetime.now(timezone.utc)
+
+        assert manager.validate_session({"loaded_at": now.isoformat()}) is True
+        assert (
+            manager.validate_session({"loaded_at": (now - timedelta(days=8)).isoformat()}) is False
+        )
+        assert manager.validate_session({}) is False
+
+
+class TestListSessions:
+    """Test cases for listing saved sessions."""
+
+    def test_lists_newest_first(self, manager):
+        """Test sessions are listed by modification time, newest first."""
+        older = manager.save_session("older", {})
+        newer = manager.save_session("newer", {})
+        (manager.sessions_dir / "notes.txt").write_text("ignored")
+        os.utime(older, (1_000_000, 1_000_000))
+        os.utime(newer, (2_000_000, 2_000_000))
+
+        sessions = manager.list_sessions()
+
+        assert [s["username"] for s in sessions] == ["newer", "older"]
+        assert sessions[0]["file"] == str(newer)
+        assert sessions[0]["created_at"] == datetime.fromtimestamp(2_000_000).isoformat()
@@ -34,7 +34,7 @@ class TestSessionService:
         mock_manager_class.return_value = mock_manager
 
         mock_cookies_data = {"cookies": [{"name": "ds_user_id", "value": "12345"}]}
-        mock_manager.load_cookies_from_file.return_value = mock_cookies_data
+        mock_manager.load_cookies_from_text.return_value = mock_cookies_data
 
         mock_session_file = Mock()
         mock_manager.save_session.return_value = mock_session_file
@@ -46,6 +46,7 @@ class TestSessionService:
         assert result["username"] == "12345"
         assert result["session_file"] == str(mock_session_file)
         assert "uploaded successfully" in result["message"]
+        mock_manager.load_cookies_from_text.assert_called_once_with("cookie data", "cookies.txt")
 
     @patch("collector.services.session_service.SessionManager")
     def test_upload_session_invalid_format(self, mock_manager_class):
@@ -73,7 +74,7 @@ class TestSessionService:
         """Test session upload when cookies file is invalid."""
         mock_manager = Mock()
         mock_manager_class.return_value = mock_manager
-        mock_manager.load_cookies_from_file.side_effect = ValueError("Invalid cookies")
+        mock_manager.load_cookies_from_text.side_effect = ValueError("Invalid cookies")
 
         service = SessionService(session_manager=mock_manager)
         result = service.upload_session("invalid cookies", "cookies.txt")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from io import BytesIO
+from unittest.mock import patch
 
 
 class TestSessionsRoutes:
@@ -26,6 +27,37 @@ class TestSessionsRoutes:
         assert response.status_code == 200
         mock_session_service.return_value.list_sessions.assert_called_once()
 
+    def test_list_sessions_uses_preloaded_template(
+        self, app, client, mock_session_service, auto_mock_csrf
+    ):
+        """Test the sessions page is rendered from the template loaded at registration."""
+        from jinja2 import Template
+
+        mock_session_service.return_value.list_sessions.return_value = {
+            "success": True,
+            "sessions": [],
+        }
+
+        with patch("collector.routes.sessions.render_template", return_value="") as mock_render:
+            client.get("/sessions")
+
+        template = mock_render.call_args.args[0]
+        assert isinstance(template, Template)
+        assert template is app.extensions["sessions_template"]
+
+    def test_session_service_is_shared(self, client, mock_session_service, auto_mock_csrf):
+        """Test the session service is created once and reused across requests."""
+        mock_session_service.return_value.list_sessions.return_value = {
+            "success": True,
+            "sessions": [],
+        }
+
+        client.get("/sessions")
+        client.get("/sessions")
+
+        mock_session_service.assert_called_once_with()
+        assert mock_session_service.return_value.list_sessions.call_count == 2
+
     def test_list_sessions_empty(self, client, mock_session_service, auto_mock_csrf):
         """Test listing sessions when none exist."""
         mock_session_service.return_value.list_sessions.return_value = {
@@ -81,7 +113,9 @@ class TestSessionsRoutes:
 
         assert response.status_code == 200
         assert b"success" in response.data.lower() or b"uploaded" in response.data.lower()
-        mock_session_service.return_value.upload_session.assert_called_once()
+        mock_session_service.return_value.upload_session.assert_called_once_with(
+            cookies_content, "cookies.txt"
+        )
 
     def test_upload_session_success_regular(self, client, mock_session_service, auto_mock_csrf):
         """Test successful session upload via regular request."""
@@ -140,6 +174,54 @@ class TestSessionsRoutes:
         assert response.status_code == 400
         assert b".txt" in response.data.lower()
 
+    def test_upload_session_uppercase_extension(self, client, mock_session_service, auto_mock_csrf):
+        """Test upload accepts a .TXT extension regardless of case."""
+        mock_session_service.return_value.upload_session.return_value = {"success": True}
+        cookies_file = (BytesIO(b"cookie1=value1"), "COOKIES.TXT")
+
+        response = client.post(
+            "/sessions/upload",
+            data={"cookies_file": cookies_file},
+            headers={"HX-Request": "true"},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 200
+        mock_session_service.return_value.upload_session.assert_called_once_with(
+            "cookie1=value1", "COOKIES.TXT"
+        )
+
+    def test_upload_session_wrong_extension_regular(self, client, auto_mock_csrf):
+        """Test upload with wrong file extension flashes the error and redirects."""
+        wrong_file = (BytesIO(b"content"), "cookies.json")
+
+        response = client.post(
+            "/sessions/upload",
+            data={"cookies_file": wrong_file},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 302
+        with client.session_transaction() as sess:
+            assert sess["_flashes"] == [("error", "File must be .txt format (cookies.txt)")]
+
+    def test_upload_session_too_large_htmx(self, client, mock_session_service, auto_mock_csrf):
+        """Test upload larger than the cookies file limit is rejected with 413."""
+        from collector.routes.sessions import MAX_COOKIES_FILE_BYTES
+
+        big_file = (BytesIO(b"x" * (MAX_COOKIES_FILE_BYTES + 1)), "cookies.txt")
+
+        response = client.post(
+            "/sessions/upload",
+            data={"cookies_file": big_file},
+            headers={"HX-Request": "true"},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 413
+        assert b"too large" in response.data.lower()
+        mock_session_service.return_value.upload_session.assert_not_called()
+
     def test_upload_session_service_error_htmx(self, client, mock_session_service, auto_mock_csrf):
         """Test upload when service returns error via HTMX."""
         cookies_content = "cookie1=value1"
@@ -160,6 +242,44 @@ class TestSessionsRoutes:
         assert response.status_code == 400
         assert b"invalid cookies format" in response.data.lower()
 
+    def test_upload_session_error_is_escaped(self, client, mock_session_service, auto_mock_csrf):
+        """Test service error text is HTML-escaped in the HTMX notification."""
+        mock_session_service.return_value.upload_session.return_value = {
+            "success": False,
+            "error": "<script>alert(1)</script>",
+        }
+
+        response = client.post(
+            "/sessions/upload",
+            data={"cookies_file": (BytesIO(b"cookie1=value1"), "cookies.txt")},
+            headers={"HX-Request": "true"},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 400
+        assert b"<script>" not in response.data
+        assert b"&lt;script&gt;" in response.data
+
+    def test_upload_session_exception_detail_truncated(
+        self, client, mock_session_service, auto_mock_csrf
+    ):
+        """Test long exception text is truncated in the HTMX notification."""
+        from collector.routes.sessions import MAX_ERROR_DETAIL_CHARS
+
+        mock_session_service.return_value.upload_session.side_effect = Exception(
+            "x" * (MAX_ERROR_DETAIL_CHARS * 2)
+        )
+
+        response = client.post(
+            "/sessions/upload",
+            data={"cookies_file": (BytesIO(b"cookie1=value1"), "cookies.txt")},
+            headers={"HX-Request": "true"},
+            content_type="multipart/form-data",
+        )
+
+        assert response.status_code == 500
+        assert response.data.count(b"x") == MAX_ERROR_DETAIL_CHARS
+
     def test_upload_session_exception_htmx(self, client, mock_session_service, auto_mock_csrf):
         """Test upload when service raises exception via HTMX."""
         cookies_content = "cookie1=value1"
@@ -0,0 +1,270 @@
+"""Tests for SettingsRepository against a real SQLite database."""
+
+from __future__ import annotations
+
+import pytest
+
+from collector.repositories.settings_repository import UPSERT_BATCH_SIZE, SettingsRepository
+
+
+@pytest.fixture
+def settings_repo(app):
+    """Provide a SettingsRepository bound to the test application context."""
+    with app.app_context():
+        yield SettingsRepository()
+
+
+class TestBatchSetSettings:
+    """Test cases for batched settings writes."""
+
+    def test_inserts_and_updates(self, settings_repo):
+        """Test batch set inserts new keys and overwrites existing ones."""
+        settings_repo.batch_set_settings({"existing": "old"})
+
+        result = settings_repo.batch_set_settings({"existing": "new", "fresh": "value"})
+
+        assert [s.key for s in result] == ["existing", "fresh"]
+        assert settings_repo.get_all_settings() == {"existing": "new", "fresh": "value"}
+
+    def test_empty_dict(self, settings_repo):
+        """Test batch set with no settings is a no-op."""
+        assert settings_repo.batch_set_settings({}) == []
+        assert settings_repo.count_settings() == 0
+
+    def test_spans_multiple_chunks(self, settings_repo):
+        """Test batch set writes every row when the input exceeds one chunk."""
+        data = {f"key_{i:04d}": str(i) for i in range(UPSERT_BATCH_SIZE * 2 + 5)}
+
+        settings_repo.batch_set_settings(data)
+
+        assert settings_repo.count_settings() == len(data)
+        assert settings_repo.get_setting_value("key_0400") == "400"
+
+
+class TestImportSettings:
+    """Test cases for settings import."""
+
+    def test_import_without_overwrite_keeps_existing(self, settings_repo):
+        """Test import with overwrite=False skips keys that already exist."""
+        settings_repo.batch_set_settings({"kept": "original"})
+
+        result = settings_repo.import_settings(
+            {"kept": "replaced", "added": {"value": "x", "updated_at": None}}, overwrite=False
+        )
+
+        assert [s.key for s in result] == ["added"]
+        assert settings_repo.get_all_settings() == {"kept": "original", "added": "x"}
+
+    def test_import_with_overwrite(self, settings_repo):
+        """Test import with overwrite=True replaces existing values."""
+        settings_repo.batch_set_settings({"kept": "original"})
+
+        settings_repo.import_settings({"kept": 5})
+
+        assert settings_repo.get_setting_value("kept") == "5"
+
+    def test_import_without_overwrite_many_keys(self, settings_repo):
+        """Test existence checks span several IN queries for large imports."""
+        settings_repo.batch_set_settings({"key_0001": "kept", "key_1500": "kept"})
+        data = {f"key_{i:04d}": "new" for i in range(2000)}
+
+        result = settings_repo.import_settings(data, overwrite=False)
+
+        assert len(result) == 1998
+        assert settings_repo.get_setting_value("key_0001") == "kept"
+        assert settings_repo.get_setting_value("key_1500") == "kept"
+        assert settings_repo.get_setting_value("key_0002") == "new"
+
+
+class TestGetSettingsByPrefix:
+    """Test cases for prefix lookups."""
+
+    def test_matches_prefix_only(self, settings_repo):
+        """Test prefix lookup returns keys starting with the prefix in order."""
+        settings_repo.batch_set_settings(
+            {"youtube.b": "2", "youtube.a": "1", "youtubex": "3", "instagram.a": "4"}
+        )
+
+        assert settings_repo.get_settings_by_prefix("youtube.") == {
+            "youtube.a": "1",
+            "youtube.b": "2",
+        }
+
+    def test_wildcards_are_literal(self, settings_repo):
+        """Test LIKE wildcard characters in the prefix match literally."""
+        settings_repo.batch_set_settings({"a_b": "1", "axb": "2", "a%c": "3"})
+
+        assert settings_repo.get_settings_by_prefix("a_") == {"a_b": "1"}
+        assert settings_repo.get_settings_by_prefix("a%") == {"a%c": "3"}
+
+    def test_case_insensitive_prefix(self, settings_repo):
+        """Test case-insensitive prefix lookups match keys regardless of ASCII case."""
+        settings_repo.batch_set_settings({"YouTube.a": "1", "youtube.b": "2", "insta": "3"})
+
+        assert settings_repo.get_settings_by_prefix("youtube.") == {"youtube.b": "2"}
+        assert settings_repo.get_settings_by_prefix("YOUTUBE.", case_sensitive=False) == {
+            "YouTube.a": "1",
+            "youtube.b": "2",
+        }
+
+    def test_empty_prefix_returns_all(self, settings_repo):
+        """Test an empty prefix returns every setting."""
+        settings_repo.batch_set_settings({"a": "1", "b": "2"})
+
+        assert settings_repo.get_settings_by_prefix("") == {"a": "1", "b": "2"}
+
+
+class TestSettingsCache:
+    """Test cases for the in-process settings read cache."""
+
+    def _write_behind_cache(self, settings_repo, key, value):
+        """Change a value directly in the database, bypassing the repository."""
+        settings_repo._get_db_config().execute_update(
+            "UPDATE settings SET value = ? WHERE key = ?", (value, key)
+        )
+
+    def test_reads_are_cached(self, settings_repo):
+        """Test repeated reads are served from the cache."""
+        settings_repo.batch_set_settings({"theme": "dark"})
+        assert settings_repo.get_setting_value("theme") == "dark"
+
+        self._write_behind_cache(settings_repo, "theme", "light")
+
+        assert settings_repo.get_setting_value("theme") == "dark"
+        assert settings_repo.get_setting("theme", cache=False).value == "light"
+
+    def test_writes_invalidate_cache(self, settings_repo):
+        """Test repository writes clear cached values."""
+        settings_repo.batch_set_settings({"theme": "dark", "other": "x"})
+        assert settings_repo.get_setting_value("theme") == "dark"
+
+        self._write_behind_cache(settings_repo, "theme", "light")
+        settings_repo.batch_delete_settings(["other"])
+
+        assert settings_repo.get_setting_value("theme") == "light"
+
+    def test_missing_key_cached_until_write(self, settings_repo):
+        """Test a cached miss is replaced once the key is written."""
+        assert settings_repo.get_setting("missing") is None
+
+        settings_repo.batch_set_settings({"missing": "found"})
+
+        assert settings_repo.get_setting_value("missing") == "found"
+
+    def test_cached_instances_are_independent(self, settings_repo):
+        """Test mutating a returned setting does not alter the cached value."""
+        settings_repo.batch_set_settings({"theme": "dark"})
+        settings_repo.get_setting("theme").value = "mutated"
+
+        assert settings_repo.get_setting_value("theme") == "dark"
+
+
+class TestSetSetting:
+    """Test cases for single-setting writes."""
+
+    def test_set_setting_inserts_then_updates(self, settings_repo):
+        """Test set_setting creates a missing key and overwrites an existing one."""
+        created = settings_repo.set_setting("theme", "dark")
+        updated = settings_repo.set_setting("theme", "light")
+
+        assert created.value == "dark"
+        assert updated.value == "light"
+        assert settings_repo.get_all_settings() == {"theme": "light"}
+
+    def test_typed_setters(self, settings_repo):
+        """Test typed setters round-trip through the typed getters."""
+        settings_repo.set_setting_bool("flag", True)
+        settings_repo.set_setting_int("count", 3)
+        settings_repo.set_setting_float("ratio", 0.5)
+
+        assert settings_repo.get_setting_bool("flag") is True
+        assert settings_repo.get_setting_int("count") == 3
+        assert settings_repo.get_setting_float("ratio") == 0.5
+
+
+class TestExportSettings:
+    """Test cases for settings export."""
+
+    def test_export_values(self, settings_repo):
+        """Test plain export returns a key to value mapping."""
+        settings_repo.batch_set_settings({"a": "1", "b": "2"})
+
+        assert settings_repo.export_settings() == {"a": "1", "b": "2"}
+
+    def test_export_with_updated_at(self, settings_repo):
+        """Test export with timestamps includes ISO-8601 updated_at values."""
+        settings_repo.batch_set_settings({"a": "1"})
+        settings_repo._get_db_config().execute_update(
+            "INSERT INTO settings (key, value) VALUES ('b', '2')"
+        )
+
+        exported = settings_repo.export_settings(include_updated_at=True)
+
+        assert exported["a"]["value"] == "1"
+        assert exported["a"]["updated_at"].endswith("+00:00")
+        assert exported["b"]["updated_at"][10] == "T"
+
+    def test_export_keeps_stored_timestamps(self, settings_repo):
+        """Test exported timestamps keep their stored offset and microseconds."""
+        settings_repo._get_db_config().execute_update(
+            "INSERT INTO settings (key, value, updated_at) VALUES (?, ?, ?)",
+            ("a", "1", "2024-01-02T12:30:45.123456+02:00"),
+        )
+
+        exported = settings_repo.export_settings(include_updated_at=True)
+
+        assert exported["a"]["updated_at"] == "2024-01-02T12:30:45.123456+02:00"
+
+
+class TestBatchDeleteSettings:
+    """Test cases for batched settings deletes."""
+
+    def test_deletes_across_chunks(self, settings_repo):
+        """Test deletes spanning several chunks remove every key and count them."""
+        data = {f"key_{i:04d}": str(i) for i in range(25)}
+        settings_repo.batch_set_settings(data)
+
+        deleted = settings_repo.batch_delete_settings([*data, "missing"], chunk_size=10)
+
+        assert deleted == 25
+        assert settings_repo.count_settings() == 0
+
+    def test_more_keys_than_parameter_limit(self, settings_repo):
+        """Test deleting more keys than SQLite allows in one statement succeeds."""
+        settings_repo.batch_set_settings({"keep": "1", "drop": "2"})
+
+        deleted = settings_repo.batch_delete_settings(["drop"] + [f"x{i}" for i in range(1500)])
+
+        assert deleted == 1
+        assert settings_repo.get_all_settings() == {"keep": "1"}
+
+    def test_unchanged_value_keeps_row(self, settings_repo):
+        """Test writing the stored value again leaves the row and its timestamp alone."""
+        first = settings_repo.set_setting("theme", "dark")
+
+        same = settings_repo.set_setting("theme", "dark")
+
+        assert same.value == "dark"
+        assert same.updated_at == first.updated_at
+        assert settings_repo.get_setting("theme", cache=False).updated_at == first.updated_at
+
+    def test_write_not_dropped_by_stale_cache(self, settings_repo):
+        """Test a write matching a stale cached value still reaches the database."""
+        settings_repo.set_setting("theme", "dark")
+        assert settings_repo.get_setting_value("theme") == "dark"
+        settings_repo._get_db_config().execute_update(
+            "UPDATE settings SET value = 'light' WHERE key = 'theme'"
+        )
+
+        settings_repo.set_setting("theme", "dark")
+
+        assert settings_repo.get_setting("theme", cache=False).value == "dark"
+
+    def test_batch_unchanged_value_keeps_timestamp(self, settings_repo):
+        """Test batch upserts do not rewrite rows whose value is unchanged."""
+        settings_repo.batch_set_settings({"theme": "dark"})
+        before = settings_repo.get_setting("theme", cache=False).updated_at
+
+        settings_repo.batch_set_settings({"theme": "dark"})
+
+        assert settings_repo.get_setting("theme", cache=False).updated_at == before
@@ -1,5 +1,10 @@
 """Tests for YouTube scraper."""
 
+import json
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
 import pytest
 
 from collector.scrapers.youtube_scraper import YouTubeScraper
@@ -37,6 +42,7 @@ class TestYouTubeScraper:
         )
         assert scraper._is_playlist_or_channel("https://www.youtube.com/c/somechannel") is True
         assert scraper._is_playlist_or_channel("https://www.youtube.com/channel/UC_some_id") is True
+        assert scraper._is_playlist_or_channel("https://www.youtube.com/user/someuser") is True
 
     def test_sanitize_filename(self, scraper):
         """Test filename sanitization."""
@@ -45,6 +51,135 @@ class TestYouTubeScraper:
         assert scraper.sanitize_filename("") == "unnamed"
         assert scraper.sanitize_filename("  .test.  ") == "test"
 
+    def test_save_metadata_round_trip(self, scraper, tmp_path):
+        """Test metadata is written as UTF-8 JSON with non-JSON values stringified."""
+        path = tmp_path / "nested" / "metadata.json"
+
+        scraper.save_metadata("job-1", {"title": "café", "date": date(2024, 1, 2)}, path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "title": "café",
+            "date": "2024-01-02",
+        }
+
+    def test_save_metadata_encoders_match(self, scraper, tmp_path):
+        """Test the orjson and standard library paths write identical files."""
+        pytest.importorskip("orjson")
+        metadata = {
+            "title": 'café "live"',
+            "date": date(2024, 1, 2),
+            "fetched_at": datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+            "views": 1234,
+            "rating": 4.5,
+            "tags": ["a", "b"],
+            "formats": [{"id": 18, "note": None}],
+            1: "numeric key",
+        }
+        fast = tmp_path / "fast.json"
+        slow = tmp_path / "slow.json"
+
+        scraper.save_metadata("job-1", metadata, fast)
+        with patch("collector.scrapers.base_scraper.orjson", None):
+            scraper.save_metadata("job-1", metadata, slow)
+
+        assert fast.read_bytes() == slow.read_bytes()
+        assert json.loads(fast.read_text(encoding="utf-8"))["fetched_at"] == (
+            "2024-01-02 03:04:05.000006+00:00"
+        )
+
+        huge = {"id": 2**70}
+        scraper.save_metadata("job-1", huge, fast)
+        assert json.loads(fast.read_text(encoding="utf-8")) == huge
+
+    def test_scrape_single_video_records_files(self, scraper):
+        """Test a single video scrape records metadata, transcript and video sizes."""
+        video_dir = scraper.download_dir / "youtube" / "Uploader" / "Video"
+        video_dir.mkdir(parents=True)
+        (video_dir / "video.mp4").write_bytes(b"video")
+        (video_dir / "transcript.txt").write_bytes(b"text")
+        ydl = MagicMock()
+        ydl.__enter__.return_value.extract_info.return_value = {"id": "abc", "title": "Video"}
+        ydl.__enter__.return_value.process_ie_result.return_value = {"id": "abc", "title": "Video"}
+        ydl.__enter__.return_value.prepare_filename.return_value = str(video_dir / "video.mp4")
+
+        with (
+            patch("collector.scrapers.youtube_scraper.yt_dlp.YoutubeDL", return_value=ydl),
+            patch.object(scraper, "_fetch_transcript", return_value=video_dir / "transcript.txt"),
+            patch.object(scraper, "save_file_records") as mock_save,
+        ):
+            result = scraper._scrape_single_video("https://youtu.be/abc", "job-1")
+
+        assert result["success"]
+        assert result["title"] == "Video"
+        ydl.__enter__.return_value.extract_info.assert_called_once_with(
+            "https://youtu.be/abc", download=False, process=False
+        )
+        ydl.__enter__.return_value.process_ie_result.assert_called_once_with(
+            {"id": "abc", "title": "Video"}, download=True
+        )
+        base = Path("youtube/Uploader/Video")
+        metadata_size = (video_dir / "metadata.json").stat().st_size
+        assert result["files"] == [
+            {
+                "file_path": str(base / "metadata.json"),
+                "file_type": "metadata",
+                "file_size": metadata_size,
+            },
+            {"file_path": str(base / "transcript.txt"), "file_type": "transcript", "file_size": 4},
+            {"file_path": str(base / "video.mp4"), "file_type": "video", "file_size": 5},
+        ]
+        mock_save.assert_called_once()
+        records = mock_save.call_args.args[1]
+        assert [{k: r[k] for k in ("file_path", "file_type", "file_size")} for r in records] == (
+            result["files"]
+        )
+        assert records[0]["metadata"] == result["metadata"]
+
+    def test_iter_transcript_lines(self, scraper):
+        """Test transcript cues are yielded as MM:SS-prefixed lines."""
+        transcript = [
+            {"text": "intro", "start": 0.4, "duration": 1.0},
+            {"text": "later", "start": 3725.9},
+            {"start": 61},
+        ]
+
+        assert list(scraper._iter_transcript_lines(transcript)) == [
+            "[00:00] intro\n",
+            "[62:05] later\n",
+            "[01:01] \n",
+        ]
+
+    def test_fetch_transcript_streams_to_file(self, scraper, tmp_path):
+        """Test a fetched transcript is written line by line to transcript.txt."""
+        api = MagicMock()
+        api.return_value.fetch.return_value.to_raw_data.return_value = [
+            {"text": "hello", "start": 1.0},
+            {"text": "world", "start": 65.0},
+        ]
+
+        with patch("collector.scrapers.youtube_scraper.YouTubeTranscriptApi", api):
+            path = scraper._fetch_transcript("abc", tmp_path)
+
+        assert path == tmp_path / "transcript.txt"
+        assert path.read_text(encoding="utf-8") == "[00:01] hello\n[01:05] world\n"
+
+    def test_extract_metadata(self, scraper):
+        """Test metadata keeps known non-None fields and renames webpage_url."""
+        info = {
+            "id": "abc",
+            "title": "Video",
+            "description": None,
+            "webpage_url": "https://www.youtube.com/watch?v=abc",
+            "formats": [{"format_id": "18"}],
+        }
+
+        assert scraper._extract_metadata(info) == {
+            "platform": "youtube",
+            "id": "abc",
+            "title": "Video",
+            "url": "https://www.youtube.com/watch?v=abc",
+        }
+
 
 @pytest.mark.parametrize(
     "url,expected",